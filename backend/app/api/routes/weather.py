@@ -8,6 +8,7 @@ from app.models import WeatherAlertRequest, WeatherAlertResponse, Alert
 from app.models import Weather as WeatherEnum
 from src.engine.weather_predictor import WeatherPredictor
 from src.core.battery import Battery, BatteryState
+from src.data.models import BatterySpec
 from app.logging_config import logger
 
 router = APIRouter()
@@ -48,13 +49,15 @@ async def get_weather_alerts(request: WeatherAlertRequest):
             tomorrow_weather = core_weather_map.get(request.tomorrow_weather)
         
         # Create battery state
-        battery = Battery(13.5, initial_soc=request.battery_soc)
+        spec = BatterySpec(**request.battery.model_dump()) if request.battery else BatterySpec()
+        battery = Battery(initial_soc=request.battery_soc, spec=spec)
         
         # Get alerts
         predictor = WeatherPredictor(
             tomorrow_weather=tomorrow_weather,
             battery_state=battery.state,
-            current_hour=request.current_hour
+            current_hour=request.current_hour,
+            min_soc=spec.min_soc
         )
         
         core_alerts = predictor.generate_alerts()
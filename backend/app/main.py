@@ -10,19 +10,32 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
 from app.api.routes import simulation, optimization, weather, impact
+from app.services.warmup import WarmupService
 from app.logging_config import logger
+from src.data.environment_cache import default_environment_cache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan events."""
+    """Application lifespan events.
+    
+    Model loading and warm-up run in a background thread so the server
+    starts answering /health immediately; /ready turns green once done.
+    """
     logger.info("🚀 IntelliGrid API starting up...")
+    warmup = asyncio.create_task(asyncio.to_thread(WarmupService.run))
     yield
+    if not warmup.done():
+        logger.info("⏳ Waiting for warm-up to finish before shutdown...")
+        await warmup
     logger.info("👋 IntelliGrid API shutting down...")
 
 
@@ -66,7 +79,8 @@ async def root():
             "optimize": "/api/v1/optimize",
             "compare": "/api/v1/compare",
             "weather_alerts": "/api/v1/weather/alerts",
-            "impact": "/api/v1/impact"
+            "impact": "/api/v1/impact",
+            "ready": "/ready"
         }
     }
 
@@ -75,3 +89,12 @@ async def root():
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "IntelliGrid API"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness endpoint: 503 until models are loaded and warmed up."""
+    status = {**WarmupService.status(), 'environment_cache': default_environment_cache().stats()}
+    if not status['ready']:
+        return JSONResponse(status_code=503, content={"status": "warming_up", **status})
+    return {"status": "ready", **status}
@@ -1,10 +1,14 @@
 """
 Pydantic models for API requests and responses.
 """
-from typing import List, Optional
-from pydantic import BaseModel, Field
+import datetime
+import math
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, model_validator
 from enum import Enum
 
+from src.data.models import BatterySpec
+
 
 class Season(str, Enum):
     SUMMER = "summer"
@@ -28,14 +32,56 @@ class OptimizationMode(str, Enum):
     MILP = "milp"
 
 
+# Core defaults, so API and simulation agree on the reference battery
+DEFAULT_BATTERY = BatterySpec()
+
+
+class BatteryConfig(BaseModel):
+    """Battery parameters (defaults: the core BatterySpec reference battery)."""
+    capacity_kwh: float = Field(default=DEFAULT_BATTERY.capacity_kwh, gt=0, le=1000, description="Capacity in kWh")
+    charge_efficiency: float = Field(default=DEFAULT_BATTERY.charge_efficiency, gt=0, le=1, description="Charging efficiency")
+    discharge_efficiency: float = Field(default=DEFAULT_BATTERY.discharge_efficiency, gt=0, le=1, description="Discharging efficiency")
+    min_soc: float = Field(default=DEFAULT_BATTERY.min_soc, ge=0, lt=1, description="Minimum state of charge")
+    max_soc: float = Field(default=DEFAULT_BATTERY.max_soc, gt=0, le=1, description="Maximum state of charge")
+    max_charge_rate_kw: float = Field(default=DEFAULT_BATTERY.max_charge_rate_kw, ge=0, description="Maximum charge power in kW")
+    max_discharge_rate_kw: float = Field(default=DEFAULT_BATTERY.max_discharge_rate_kw, ge=0, description="Maximum discharge power in kW")
+
+    @model_validator(mode="after")
+    def check_soc_bounds(self) -> "BatteryConfig":
+        if self.min_soc >= self.max_soc:
+            raise ValueError("min_soc must be below max_soc")
+        return self
+
+
 class SimulationConfig(BaseModel):
     """Configuration for energy simulation."""
     season: Season = Field(default=Season.SUMMER, description="Season for simulation")
     weather: Weather = Field(default=Weather.SUNNY, description="Current weather")
     day_type: DayType = Field(default=DayType.WEEKDAY, description="Type of day")
     tomorrow_weather: Optional[Weather] = Field(default=None, description="Tomorrow's forecast")
+    weather_path: Optional[List[Weather]] = Field(
+        default=None,
+        description="Weather of each simulated day (overrides weather); must cover the horizon"
+    )
     seed: Optional[int] = Field(default=42, description="Random seed for reproducibility")
     mode: OptimizationMode = Field(default=OptimizationMode.RULE, description="Optimization mode")
+    hours: int = Field(default=24, ge=1, le=8784, description="Simulation horizon in hours (up to a leap year)")
+    start_date: Optional[datetime.date] = Field(
+        default=None,
+        description="First simulated day; derives each day's season and day type from the calendar"
+    )
+    timestep_minutes: Literal[60, 30, 15, 10, 5] = Field(
+        default=60,
+        description="Timestep length in minutes; energies and costs are per timestep"
+    )
+    battery: Optional[BatteryConfig] = Field(default=None, description="Battery parameters (default battery if omitted)")
+
+    @model_validator(mode="after")
+    def check_weather_path_length(self) -> "SimulationConfig":
+        days = math.ceil(self.hours / 24)
+        if self.weather_path is not None and len(self.weather_path) < days:
+            raise ValueError(f"weather_path covers {len(self.weather_path)} days, the horizon needs {days}")
+        return self
 
 
 class HourlyData(BaseModel):
@@ -80,6 +126,7 @@ class WeatherAlertRequest(BaseModel):
     tomorrow_weather: Optional[Weather] = Field(default=None)
     battery_soc: float = Field(..., ge=0.0, le=1.0, description="Current battery SOC")
     current_hour: int = Field(default=20, ge=0, le=23, description="Current hour")
+    battery: Optional[BatteryConfig] = Field(default=None, description="Battery parameters (default battery if omitted)")
 
 
 class WeatherAlertResponse(BaseModel):
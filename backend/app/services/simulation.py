@@ -11,6 +11,7 @@ from app.models import (
 # Import existing core modules
 from src.core.hybrid_adapter import HybridSimulationAdapter
 from src.data.models import (
+    BatterySpec,
     SimulationConfig as CoreSimulationConfig,
     Season as CoreSeason,
     Weather as CoreWeather,
@@ -49,7 +50,12 @@ class SimulationService:
             season=season_map[config.season],
             weather=weather_map[config.weather],
             day_type=day_type_map[config.day_type],
-            tomorrow_weather=tomorrow
+            tomorrow_weather=tomorrow,
+            weather_path=tuple(weather_map[w] for w in config.weather_path) if config.weather_path else None,
+            hours=config.hours,
+            start_date=config.start_date,
+            dt_hours=config.timestep_minutes / 60,
+            battery=BatterySpec(**config.battery.model_dump()) if config.battery else BatterySpec()
         )
     
     @staticmethod
@@ -0,0 +1,102 @@
+"""
+Warm-up service - loads AI models and primes the solvers before traffic.
+
+Runs once in the background from the application lifespan. Until it
+finishes, /ready reports not-ready so load balancers hold traffic.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.logging_config import logger
+
+from src.ai.model_manager import ModelManager
+from src.core.battery import Battery
+from src.data.models import (
+    SimulationConfig as CoreSimulationConfig,
+    Season as CoreSeason,
+    Weather as CoreWeather,
+    DayType as CoreDayType
+)
+from src.data.simulator import EnergyDataSimulator
+from src.engine.milp_engine import MILPDecisionEngine
+
+
+class WarmupService:
+    """Model loading, warm-up inference and warm-up MILP solve."""
+
+    _done = threading.Event()
+    _lock = threading.Lock()
+    _timings: Dict[str, float] = {}
+    _error: Optional[str] = None
+
+    @classmethod
+    def run(cls) -> Dict[str, float]:
+        """Run the warm-up once and record timings (in seconds).
+
+        A failed warm-up is logged and recorded, and the service still
+        becomes ready: requests fall back exactly as they would without it.
+
+        Returns:
+            Dictionary of step timings
+        """
+        with cls._lock:
+            if cls._done.is_set():
+                return dict(cls._timings)
+
+            timings: Dict[str, float] = {}
+            start = time.perf_counter()
+            try:
+                step = time.perf_counter()
+                ModelManager()
+                timings['model_load'] = time.perf_counter() - step
+
+                step = time.perf_counter()
+                config = CoreSimulationConfig(
+                    season=CoreSeason.SUMMER,
+                    weather=CoreWeather.SUNNY,
+                    day_type=CoreDayType.WEEKDAY
+                )
+                environments = EnergyDataSimulator(config, seed=42).generate_24h_environment()
+                timings['inference'] = time.perf_counter() - step
+
+                step = time.perf_counter()
+                MILPDecisionEngine().optimize_schedule(
+                    environments, Battery(initial_soc=0.5).state
+                )
+                timings['milp_solve'] = time.perf_counter() - step
+            except Exception as e:
+                cls._error = str(e)
+                logger.error(f"Warm-up failed: {e}")
+
+            timings['total'] = time.perf_counter() - start
+            cls._timings = timings
+            cls._done.set()
+
+            logger.info(
+                "🔥 Warm-up complete: "
+                + ", ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items())
+            )
+            return dict(timings)
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """Whether the warm-up has finished."""
+        return cls._done.is_set()
+
+    @classmethod
+    def status(cls) -> Dict[str, Any]:
+        """Readiness and recorded warm-up timings."""
+        return {
+            'ready': cls.is_ready(),
+            'timings': dict(cls._timings),
+            'error': cls._error
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget a previous warm-up (mainly for testing)."""
+        with cls._lock:
+            cls._done.clear()
+            cls._timings = {}
+            cls._error = None
@@ -0,0 +1,58 @@
+"""
+Benchmark fleet battery steps against per-battery Battery objects.
+
+Steps N home batteries through one day of random charge and discharge
+requests with scalar Battery objects and with one BatteryFleet, and
+checks that both end in the same state.
+
+Run from backend/ directory:
+    python -m scripts.benchmark_battery_fleet
+    python -m scripts.benchmark_battery_fleet --batteries 100 1000 10000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.core.battery import Battery
+from src.core.battery_fleet import BatteryFleet
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BatteryFleet against scalar batteries")
+    parser.add_argument("--batteries", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--steps", type=int, default=24)
+    args = parser.parse_args()
+
+    print(f"{'batteries':>10} {'scalar ms':>10} {'fleet ms':>9} {'speedup':>8} {'equal':>6}")
+    for n in args.batteries:
+        rng = np.random.default_rng(0)
+        charge = rng.uniform(0, 6, (args.steps, n))
+        discharge = rng.uniform(0, 6, (args.steps, n))
+
+        batteries = [Battery(13.5, initial_soc=0.5) for _ in range(n)]
+        start = time.perf_counter()
+        for t in range(args.steps):
+            for battery, c, d in zip(batteries, charge[t].tolist(), discharge[t].tolist()):
+                battery.charge(c)
+                battery.discharge(d)
+        scalar_ms = (time.perf_counter() - start) * 1000
+
+        fleet = BatteryFleet(np.full(n, 13.5))
+        start = time.perf_counter()
+        for t in range(args.steps):
+            fleet.step(charge[t], discharge[t])
+        fleet_ms = (time.perf_counter() - start) * 1000
+
+        equal = np.array_equal(fleet.charge_kwh, [b.charge_kwh for b in batteries])
+        print(f"{n:>10} {scalar_ms:>10.2f} {fleet_ms:>9.2f} {scalar_ms / fleet_ms:>7.1f}x {str(equal):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark batched plan execution against one plan at a time.
+
+Executes N random action schedules over one simulated day with
+execute_plan (one Battery per plan) and with one execute_plans call on a
+BatteryFleet, and checks that both give the same costs.
+
+Run from backend/ directory:
+    python -m scripts.benchmark_plan_executor
+    python -m scripts.benchmark_plan_executor --plans 100 1000 10000 --timestep 15
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.core.battery import Battery
+from src.core.battery_fleet import BatteryFleet
+from src.core.plan_executor import execute_plan, execute_plans
+from src.data.models import ACTIONS, SimulationConfig, Season, Weather, DayType
+from src.data.simulator import EnergyDataSimulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark execute_plans against execute_plan")
+    parser.add_argument("--plans", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--timestep", type=int, default=60, help="Timestep in minutes")
+    args = parser.parse_args()
+
+    config = SimulationConfig(
+        season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY,
+        dt_hours=args.timestep / 60
+    )
+    day = EnergyDataSimulator(config, seed=42, use_ai=False).generate_environment_arrays()
+
+    print(f"{'plans':>8} {'single ms':>10} {'batched ms':>11} {'speedup':>8} {'equal':>6}")
+    for n in args.plans:
+        plans = np.random.default_rng(0).integers(0, len(ACTIONS), (n, len(day)))
+
+        start = time.perf_counter()
+        single = [execute_plan(day, plan, Battery(13.5)).cost for plan in plans]
+        single_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        batched = execute_plans(day, plans, BatteryFleet(np.full(n, 13.5))).cost
+        batched_ms = (time.perf_counter() - start) * 1000
+
+        equal = np.array_equal(batched, single)
+        print(f"{n:>8} {single_ms:>10.2f} {batched_ms:>11.2f} {single_ms / batched_ms:>7.1f}x {str(equal):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark year-long studies from representative days against the full year.
+
+Generates a year with calendar seasons and Markov-chain weather, selects
+k representative days for several k, and compares estimated yearly
+totals and runtime with one full-year run.
+
+Run from backend/ directory:
+    python -m scripts.benchmark_representative_days
+    python -m scripts.benchmark_representative_days --mode milp --k 6 12 24
+"""
+import argparse
+import datetime
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.analysis.representative_days import select_representative_days
+from src.data.models import SimulationConfig, Season, Weather, DayType
+from src.data.simulator import EnergyDataSimulator
+from src.data.weather_chain import WeatherMarkovChain, to_weather
+from src.utils.config import get_season_for_month
+
+REPORTED = ('cost', 'savings', 'grid_import', 'grid_export')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark representative-day yearly estimates")
+    parser.add_argument("--mode", choices=("rule", "milp"), default="rule")
+    parser.add_argument("--k", type=int, nargs="+", default=[6, 12, 24])
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    start_date = datetime.date(args.year, 1, 1)
+    n_days = (datetime.date(args.year + 1, 1, 1) - start_date).days
+    seasons = [get_season_for_month((start_date + datetime.timedelta(days=d)).month) for d in range(n_days)]
+    weather = WeatherMarkovChain().sample(1, n_days, seasons, seed=args.seed)
+    config = SimulationConfig(
+        season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY,
+        hours=24 * n_days, start_date=start_date, weather_path=tuple(to_weather(weather)[0])
+    )
+    arrays = EnergyDataSimulator(config, seed=args.seed, use_ai=False).generate_environment_arrays()
+
+    start = time.perf_counter()
+    full = select_representative_days(arrays, k=1).evaluate(args.mode, full=True).full_totals
+    full_s = time.perf_counter() - start
+    print(f"📊 Full year ({n_days} days, {args.mode}): {full_s:.2f} s, "
+          + ", ".join(f"{name} {full[name]:,.0f}" for name in REPORTED))
+
+    print(f"{'k':>4} {'seconds':>8} {'speedup':>8} " + " ".join(f"{name + ' err':>16}" for name in REPORTED)
+          + f" {'proxy err':>10}")
+    for k in args.k:
+        start = time.perf_counter()
+        selection = select_representative_days(arrays, k=k)
+        estimate = selection.evaluate(args.mode)
+        elapsed = time.perf_counter() - start
+        errors = {name: (estimate.totals[name] - full[name]) / abs(full[name]) for name in REPORTED}
+        proxy = max(abs(e) for e in estimate.proxy_errors.values())
+        print(f"{k:>4} {elapsed:>8.2f} {full_s / elapsed:>7.1f}x "
+              + " ".join(f"{errors[name]:>+15.2%} " for name in REPORTED) + f"{proxy:>10.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark simulation latency at hourly, 15-minute and 5-minute timesteps.
+
+Times environment generation, the rule-based runner and the MILP solve of
+one day at each resolution, plus environment generation for a full year,
+to show how latency scales with the number of timesteps.
+
+Run from backend/ directory:
+    python -m scripts.benchmark_timestep
+    python -m scripts.benchmark_timestep --repeats 5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.data.models import SimulationConfig, Season, Weather, DayType
+from src.data.simulator import EnergyDataSimulator
+from src.core.hybrid_adapter import HybridSimulationAdapter
+
+TIMESTEP_MINUTES = (60, 15, 5)
+
+
+def best_of(fn, repeats: int) -> float:
+    """Fastest of several runs, in milliseconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def make_config(minutes: int, hours: int = 24) -> SimulationConfig:
+    """Sunny summer weekday config at the given resolution."""
+    return SimulationConfig(
+        season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY,
+        hours=hours, dt_hours=minutes / 60
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark latency by timestep length")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'step':>6} {'steps/day':>10} {'env ms':>9} {'rule ms':>9} "
+          f"{'milp ms':>9} {'year env ms':>12}")
+
+    for minutes in TIMESTEP_MINUTES:
+        config = make_config(minutes)
+        env_ms = best_of(
+            lambda: EnergyDataSimulator(config, seed=42).generate_environment_arrays(),
+            args.repeats
+        )
+        rule_ms = best_of(
+            lambda: HybridSimulationAdapter(config, seed=42, mode='rule').generate_24h_data(),
+            args.repeats
+        )
+        milp_ms = best_of(
+            lambda: HybridSimulationAdapter(config, seed=42, mode='milp').generate_24h_data(),
+            args.repeats
+        )
+        year = make_config(minutes, hours=8760)
+        year_ms = best_of(
+            lambda: EnergyDataSimulator(year, seed=42).generate_environment_arrays(),
+            args.repeats
+        )
+
+        print(f"{minutes:>4}mn {24 * 60 // minutes:>10} {env_ms:>9.2f} {rule_ms:>9.2f} "
+              f"{milp_ms:>9.2f} {year_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
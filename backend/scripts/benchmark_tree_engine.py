@@ -0,0 +1,103 @@
+"""
+Benchmark the flattened tree engine against sklearn inference.
+
+Loads the solar model and times model.predict (pandas DataFrame input)
+against FlatTreeEnsemble.predict at several batch sizes. Without a model
+artifact (models/*.pkl is not committed), synthetic RandomForest and
+GradientBoosting models are fitted on the solar feature layout instead.
+
+Run from backend/ directory:
+    python -m scripts.benchmark_tree_engine
+    python -m scripts.benchmark_tree_engine --model /path/to/solar_pv_model.pkl
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.ai.solar_predictor import SolarPredictor, FEATURES
+from src.ai.tree_engine import flatten_model
+
+
+def best_of(fn, repeats: int) -> float:
+    """Fastest of several runs, in milliseconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def random_features(rng, n_rows: int) -> np.ndarray:
+    """Rows in the solar feature layout (Hour, Day, Month, G(i), T2m)."""
+    return np.column_stack([
+        rng.integers(0, 24, n_rows), rng.integers(1, 29, n_rows), rng.integers(1, 13, n_rows),
+        rng.uniform(0, 1000, n_rows), rng.uniform(0, 35, n_rows)
+    ])
+
+
+def synthetic_models():
+    """RandomForest and GradientBoosting models fitted on synthetic solar data."""
+    from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+
+    rng = np.random.default_rng(1)
+    frame = pd.DataFrame(random_features(rng, 5000), columns=FEATURES)
+    daylight = np.clip(np.sin(np.pi * (frame['Hour'] - 6) / 12), 0, None)
+    target = frame['G(i)'] * daylight * (1 - 0.004 * (frame['T2m'] - 25)) * 0.005
+
+    return [
+        RandomForestRegressor(n_estimators=100, max_depth=12, random_state=0).fit(frame, target),
+        GradientBoostingRegressor(n_estimators=200, max_depth=5, random_state=0).fit(frame, target),
+    ]
+
+
+def benchmark(model, engine, repeats: int):
+    """Print sklearn vs flattened timings for one model."""
+    print(f"🌳 {type(model).__name__}: {engine.n_trees} trees, max depth {engine.max_depth}")
+    print(f"{'rows':>8} {'sklearn ms':>12} {'flat ms':>10} {'speedup':>9} {'max diff':>10}")
+
+    rng = np.random.default_rng(0)
+    for n_rows in (1, 24, 8760):
+        X = random_features(rng, n_rows)
+        frame = pd.DataFrame(X, columns=FEATURES)
+
+        sklearn_ms = best_of(lambda: model.predict(frame), repeats)
+        flat_ms = best_of(lambda: engine.predict(X), repeats)
+        diff = np.abs(model.predict(frame) - engine.predict(X)).max()
+
+        print(f"{n_rows:>8} {sklearn_ms:>12.3f} {flat_ms:>10.3f} {sklearn_ms / flat_ms:>8.1f}x {diff:>10.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark flattened tree inference")
+    parser.add_argument("--model", type=Path, default=None,
+                        help="Solar .pkl model (default: models/solar_pv_model.pkl)")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    model_path = args.model if args.model is not None else SolarPredictor.default_model_path()
+    if not model_path.exists():
+        print(f"⚠️  No model at {model_path}, benchmarking synthetic models")
+        for model in synthetic_models():
+            benchmark(model, flatten_model(model, FEATURES), args.repeats)
+            print()
+        return
+
+    predictor = SolarPredictor(model_path)
+    if predictor.model is None or predictor.engine is None:
+        print("❌ Model not loadable or not a supported tree ensemble")
+        sys.exit(1)
+
+    benchmark(predictor.model, predictor.engine, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
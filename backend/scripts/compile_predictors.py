@@ -0,0 +1,60 @@
+"""
+Compile the AI predictors into a dense lookup table.
+
+Evaluates SolarPredictor and ConsumptionPredictor over every
+(season, weather, month, day, weekday, hour) input and writes the result as a .npy
+tensor. When the table exists, ModelManager memory-maps it and never loads
+the .pkl models or sklearn.
+
+Run from backend/ directory:
+    python -m scripts.compile_predictors
+    python -m scripts.compile_predictors --output /srv/intelligrid/prediction_table.npy
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.ai.solar_predictor import SolarPredictor
+from src.ai.consumption_predictor import ConsumptionPredictor
+from src.ai.prediction_table import (
+    PredictionTable, compile_prediction_table, default_table_path
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile AI predictors into a lookup table")
+    parser.add_argument("--output", type=Path, default=default_table_path(),
+                        help="Destination .npy file (default: %(default)s)")
+    parser.add_argument("--solar-model", type=Path, default=None,
+                        help="Solar .pkl model (default: models/solar_pv_model.pkl)")
+    parser.add_argument("--consumption-model", type=Path, default=None,
+                        help="Consumption .pkl model (default: models/time_power_model.pkl)")
+    parser.add_argument("--allow-fallback", action="store_true",
+                        help="Compile even if a model fails to load")
+    args = parser.parse_args()
+
+    print("🔄 Loading models...")
+    solar = SolarPredictor(args.solar_model)
+    consumption = ConsumptionPredictor(args.consumption_model)
+
+    print("🔄 Compiling prediction table...")
+    start = time.perf_counter()
+    try:
+        path = compile_prediction_table(solar, consumption, args.output, args.allow_fallback)
+    except ValueError as e:
+        print(f"❌ {e} (use --allow-fallback to override)")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    table = PredictionTable(path)
+    print(f"✅ Wrote {path} {table.data.shape} in {elapsed:.1f}s")
+    print(f"   Version: {table.version}")
+
+
+if __name__ == "__main__":
+    main()
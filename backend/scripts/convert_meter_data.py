@@ -0,0 +1,63 @@
+"""
+Convert site telemetry (CSV/Parquet) into memory-mapped replay caches.
+
+Each input file becomes one cache directory that MeterDataReplay opens
+without parsing. Also reports how long a full replay stream takes compared
+with re-parsing the source file.
+
+Run from backend/ directory:
+    python -m scripts.convert_meter_data site.csv --output data/replay/site
+    python -m scripts.convert_meter_data sites/*.csv --output-dir data/replay
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.data.replay import MeterDataReplay, convert_meter_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert telemetry into replay caches")
+    parser.add_argument("sources", type=Path, nargs="+", help="CSV or Parquet telemetry files")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Cache directory (single source only)")
+    parser.add_argument("--output-dir", type=Path, default=Path("data/replay"),
+                        help="Parent directory for one cache per source (default: %(default)s)")
+    parser.add_argument("--timestamp-col", default="timestamp")
+    parser.add_argument("--solar-col", default="solar_kwh")
+    parser.add_argument("--load-col", default="load_kwh")
+    parser.add_argument("--price-col", default="price")
+    args = parser.parse_args()
+
+    if args.output is not None and len(args.sources) > 1:
+        parser.error("--output takes a single source; use --output-dir")
+
+    for source in args.sources:
+        output = args.output or args.output_dir / source.stem
+
+        start = time.perf_counter()
+        convert_meter_data(
+            source, output,
+            timestamp_col=args.timestamp_col, solar_col=args.solar_col,
+            load_col=args.load_col, price_col=args.price_col
+        )
+        convert_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        replay = MeterDataReplay(output)
+        total = sum(float(chunk.load_kwh.sum()) for chunk in replay.iter_environment())
+        replay_s = time.perf_counter() - start
+
+        print(f"✅ {source.name}: {len(replay)} steps of {replay.dt_hours:g} h "
+              f"({replay.start:%Y-%m-%d} to {replay.end:%Y-%m-%d}), "
+              f"{replay.filled_steps} filled, load {total:.0f} kWh")
+        print(f"   convert {convert_s * 1000:.1f} ms, replay {replay_s * 1000:.2f} ms -> {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Convert price histories (CSV/Parquet) into memory-mapped price series.
+
+Each input file becomes one cache directory that PriceSeries.load opens
+without parsing. Also reports how long compiling a year of prices takes
+as one vector compared with per-hour lookups.
+
+Run from backend/ directory:
+    python -m scripts.convert_price_data dam_2024.csv --output data/prices/dam
+    python -m scripts.convert_price_data markets/*.csv --output-dir data/prices
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.data.tariff import PriceSeries, convert_price_data, default_tariff
+from src.utils.config import get_price_for_hour
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert price histories into price series caches")
+    parser.add_argument("sources", type=Path, nargs="+", help="CSV or Parquet price files")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Cache directory (single source only)")
+    parser.add_argument("--output-dir", type=Path, default=Path("data/prices"),
+                        help="Parent directory for one cache per source (default: %(default)s)")
+    parser.add_argument("--timestamp-col", default="timestamp")
+    parser.add_argument("--price-col", default="price")
+    args = parser.parse_args()
+
+    if args.output is not None and len(args.sources) > 1:
+        parser.error("--output takes a single source; use --output-dir")
+
+    for source in args.sources:
+        output = args.output or args.output_dir / source.stem
+        convert_price_data(source, output, timestamp_col=args.timestamp_col, price_col=args.price_col)
+
+        series = PriceSeries.load(output)
+        start = time.perf_counter()
+        prices = series.price_vector(0, len(series), series.dt_hours)
+        compile_s = time.perf_counter() - start
+
+        print(f"✅ {source.name}: {len(series)} prices of {series.dt_hours:g} h "
+              f"({series.start:%Y-%m-%d} to {series.end:%Y-%m-%d}), "
+              f"mean {prices.mean():.2f} DZD/kWh -> {output}")
+        print(f"   price vector {compile_s * 1000:.2f} ms")
+
+    hours = 24 * 366
+    start = time.perf_counter()
+    default_tariff().price_vector(0, hours, 1.0)
+    vector_s = time.perf_counter() - start
+    start = time.perf_counter()
+    [get_price_for_hour(h % 24) for h in range(hours)]
+    scalar_s = time.perf_counter() - start
+    print(f"📊 Time-of-use year: vector {vector_s * 1000:.2f} ms, per-hour calls {scalar_s * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
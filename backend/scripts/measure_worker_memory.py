@@ -0,0 +1,127 @@
+"""
+Measure per-worker memory with private vs shared (memory-mapped) models.
+
+Starts several worker processes the way uvicorn --workers does (spawn),
+loads both predictors in each and, while all workers are alive, reads
+/proc/self/smaps_rollup:
+- USS (Private_Clean + Private_Dirty): memory freed if that worker exits
+- PSS: USS plus each shared page divided by the processes mapping it
+- RSS: everything mapped, shared pages counted in full
+
+Linux only. Run from backend/ directory:
+    python -m scripts.measure_worker_memory
+    python -m scripts.measure_worker_memory --workers 8 --solar-model /path/to/solar_pv_model.pkl
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+
+def read_memory_kb() -> dict:
+    """USS, PSS and RSS of the current process in kB."""
+    fields = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(':') and parts[1].isdigit():
+                fields[parts[0][:-1]] = int(parts[1])
+    return {
+        'uss': fields['Private_Clean'] + fields['Private_Dirty'],
+        'pss': fields['Pss'],
+        'rss': fields['Rss']
+    }
+
+
+def worker(shared: bool, solar_model, consumption_model, cache_dir, barrier, results):
+    """Load the predictors, predict once, report memory once every worker is up."""
+    os.environ['INTELLIGRID_SHARED_MODELS'] = '1' if shared else '0'
+    os.environ['INTELLIGRID_ARTIFACT_CACHE'] = cache_dir
+
+    from src.ai.solar_predictor import SolarPredictor
+    from src.ai.consumption_predictor import ConsumptionPredictor
+
+    before = read_memory_kb()
+    solar = SolarPredictor(solar_model)
+    consumption = ConsumptionPredictor(consumption_model)
+    solar.predict_batch(range(24), 15, 6)
+    consumption.predict_batch(range(24), 15, 6)
+
+    # Measure only once all workers have mapped the models
+    barrier.wait()
+    after = read_memory_kb()
+    results.put({
+        'before': before,
+        'after': after,
+        'fallback': solar.is_using_fallback() or consumption.is_using_fallback()
+    })
+    barrier.wait()
+
+
+def run_mode(shared: bool, args, cache_dir: str) -> list:
+    """Run one set of workers and collect their reports."""
+    ctx = mp.get_context('spawn')
+    barrier = ctx.Barrier(args.workers)
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=worker, args=(
+            shared, args.solar_model, args.consumption_model, cache_dir, barrier, results
+        ))
+        for _ in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-worker model memory")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--solar-model", type=Path,
+                        default=backend_dir / "models" / "solar_pv_model.pkl")
+    parser.add_argument("--consumption-model", type=Path,
+                        default=backend_dir / "models" / "time_power_model.pkl")
+    parser.add_argument("--cache-dir", type=Path, default=None,
+                        help="Artifact cache (default: a temporary directory)")
+    args = parser.parse_args()
+
+    if not Path('/proc/self/smaps_rollup').exists():
+        print("❌ /proc/self/smaps_rollup not available (Linux only)")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = str(args.cache_dir or tmp_dir)
+
+        # Build the cache entries up front, as a deploy step would
+        from src.ai.artifact_cache import load_shared_engine
+        from src.ai.solar_predictor import FEATURES as SOLAR_FEATURES
+        from src.ai.consumption_predictor import FEATURES as CONSUMPTION_FEATURES
+        load_shared_engine(args.solar_model, SOLAR_FEATURES, cache_dir)
+        load_shared_engine(args.consumption_model, CONSUMPTION_FEATURES, cache_dir)
+
+        print(f"📊 {args.workers} workers, memory in MB (model = after load - before load)")
+        print(f"{'mode':>8} {'USS':>8} {'model USS':>10} {'PSS':>8} {'RSS':>8}")
+        for shared in (False, True):
+            reports = run_mode(shared, args, cache_dir)
+            if any(report['fallback'] for report in reports):
+                print("⚠️  Models missing: workers are in fallback mode")
+
+            def mean_mb(key, field):
+                return sum(report[key][field] for report in reports) / len(reports) / 1024
+
+            model_uss = mean_mb('after', 'uss') - mean_mb('before', 'uss')
+            print(f"{'shared' if shared else 'private':>8} {mean_mb('after', 'uss'):>8.1f} "
+                  f"{model_uss:>10.1f} {mean_mb('after', 'pss'):>8.1f} {mean_mb('after', 'rss'):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
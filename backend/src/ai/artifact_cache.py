@@ -0,0 +1,90 @@
+"""
+Artifact Cache - Models shared read-only across worker processes.
+
+joblib.load() gives every uvicorn/gunicorn worker a private copy of the
+models (sklearn copies tree nodes onto the heap). In shared mode the
+predictors instead load their flattened tree arrays (see tree_engine.py)
+from an uncompressed on-disk cache with mmap: the pages live once in the
+OS page cache and every worker maps the same copy.
+
+The first process to see a new .pkl builds its cache entry; entries are
+keyed on the artifact version, so replacing the .pkl creates a new one.
+
+Enable with:
+    INTELLIGRID_SHARED_MODELS=1 uvicorn app.main:app --workers 4
+
+Measure with:
+    python -m scripts.measure_worker_memory
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .tree_engine import FlatTreeEnsemble, flatten_model
+
+logger = logging.getLogger(__name__)
+
+
+def shared_models_enabled() -> bool:
+    """Whether INTELLIGRID_SHARED_MODELS requests memory-mapped models."""
+    return os.environ.get('INTELLIGRID_SHARED_MODELS', '').lower() in ('1', 'true', 'yes')
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the artifact cache location.
+
+    Uses INTELLIGRID_ARTIFACT_CACHE if set, otherwise backend/models/.artifact_cache.
+    """
+    env_path = os.environ.get('INTELLIGRID_ARTIFACT_CACHE')
+    if env_path:
+        return Path(env_path)
+    backend_dir = Path(__file__).resolve().parent.parent.parent
+    return backend_dir / "models" / ".artifact_cache"
+
+
+def artifact_version(model_path: Path) -> str:
+    """Version string of a model file (changes whenever the file is replaced)."""
+    stat = model_path.stat()
+    return f"{model_path.name}@{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def load_shared_engine(model_path,
+                       features: Sequence[str],
+                       cache_dir=None) -> Optional[FlatTreeEnsemble]:
+    """
+    Memory-map a model's flattened trees, building the cache entry if needed.
+
+    Args:
+        model_path: Path to the .pkl model
+        features: Feature columns the predictor will pass, in order
+        cache_dir: Cache root (default: default_cache_dir())
+
+    Returns:
+        Memory-mapped FlatTreeEnsemble, or None if the model is missing or
+        cannot be flattened (callers then load it the usual way)
+    """
+    model_path = Path(model_path)
+    if not model_path.exists():
+        return None
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    stat = model_path.stat()
+    entry = cache_dir / f"{model_path.stem}-{stat.st_mtime_ns}-{stat.st_size}"
+
+    try:
+        if not entry.exists():
+            import joblib
+
+            engine = flatten_model(joblib.load(model_path), features)
+            if engine is None:
+                logger.warning(f"⚠️  {model_path.name} cannot be flattened, not sharing it")
+                return None
+            engine.save(entry)
+            logger.info(f"💾 Cached flattened {model_path.name} in {entry}")
+
+        return FlatTreeEnsemble.load(entry, mmap_mode='r')
+    except Exception as e:
+        logger.warning(f"⚠️  Artifact cache unavailable for {model_path.name}: {e}")
+        return None
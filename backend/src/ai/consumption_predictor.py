@@ -2,25 +2,70 @@
 AI Consumption Predictor - Uses trained household power consumption model.
 Provides fallback to simulation if model fails.
 """
+import importlib.util
 import sys
+import datetime
+from functools import lru_cache
 from pathlib import Path
 import logging
 
+import numpy as np
+
+from src.data.profiles import fallback_profile
+from src.ai.tree_engine import flatten_model
+from src.ai.artifact_cache import (
+    artifact_version, load_shared_engine, shared_models_enabled
+)
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Try to import ML libraries
-try:
-    import joblib
-    import pandas as pd
-    import numpy as np
-    ML_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"ML libraries not available: {e}")
-    ML_AVAILABLE = False
+# ML libraries are imported when a model is actually loaded
+ML_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('joblib', 'pandas'))
+if not ML_AVAILABLE:
+    logger.warning("ML libraries not available: joblib and pandas are required")
 
-# Import fallback simulator
-from src.data.simulator import EnergyDataSimulator
+# Feature columns, in training order
+FEATURES = ['Hour', 'Day', 'Month', 'DayOfWeek', 'Weekend']
+
+
+@lru_cache(maxsize=32)
+def calendar_features(start_date: datetime.date, end_date: datetime.date) -> np.ndarray:
+    """
+    Build the hourly calendar feature table for a date range.
+    
+    Tables are cached per range and returned read-only, so repeated
+    forecasts over the same range skip all date arithmetic.
+    
+    Args:
+        start_date: First day of the range
+        end_date: Last day of the range (inclusive)
+        
+    Returns:
+        Integer array of shape (n_days * 24, 5) with columns FEATURES
+    """
+    days = np.arange(
+        np.datetime64(start_date, 'D'),
+        np.datetime64(end_date, 'D') + 1
+    )
+    if len(days) == 0:
+        raise ValueError("end_date must not be before start_date")
+    
+    months = days.astype('datetime64[M]')
+    day_of_month = (days - months).astype(int) + 1
+    month = months.astype(int) % 12 + 1
+    # 1970-01-01 was a Thursday (weekday 3)
+    dayofweek = (days.astype(int) + 3) % 7
+    weekend = (dayofweek >= 5).astype(int)
+    
+    table = np.empty((len(days) * 24, len(FEATURES)), dtype=np.int64)
+    table[:, 0] = np.tile(np.arange(24), len(days))
+    table[:, 1] = np.repeat(day_of_month, 24)
+    table[:, 2] = np.repeat(month, 24)
+    table[:, 3] = np.repeat(dayofweek, 24)
+    table[:, 4] = np.repeat(weekend, 24)
+    table.flags.writeable = False
+    return table
 
 
 class ConsumptionPredictor:
@@ -32,6 +77,13 @@ class ConsumptionPredictor:
     # Model accuracy from training
     ACCURACY = 0.53
     
+    @staticmethod
+    def default_model_path() -> Path:
+        """Default consumption model location (backend/models/time_power_model.pkl)."""
+        # Navigate from src/ai/ to backend/models/
+        backend_dir = Path(__file__).resolve().parent.parent.parent
+        return backend_dir / "models" / "time_power_model.pkl"
+    
     def __init__(self, model_path=None):
         """
         Initialize the consumption predictor.
@@ -40,21 +92,33 @@ class ConsumptionPredictor:
             model_path: Path to .pkl model file. If None, uses default path.
         """
         self.model = None
+        self.engine = None
         self.using_fallback = False
+        self.version = 'fallback'
+        self.failures = 0  # Model calls that raised and were answered by the fallback
         
         # Set default model path
-        if model_path is None:
-            # Navigate from src/ai/ to backend/models/
-            current_file = Path(__file__).resolve()
-            backend_dir = current_file.parent.parent.parent
-            model_path = backend_dir / "models" / "time_power_model.pkl"
-        else:
-            model_path = Path(model_path)
+        model_path = Path(model_path) if model_path is not None else self.default_model_path()
+        
+        # Shared mode: memory-map the flattened model (no private copy)
+        if shared_models_enabled():
+            self.engine = load_shared_engine(model_path, FEATURES)
         
         # Try to load the model
-        if ML_AVAILABLE:
+        if self.engine is not None:
+            self.version = artifact_version(model_path)
+            logger.info(f"✅ Consumption model memory-mapped from artifact cache ({model_path.name})")
+        elif ML_AVAILABLE:
             try:
+                if not model_path.exists():
+                    raise FileNotFoundError(f"No such file: '{model_path}'")
+                import joblib
+
                 self.model = joblib.load(model_path)
+                # Artifact version (changes whenever the .pkl is replaced)
+                self.version = artifact_version(model_path)
+                # Flattened tree arrays for pandas/sklearn-free inference
+                self.engine = flatten_model(self.model, FEATURES)
                 logger.info(f"✅ Consumption model loaded successfully from {model_path}")
                 logger.info(f"   Model accuracy: {self.ACCURACY:.1%}")
             except Exception as e:
@@ -65,6 +129,9 @@ class ConsumptionPredictor:
             logger.warning("⚠️  ML libraries not available, using simulation fallback")
             self.using_fallback = True
     
+    # Rows per model call for long horizons
+    HORIZON_CHUNK_SIZE = 4096
+    
     def predict(self, hour, day, month, dayofweek=None, weekend=None, weather='sunny', season='summer'):
         """
         Predict power consumption in kW.
@@ -81,10 +148,32 @@ class ConsumptionPredictor:
         Returns:
             Predicted consumption in kW (float)
         """
+        return float(self.predict_batch(
+            [hour], day, month, dayofweek, weekend, weather=weather, season=season
+        )[0])
+    
+    def predict_batch(self, hours, day, month, dayofweek=None, weekend=None,
+                      weather='sunny', season='summer'):
+        """
+        Predict power consumption in kW for several hours of the same day.
+        
+        Args:
+            hours: Sequence of hours of day (0-23)
+            day: Day of month (1-31)
+            month: Month (1-12)
+            dayofweek: Day of week (0=Monday, 6=Sunday). If None, calculated from day/month.
+            weekend: Whether it's weekend (0 or 1). If None, calculated from dayofweek.
+            weather: Weather condition (for fallback)
+            season: Season (for fallback)
+            
+        Returns:
+            NumPy array of predicted consumption in kW (one per hour)
+        """
+        hours = np.atleast_1d(np.asarray(hours, dtype=int))
+        
         # Calculate dayofweek and weekend if not provided
         if dayofweek is None or weekend is None:
             try:
-                import datetime
                 date = datetime.date(2024, month, day)  # Use 2024 as default year
                 if dayofweek is None:
                     dayofweek = date.weekday()  # 0=Monday, 6=Sunday
@@ -97,60 +186,82 @@ class ConsumptionPredictor:
                 if weekend is None:
                     weekend = 0
         
+        features = np.empty((len(hours), len(FEATURES)), dtype=np.int64)
+        features[:, 0] = hours
+        features[:, 1:] = [day, month, dayofweek, weekend]
+        
+        return self._predict_features(features, weather, season)
+    
+    def predict_horizon(self, start_date, end_date, weather='sunny', season='summer'):
+        """
+        Predict hourly power consumption in kW over a date range.
+        
+        Calendar features come from the cached calendar table and the model
+        runs in chunks of HORIZON_CHUNK_SIZE rows, so a full year
+        (8,760 hours) costs a handful of model calls.
+        
+        Args:
+            start_date: First day of the horizon (datetime.date)
+            end_date: Last day of the horizon, inclusive (datetime.date)
+            weather: Weather condition (for fallback)
+            season: Season (for fallback)
+            
+        Returns:
+            NumPy array of predicted consumption in kW, 24 values per day
+        """
+        features = calendar_features(start_date, end_date)
+        return self._predict_features(features, weather, season)
+    
+    def _predict_features(self, features, weather, season):
+        """
+        Run the model over a feature table, falling back per hour of day.
+        
+        Args:
+            features: Integer array with columns FEATURES
+            weather: Weather condition (for fallback)
+            season: Season (for fallback)
+            
+        Returns:
+            NumPy array of predicted consumption in kW (one per row)
+        """
         # Try AI model first
-        if self.model is not None and not self.using_fallback:
+        if (self.model is not None or self.engine is not None) and not self.using_fallback:
             try:
-                # Prepare features (must match training features)
-                features = pd.DataFrame([{
-                    'Hour': hour,
-                    'Day': day,
-                    'Month': month,
-                    'DayOfWeek': dayofweek,
-                    'Weekend': weekend
-                }])
+                use_engine = self.engine is not None and (
+                    self.model is None or len(features) <= self.engine.SMALL_BATCH_ROWS
+                )
+                if use_engine:
+                    # Flattened trees: no DataFrame for short horizons (or shared mode)
+                    return np.maximum(0, self.engine.predict(features))
                 
-                # Make prediction
-                pred_kw = self.model.predict(features)[0]
+                import pandas as pd
+
+                pred_kw = np.empty(len(features), dtype=float)
+                for start in range(0, len(features), self.HORIZON_CHUNK_SIZE):
+                    chunk = features[start:start + self.HORIZON_CHUNK_SIZE]
+                    # Feature names must match training features
+                    frame = pd.DataFrame(chunk, columns=FEATURES)
+                    pred_kw[start:start + len(chunk)] = self.model.predict(frame)
                 
                 # Ensure non-negative
-                return max(0, pred_kw)
+                return np.maximum(0, pred_kw)
                 
             except Exception as e:
                 logger.error(f"AI prediction failed: {e}, using fallback")
-                return self._fallback_predict(hour, day, month, weather, season)
-        else:
-            # Use fallback simulation
-            return self._fallback_predict(hour, day, month, weather, season)
+                self.failures += 1
+        
+        # Use fallback simulation (depends only on hour of day)
+        return self._fallback_batch(features[:, 0], weather, season)
     
-    def _fallback_predict(self, hour, day, month, weather, season):
+    def _fallback_batch(self, hours, weather, season):
         """
-        Fallback to simulation-based prediction.
-        """
-        from src.data.models import SimulationConfig, Weather, Season, DayType
-        
-        # Create config for simulator
-        weather_map = {
-            'sunny': Weather.SUNNY,
-            'partly_cloudy': Weather.PARTLY_CLOUDY,
-            'cloudy': Weather.CLOUDY,
-            'rainy': Weather.RAINY,
-        }
-        season_map = {
-            'summer': Season.SUMMER,
-            'winter': Season.WINTER,
-        }
+        Fallback to the simulation profile for several hours.
         
-        config = SimulationConfig(
-            season=season_map.get(season.lower(), Season.SUMMER),
-            weather=weather_map.get(weather.lower().replace('-', '_'), Weather.SUNNY),
-            day_type=DayType.WEEKDAY
-        )
-        
-        # Create simulator and generate environment for specific hour
-        simulator = EnergyDataSimulator(config, seed=42)
-        env = simulator.generate_environment_for_hour(hour)
-        
-        return env.load_kwh
+        Uses the shared, cached fallback profile (one vectorized pass per
+        season/weather) instead of building a simulator per hour.
+        """
+        _, load = fallback_profile(season, weather)
+        return load[np.asarray(hours, dtype=int)]
     
     def get_feature_importance(self):
         """
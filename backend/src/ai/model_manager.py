@@ -3,13 +3,20 @@ Model Manager - Central access to both AI models (solar and consumption).
 Provides unified interface for predictions with fallback support.
 
 SINGLETON PATTERN: Models load only once, reused for all requests.
+Predictions are memoized in a bounded LRU cache keyed on inputs and model version.
+Artifacts are loaded and hot-swapped through a thread-safe ModelRegistry.
 """
 import datetime
 import logging
-from typing import Dict, Any, Optional
+import os
+import threading
+from typing import Dict, Any, Optional, List, Tuple
 
 from .solar_predictor import SolarPredictor
 from .consumption_predictor import ConsumptionPredictor
+from .prediction_cache import PredictionCache
+from .prediction_table import PredictionTable
+from .model_registry import ModelRegistry, PredictorHandle
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +30,14 @@ class ModelManager:
     AI models are loaded only once and reused for all predictions.
     This prevents the 29MB model files from being reloaded on every request.
     
+    Predictions are memoized in a thread-safe LRU cache (CACHE_SIZE entries)
+    keyed on normalized inputs and model versions; reload_models() clears it.
+    
+    Creation is guarded by a lock, so concurrent first requests load the
+    models once. Every REFRESH_INTERVAL seconds the registry checks for new
+    artifacts on disk and swaps them in; each request uses one PredictorHandle
+    from start to finish.
+    
     Usage:
         manager = ModelManager()  # Loads models on first call
         manager = ModelManager()  # Returns same instance, no reload
@@ -31,11 +46,23 @@ class ModelManager:
     # Singleton instance storage
     _instance: Optional['ModelManager'] = None
     _initialized: bool = False
+    _lock = threading.Lock()
+    
+    # Maximum memoized (hour, day, month, weather, season) predictions
+    CACHE_SIZE = 8192
+    
+    # Seconds between checks for new artifacts on disk (0 disables hot-swap)
+    REFRESH_INTERVAL = float(os.environ.get('INTELLIGRID_MODEL_REFRESH_S', '30'))
+    
+    # Artifact versions kept loaded (current plus recently replaced ones)
+    MAX_VERSIONS = 2
     
     def __new__(cls) -> 'ModelManager':
         """Create or return singleton instance."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
     
     def __init__(self):
@@ -44,34 +71,54 @@ class ModelManager:
         if self._initialized:
             return
         
-        logger.info("🔄 Initializing AI Model Manager (singleton)...")
-        
-        self.solar = SolarPredictor()
-        self.consumption = ConsumptionPredictor()
-        
-        # Log status
-        solar_fallback = self.solar.is_using_fallback()
-        cons_fallback = self.consumption.is_using_fallback()
-        
-        if not solar_fallback and not cons_fallback:
-            logger.info("✅ All AI models loaded successfully (singleton)")
-        elif solar_fallback and cons_fallback:
-            logger.warning("⚠️  Both models using fallback (simulation mode)")
-        else:
-            if solar_fallback:
-                logger.warning("⚠️  Solar model using fallback")
-            if cons_fallback:
-                logger.warning("⚠️  Consumption model using fallback")
-        
-        # Mark as initialized to prevent reloading
-        self._initialized = True
-        logger.info("🔒 ModelManager singleton initialized - models will NOT reload on subsequent requests")
+        with self._lock:
+            if self._initialized:
+                return
+            
+            logger.info("🔄 Initializing AI Model Manager (singleton)...")
+            
+            self._cache = PredictionCache(self.CACHE_SIZE)
+            self.registry = ModelRegistry(
+                max_versions=self.MAX_VERSIONS, refresh_interval=self.REFRESH_INTERVAL
+            )
+            self.registry.current()
+            
+            # Mark as initialized to prevent reloading
+            type(self)._initialized = True
+            logger.info("🔒 ModelManager singleton initialized - models reload only when artifacts change")
+    
+    @property
+    def solar(self) -> SolarPredictor:
+        """Solar predictor of the current artifact version."""
+        return self.registry.current().solar
+    
+    @property
+    def consumption(self) -> ConsumptionPredictor:
+        """Consumption predictor of the current artifact version."""
+        return self.registry.current().consumption
+    
+    @property
+    def table(self) -> Optional[PredictionTable]:
+        """Compiled prediction table of the current artifact version, if any."""
+        return self.registry.current().table
+    
+    @property
+    def version(self) -> str:
+        """Artifact version of the current predictors (changes on every swap)."""
+        return '|'.join(self.registry.current().key)
+    
+    def reload_models(self):
+        """Swap in the artifacts on disk if they changed and invalidate cached predictions."""
+        logger.info("🔄 Reloading AI models...")
+        self.registry.refresh()
+        self._cache.clear()
     
     @classmethod
     def reset_instance(cls):
         """Reset singleton (mainly for testing)."""
-        cls._instance = None
-        cls._initialized = False
+        with cls._lock:
+            cls._instance = None
+            cls._initialized = False
         logger.info("🔄 ModelManager singleton reset")
     
     def get_predictions(self, 
@@ -110,33 +157,14 @@ class ModelManager:
         month = month if month is not None else now.month
         year = year if year is not None else now.year
         
-        # Get predictions from both models
-        solar_pred = self.solar.predict(hour, day, month, weather, season)
-        consumption_pred = self.consumption.predict(hour, day, month, weather=weather, season=season)
-        
-        # Calculate net
-        net = solar_pred - consumption_pred
+        handle = self.registry.current()
+        solar_pred, consumption_pred = self._predict_hours(
+            handle, [hour], day, month, weather, season
+        )[0]
         
-        # Check if using fallback
-        using_fallback = self.solar.is_using_fallback() or self.consumption.is_using_fallback()
-        
-        return {
-            'solar_kw': solar_pred,
-            'consumption_kw': consumption_pred,
-            'net_kw': net,
-            'solar_accuracy': self.solar.ACCURACY,
-            'consumption_accuracy': self.consumption.ACCURACY,
-            'using_fallback': using_fallback,
-            'timestamp': now.isoformat(),
-            'input_params': {
-                'hour': hour,
-                'day': day,
-                'month': month,
-                'year': year,
-                'weather': weather,
-                'season': season
-            }
-        }
+        return self._prediction_dict(
+            handle, now, hour, day, month, year, weather, season, solar_pred, consumption_pred
+        )
     
     def get_24h_predictions(self, 
                             day: int = None,
@@ -162,19 +190,104 @@ class ModelManager:
         month = month if month is not None else now.month
         year = year if year is not None else now.year
         
-        predictions = []
-        for hour in range(24):
-            pred = self.get_predictions(
-                hour=hour,
-                day=day,
-                month=month,
-                year=year,
-                weather=weather,
-                season=season
+        handle = self.registry.current()
+        hours = list(range(24))
+        values = self._predict_hours(handle, hours, day, month, weather, season)
+        
+        return [
+            self._prediction_dict(
+                handle, now, hour, day, month, year, weather, season, solar_pred, consumption_pred
             )
-            predictions.append(pred)
+            for hour, (solar_pred, consumption_pred) in zip(hours, values)
+        ]
+    
+    def predict_hours(self,
+                      hours: List[int],
+                      day: int,
+                      month: int,
+                      weather: str,
+                      season: str) -> List[Tuple[float, float]]:
+        """
+        Get (solar_kw, consumption_kw) for several hours, using the cache.
+        
+        Keys are normalized inputs plus both model versions, so entries from a
+        replaced artifact can never be served. Misses are predicted together
+        with one batched call per model.
+        
+        Args:
+            hours: Hours of day (0-23)
+            day: Day of month (1-31)
+            month: Month (1-12)
+            weather: Weather condition
+            season: Season
+            
+        Returns:
+            List of (solar_kw, consumption_kw) tuples, one per hour
+        """
+        return self._predict_hours(self.registry.current(), hours, day, month, weather, season)
+    
+    def _predict_hours(self,
+                       handle: PredictorHandle,
+                       hours: List[int],
+                       day: int,
+                       month: int,
+                       weather: str,
+                       season: str) -> List[Tuple[float, float]]:
+        """predict_hours() with the predictors of one handle."""
+        solar, consumption = handle.solar, handle.consumption
+        weather_key = weather.lower().replace('-', '_')
+        season_key = season.lower()
+        
+        keys = [
+            (int(hour), int(day), int(month), weather_key, season_key,
+             solar.version, consumption.version)
+            for hour in hours
+        ]
+        values = [self._cache.get(key) for key in keys]
+        
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            missing_hours = [hours[i] for i in missing]
+            failures = solar.failures + consumption.failures
+            solar_preds = solar.predict_batch(missing_hours, day, month, weather, season)
+            consumption_preds = consumption.predict_batch(
+                missing_hours, day, month, weather=weather, season=season
+            )
+            # Do not cache a transient model failure under the model version
+            cacheable = solar.failures + consumption.failures == failures
+            for i, solar_pred, consumption_pred in zip(missing, solar_preds, consumption_preds):
+                values[i] = (float(solar_pred), float(consumption_pred))
+                if cacheable:
+                    self._cache.put(keys[i], values[i])
+        
+        return values
+    
+    def _prediction_dict(self, handle, now, hour, day, month, year, weather, season,
+                         solar_pred, consumption_pred) -> Dict[str, Any]:
+        """Build the prediction dictionary returned by get_predictions."""
+        # Calculate net
+        net = solar_pred - consumption_pred
         
-        return predictions
+        # Check if using fallback
+        using_fallback = handle.using_fallback
+        
+        return {
+            'solar_kw': solar_pred,
+            'consumption_kw': consumption_pred,
+            'net_kw': net,
+            'solar_accuracy': handle.solar.ACCURACY,
+            'consumption_accuracy': handle.consumption.ACCURACY,
+            'using_fallback': using_fallback,
+            'timestamp': now.isoformat(),
+            'input_params': {
+                'hour': hour,
+                'day': day,
+                'month': month,
+                'year': year,
+                'weather': weather,
+                'season': season
+            }
+        }
     
     def get_feature_importance(self) -> Dict[str, Dict[str, float]]:
         """
@@ -195,16 +308,27 @@ class ModelManager:
         Returns:
             Dictionary with model status information
         """
+        handle = self.registry.current()
+        solar, consumption = handle.solar, handle.consumption
         return {
             'solar': {
-                'loaded': self.solar.model is not None,
-                'using_fallback': self.solar.is_using_fallback(),
-                'accuracy': self.solar.ACCURACY
+                'loaded': solar.model is not None or solar.engine is not None,
+                'using_fallback': solar.is_using_fallback(),
+                'accuracy': solar.ACCURACY,
+                'version': solar.version,
+                'flattened': solar.engine is not None,
+                'shared': solar.model is None and solar.engine is not None
             },
             'consumption': {
-                'loaded': self.consumption.model is not None,
-                'using_fallback': self.consumption.is_using_fallback(),
-                'accuracy': self.consumption.ACCURACY
+                'loaded': consumption.model is not None or consumption.engine is not None,
+                'using_fallback': consumption.is_using_fallback(),
+                'accuracy': consumption.ACCURACY,
+                'version': consumption.version,
+                'flattened': consumption.engine is not None,
+                'shared': consumption.model is None and consumption.engine is not None
             },
+            'table': str(handle.table.path) if handle.table is not None else None,
+            'cache': self._cache.stats(),
+            'registry': self.registry.stats(),
             'singleton_initialized': self._initialized
         }
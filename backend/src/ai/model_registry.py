@@ -0,0 +1,237 @@
+"""
+Model Registry - Thread-safe loading and hot-swapping of predictor artifacts.
+
+Each set of artifacts on disk (prediction table, solar .pkl, consumption
+.pkl) is identified by an ArtifactKey built from cheap stat() calls. The
+registry loads every key exactly once under a lock and hands out immutable
+PredictorHandle objects:
+
+- Requests take one handle and use it to the end, so a swap never mixes
+  predictors from two versions within a request.
+- A newly loaded handle replaces the current one atomically; in-flight
+  requests finish on the handle they already hold.
+- At most max_versions handles stay resident (current one included);
+  evicted handles are freed once no request references them.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .solar_predictor import SolarPredictor
+from .consumption_predictor import ConsumptionPredictor
+from .artifact_cache import artifact_version
+from .prediction_table import (
+    PredictionTable, TabulatedSolarPredictor, TabulatedConsumptionPredictor,
+    default_table_path
+)
+
+logger = logging.getLogger(__name__)
+
+# (table version, solar version, consumption version); 'missing' if absent
+ArtifactKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class PredictorHandle:
+    """Immutable set of predictors loaded from one artifact version."""
+    key: ArtifactKey
+    solar: SolarPredictor
+    consumption: ConsumptionPredictor
+    table: Optional[PredictionTable] = None
+    loaded_at: float = 0.0
+
+    @property
+    def using_fallback(self) -> bool:
+        """Whether either predictor is in simulation fallback mode."""
+        return self.solar.is_using_fallback() or self.consumption.is_using_fallback()
+
+
+def _file_version(path: Path) -> str:
+    """Artifact version of a file, or 'missing'."""
+    try:
+        return artifact_version(path)
+    except OSError:
+        return 'missing'
+
+
+def current_artifact_key() -> ArtifactKey:
+    """Version key of the artifacts currently on disk."""
+    return (
+        _file_version(default_table_path()),
+        _file_version(SolarPredictor.default_model_path()),
+        _file_version(ConsumptionPredictor.default_model_path())
+    )
+
+
+def load_predictors(key: ArtifactKey) -> PredictorHandle:
+    """
+    Load predictors for the artifacts on disk.
+
+    A compiled prediction table (see prediction_table.py) is preferred: it
+    is memory-mapped and served without loading the .pkl models.
+
+    Args:
+        key: Artifact key the handle is registered under
+
+    Returns:
+        PredictorHandle with both predictors loaded
+    """
+    table = None
+    table_path = default_table_path()
+    if table_path.exists():
+        try:
+            table = PredictionTable(table_path)
+            logger.info(f"✅ Serving predictions from compiled table {table_path}")
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to load prediction table: {e}, loading models")
+
+    if table is not None:
+        solar = TabulatedSolarPredictor(table)
+        consumption = TabulatedConsumptionPredictor(table)
+    else:
+        solar = SolarPredictor()
+        consumption = ConsumptionPredictor()
+
+    # Log status
+    solar_fallback = solar.is_using_fallback()
+    cons_fallback = consumption.is_using_fallback()
+
+    if not solar_fallback and not cons_fallback:
+        logger.info("✅ All AI models loaded successfully")
+    elif solar_fallback and cons_fallback:
+        logger.warning("⚠️  Both models using fallback (simulation mode)")
+    else:
+        if solar_fallback:
+            logger.warning("⚠️  Solar model using fallback")
+        if cons_fallback:
+            logger.warning("⚠️  Consumption model using fallback")
+
+    return PredictorHandle(
+        key=key, solar=solar, consumption=consumption, table=table, loaded_at=time.time()
+    )
+
+
+class ModelRegistry:
+    """
+    Loads each artifact version once and swaps versions in atomically.
+
+    Reads of the current handle never take the lock. Loads and swaps are
+    serialized by it, so concurrent first requests load the models once.
+    """
+
+    # Handles kept resident (current plus the most recently replaced ones)
+    MAX_VERSIONS = 2
+
+    def __init__(self,
+                 max_versions: int = MAX_VERSIONS,
+                 refresh_interval: float = 0.0,
+                 key_fn: Callable[[], ArtifactKey] = current_artifact_key,
+                 loader: Callable[[ArtifactKey], PredictorHandle] = load_predictors):
+        """
+        Args:
+            max_versions: Maximum resident handles (at least 1)
+            refresh_interval: Seconds between automatic checks for new
+                artifacts in current(); 0 disables automatic checks
+            key_fn: Returns the key of the artifacts on disk
+            loader: Loads a handle for a key
+        """
+        if max_versions < 1:
+            raise ValueError("max_versions must be at least 1")
+
+        self.max_versions = max_versions
+        self.refresh_interval = refresh_interval
+        self._key_fn = key_fn
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._handles: 'OrderedDict[ArtifactKey, PredictorHandle]' = OrderedDict()
+        self._current: Optional[PredictorHandle] = None
+        self._last_check = 0.0
+        self._loads = 0
+        self._swaps = 0
+
+    def current(self) -> PredictorHandle:
+        """
+        Get the handle requests should use.
+
+        Loads on first use. With a refresh_interval, at most one caller per
+        interval checks the artifacts on disk; others keep the current handle.
+
+        Returns:
+            Current PredictorHandle
+        """
+        handle = self._current
+        if handle is None:
+            return self.refresh()
+
+        if self.refresh_interval > 0 and time.monotonic() - self._last_check >= self.refresh_interval:
+            # Never block a request on another thread's load
+            if self._lock.acquire(blocking=False):
+                try:
+                    return self._refresh_locked()
+                finally:
+                    self._lock.release()
+        return handle
+
+    def refresh(self) -> PredictorHandle:
+        """
+        Swap in the artifacts currently on disk if their version changed.
+
+        Returns:
+            The (possibly new) current PredictorHandle
+        """
+        with self._lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> PredictorHandle:
+        """refresh() body; caller holds the lock."""
+        self._last_check = time.monotonic()
+        key = self._key_fn()
+        if self._current is not None and self._current.key == key:
+            return self._current
+
+        handle = self._handles.get(key)
+        if handle is None:
+            logger.info(f"🔄 Loading predictor artifacts {key}")
+            handle = self._loader(key)
+            self._loads += 1
+        self._handles[key] = handle
+        self._handles.move_to_end(key)
+
+        if self._current is not None:
+            self._swaps += 1
+            logger.info(f"🔁 Swapped predictors {self._current.key} -> {key}")
+        self._current = handle
+
+        # Evict least recently current versions (never the current one)
+        while len(self._handles) > self.max_versions:
+            evicted, _ = self._handles.popitem(last=False)
+            logger.info(f"🗑️  Evicted predictor artifacts {evicted}")
+        return handle
+
+    def clear(self) -> None:
+        """Drop every handle; the next current() loads again."""
+        with self._lock:
+            self._handles.clear()
+            self._current = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get registry counters.
+
+        Returns:
+            Dictionary with current key, resident keys, loads and swaps
+        """
+        with self._lock:
+            handle = self._current
+            resident = [list(key) for key in self._handles]
+        return {
+            'current': list(handle.key) if handle is not None else None,
+            'resident': resident,
+            'max_versions': self.max_versions,
+            'loads': self._loads,
+            'swaps': self._swaps
+        }
@@ -0,0 +1,104 @@
+"""
+Prediction Cache - Bounded, thread-safe LRU memoization for model outputs.
+
+Prediction inputs come from a small discrete domain (hour, day, month,
+weather, season), so repeated requests can be answered without running
+the models again.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class PredictionCache:
+    """
+    Least-recently-used cache with hit/miss/eviction counters.
+
+    All operations are guarded by a lock so the cache can be shared by
+    FastAPI's threadpool workers.
+
+    Attributes:
+        max_size: Maximum number of entries kept
+        hits: Number of successful lookups
+        misses: Number of failed lookups
+        evictions: Number of entries dropped to respect max_size
+    """
+
+    def __init__(self, max_size: int = 8192):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries kept (must be positive)
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store (must not be None)
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
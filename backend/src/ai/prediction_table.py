@@ -0,0 +1,254 @@
+"""
+Prediction Table - Predictors compiled into a dense, memory-mapped lookup table.
+
+The model inputs form a finite grid (season x weather x month x day x
+weekday x hour), so both predictors can be evaluated once, offline, and
+stored as a single .npy tensor (float64, about 15 MB). Serving processes
+then answer predictions by direct indexing into a read-only memory map: no
+joblib artifacts and no sklearn are loaded, and the pages are shared by
+every worker on the host.
+
+Compile with:
+    python -m scripts.compile_predictors
+"""
+import datetime
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .solar_predictor import SolarPredictor
+from .consumption_predictor import ConsumptionPredictor, FEATURES
+
+logger = logging.getLogger(__name__)
+
+# Slice compiled from the predictors' handling of unrecognised values
+# (SolarPredictor's default G(i)/T2m, no season temperature adjustment),
+# so any other weather or season is answered exactly as the models answer it
+UNKNOWN = 'unknown'
+
+# Grid axes, in tensor order
+SEASONS = ('summer', 'winter', UNKNOWN)
+WEATHERS = ('sunny', 'partly_cloudy', 'cloudy', 'rainy', UNKNOWN)
+MONTHS = 12
+DAYS = 31
+WEEKDAYS = 7  # DayOfWeek, 0=Monday; Weekend is DayOfWeek >= 5
+HOURS = 24
+QUANTITIES = ('solar_kw', 'consumption_kw')
+
+TABLE_SHAPE = (len(SEASONS), len(WEATHERS), MONTHS, DAYS, WEEKDAYS, HOURS, len(QUANTITIES))
+
+# Calendar year used when no weekday is given (matches ConsumptionPredictor.predict)
+CALENDAR_YEAR = 2024
+
+
+def _calendar_weekdays() -> np.ndarray:
+    """DayOfWeek of each (month, day) of CALENDAR_YEAR; 0 for non-dates, like the predictor."""
+    weekdays = np.zeros((MONTHS, DAYS), dtype=int)
+    date = datetime.date(CALENDAR_YEAR, 1, 1)
+    while date.year == CALENDAR_YEAR:
+        weekdays[date.month - 1, date.day - 1] = date.weekday()
+        date += datetime.timedelta(days=1)
+    return weekdays
+
+
+CALENDAR_WEEKDAYS = _calendar_weekdays()
+
+
+def default_table_path() -> Path:
+    """
+    Get the prediction table location.
+
+    Uses INTELLIGRID_PREDICTION_TABLE if set, otherwise backend/models/prediction_table.npy.
+    """
+    env_path = os.environ.get('INTELLIGRID_PREDICTION_TABLE')
+    if env_path:
+        return Path(env_path)
+    backend_dir = Path(__file__).resolve().parent.parent.parent
+    return backend_dir / "models" / "prediction_table.npy"
+
+
+def compile_prediction_table(solar: SolarPredictor,
+                             consumption: ConsumptionPredictor,
+                             output_path,
+                             allow_fallback: bool = False) -> Path:
+    """
+    Evaluate both predictors over the full input grid and save the tensor.
+
+    The file is written next to its destination and renamed into place, so
+    processes that already memory-map the old table keep a consistent view.
+
+    Args:
+        solar: Loaded solar predictor
+        consumption: Loaded consumption predictor
+        output_path: Destination .npy file
+        allow_fallback: Compile even if a predictor is in fallback mode
+
+    Returns:
+        Path of the written table
+    """
+    if not allow_fallback and (solar.is_using_fallback() or consumption.is_using_fallback()):
+        raise ValueError("Refusing to compile a table from fallback predictors")
+
+    table = np.zeros(TABLE_SHAPE, dtype=np.float64)
+
+    # Solar does not depend on the weekday: one batched call per
+    # (season, weather) over every month/day/hour, repeated across weekdays
+    months, days, hours = np.meshgrid(
+        np.arange(1, MONTHS + 1), np.arange(1, DAYS + 1), np.arange(HOURS), indexing='ij'
+    )
+    for s, season in enumerate(SEASONS):
+        for w, weather in enumerate(WEATHERS):
+            pred = solar.predict_batch(hours.ravel(), days.ravel(), months.ravel(), weather, season)
+            table[s, w, ..., 0] = pred.reshape(MONTHS, DAYS, 1, HOURS)
+
+    # Consumption: the model over every month/day/weekday/hour row
+    grid = np.meshgrid(
+        np.arange(1, MONTHS + 1), np.arange(1, DAYS + 1), np.arange(WEEKDAYS), np.arange(HOURS),
+        indexing='ij'
+    )
+    features = np.empty((grid[0].size, len(FEATURES)), dtype=np.int64)
+    features[:, 0] = grid[3].ravel()
+    features[:, 1] = grid[1].ravel()
+    features[:, 2] = grid[0].ravel()
+    features[:, 3] = grid[2].ravel()
+    features[:, 4] = features[:, 3] >= 5
+    for s, season in enumerate(SEASONS):
+        for w, weather in enumerate(WEATHERS):
+            pred = consumption._predict_features(features, weather, season)
+            table[s, w, ..., 1] = pred.reshape(MONTHS, DAYS, WEEKDAYS, HOURS)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        np.save(f, table)
+    os.replace(tmp_path, output_path)
+
+    logger.info(f"✅ Prediction table compiled to {output_path} ({table.nbytes / 1e6:.1f} MB)")
+    return output_path
+
+
+class PredictionTable:
+    """
+    Read-only, memory-mapped view of a compiled prediction table.
+
+    Attributes:
+        path: Location of the .npy file
+        version: Artifact version (changes whenever the file is replaced)
+        data: Memory-mapped tensor of shape TABLE_SHAPE
+    """
+
+    def __init__(self, path):
+        """
+        Memory-map a compiled table.
+
+        Args:
+            path: Path to the .npy file
+        """
+        self.path = Path(path)
+        self.data = np.load(self.path, mmap_mode='r')
+        if self.data.shape != TABLE_SHAPE:
+            raise ValueError(f"Prediction table has shape {self.data.shape}, expected {TABLE_SHAPE}")
+
+        stat = self.path.stat()
+        self.version = f"{self.path.name}@{stat.st_mtime_ns}-{stat.st_size}"
+
+    def lookup(self, hours, day, month, weather='sunny', season='summer', dayofweek=None) -> np.ndarray:
+        """
+        Look up predictions by direct indexing.
+
+        Args:
+            hours: Sequence of hours of day (0-23)
+            day: Day of month (1-31), or an array matching hours
+            month: Month (1-12), or an array matching hours
+            weather: Weather condition ('sunny', 'partly_cloudy', 'cloudy', 'rainy';
+                anything else gets the UNKNOWN slice)
+            season: Season ('summer', 'winter'; anything else gets the UNKNOWN slice)
+            dayofweek: Day of week (0=Monday), or an array matching hours.
+                If None, taken from CALENDAR_YEAR.
+
+        Returns:
+            Array of shape (len(hours), 2) with columns QUANTITIES
+
+        Raises:
+            ValueError: If an hour, day, month or weekday is outside the grid
+        """
+        weather_key = weather.lower().replace('-', '_')
+        season_key = season.lower()
+        if weather_key not in WEATHERS:
+            weather_key = UNKNOWN
+        if season_key not in SEASONS:
+            season_key = UNKNOWN
+
+        hours = np.atleast_1d(np.asarray(hours, dtype=int))
+        day = np.broadcast_to(np.asarray(day, dtype=int), hours.shape)
+        month = np.broadcast_to(np.asarray(month, dtype=int), hours.shape)
+        if ((hours < 0) | (hours >= HOURS)).any() or ((day < 1) | (day > DAYS)).any() \
+                or ((month < 1) | (month > MONTHS)).any():
+            raise ValueError("hour, day or month outside the compiled grid")
+        if dayofweek is None:
+            dayofweek = CALENDAR_WEEKDAYS[month - 1, day - 1]
+        dayofweek = np.broadcast_to(np.asarray(dayofweek, dtype=int), hours.shape)
+        if ((dayofweek < 0) | (dayofweek >= WEEKDAYS)).any():
+            raise ValueError("day of week outside the compiled grid")
+
+        plane = self.data[SEASONS.index(season_key), WEATHERS.index(weather_key)]
+        return np.asarray(plane[month - 1, day - 1, dayofweek, hours])
+
+
+class TabulatedSolarPredictor(SolarPredictor):
+    """SolarPredictor served from a PredictionTable instead of a model."""
+
+    def __init__(self, table: PredictionTable):
+        """
+        Args:
+            table: Loaded prediction table
+        """
+        self.model = None
+        self.engine = None
+        self.using_fallback = False
+        self.failures = 0
+        self.table = table
+        self.version = table.version
+
+    def predict_batch(self, hours, day, month, weather='sunny', season='summer'):
+        """Predict solar production in kW by table lookup."""
+        return self.table.lookup(hours, day, month, weather, season)[:, 0]
+
+
+class TabulatedConsumptionPredictor(ConsumptionPredictor):
+    """ConsumptionPredictor served from a PredictionTable instead of a model.
+
+    The table is keyed on DayOfWeek with Weekend = DayOfWeek >= 5, so
+    horizons of any year are exact. Rows with a Weekend flag that
+    contradicts their DayOfWeek have no table entry and get the fallback
+    profile.
+    """
+
+    def __init__(self, table: PredictionTable):
+        """
+        Args:
+            table: Loaded prediction table
+        """
+        self.model = None
+        self.engine = None
+        self.using_fallback = False
+        self.failures = 0
+        self.table = table
+        self.version = table.version
+
+    def _predict_features(self, features, weather, season):
+        """Predict power consumption in kW by table lookup on Hour/Day/Month/DayOfWeek."""
+        features = np.asarray(features)
+        dayofweek = features[:, 3]
+        pred_kw = self.table.lookup(
+            features[:, 0], features[:, 1], features[:, 2], weather, season, dayofweek
+        )[:, 1]
+
+        untabulated = features[:, 4] != (dayofweek >= 5)
+        if untabulated.any():
+            logger.warning("⚠️  Weekend flag does not match DayOfWeek, using fallback for those hours")
+            pred_kw[untabulated] = self._fallback_batch(features[untabulated, 0], weather, season)
+        return pred_kw
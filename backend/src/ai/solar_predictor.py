@@ -2,25 +2,29 @@
 AI Solar Predictor - Uses trained PVGIS model for solar production prediction.
 Provides fallback to simulation if model fails.
 """
+import importlib.util
 import sys
 from pathlib import Path
 import logging
 
+import numpy as np
+
+from src.data.profiles import fallback_profile
+from src.ai.tree_engine import flatten_model
+from src.ai.artifact_cache import (
+    artifact_version, load_shared_engine, shared_models_enabled
+)
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Try to import ML libraries
-try:
-    import joblib
-    import pandas as pd
-    import numpy as np
-    ML_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"ML libraries not available: {e}")
-    ML_AVAILABLE = False
+# ML libraries are imported when a model is actually loaded
+ML_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('joblib', 'pandas'))
+if not ML_AVAILABLE:
+    logger.warning("ML libraries not available: joblib and pandas are required")
 
-# Import fallback simulator
-from src.data.simulator import EnergyDataSimulator
+# Feature columns, in training order
+FEATURES = ['Hour', 'Day', 'Month', 'G(i)', 'T2m']
 
 
 class SolarPredictor:
@@ -60,6 +64,17 @@ class SolarPredictor:
         'winter': 12,
     }
     
+    # SCALE FIX: Model outputs ~250W peak, should be ~10kW (40x scale)
+    # The model was trained on normalized/percentage data
+    SCALE_FACTOR = 40.0
+    
+    @staticmethod
+    def default_model_path() -> Path:
+        """Default solar model location (backend/models/solar_pv_model.pkl)."""
+        # Navigate from src/ai/ to backend/models/
+        backend_dir = Path(__file__).resolve().parent.parent.parent
+        return backend_dir / "models" / "solar_pv_model.pkl"
+    
     def __init__(self, model_path=None):
         """
         Initialize the solar predictor.
@@ -68,21 +83,33 @@ class SolarPredictor:
             model_path: Path to .pkl model file. If None, uses default path.
         """
         self.model = None
+        self.engine = None
         self.using_fallback = False
+        self.version = 'fallback'
+        self.failures = 0  # Model calls that raised and were answered by the fallback
         
         # Set default model path
-        if model_path is None:
-            # Navigate from src/ai/ to backend/models/
-            current_file = Path(__file__).resolve()
-            backend_dir = current_file.parent.parent.parent
-            model_path = backend_dir / "models" / "solar_pv_model.pkl"
-        else:
-            model_path = Path(model_path)
+        model_path = Path(model_path) if model_path is not None else self.default_model_path()
+        
+        # Shared mode: memory-map the flattened model (no private copy)
+        if shared_models_enabled():
+            self.engine = load_shared_engine(model_path, FEATURES)
         
         # Try to load the model
-        if ML_AVAILABLE:
+        if self.engine is not None:
+            self.version = artifact_version(model_path)
+            logger.info(f"✅ Solar model memory-mapped from artifact cache ({model_path.name})")
+        elif ML_AVAILABLE:
             try:
+                if not model_path.exists():
+                    raise FileNotFoundError(f"No such file: '{model_path}'")
+                import joblib
+
                 self.model = joblib.load(model_path)
+                # Artifact version (changes whenever the .pkl is replaced)
+                self.version = artifact_version(model_path)
+                # Flattened tree arrays for pandas/sklearn-free inference
+                self.engine = flatten_model(self.model, FEATURES)
                 logger.info(f"✅ Solar model loaded successfully from {model_path}")
                 logger.info(f"   Model accuracy: {self.ACCURACY:.1%}")
             except Exception as e:
@@ -93,6 +120,25 @@ class SolarPredictor:
             logger.warning("⚠️  ML libraries not available, using simulation fallback")
             self.using_fallback = True
     
+    def _weather_features(self, weather, season):
+        """
+        Map weather and season to the model's G(i) and T2m inputs.
+        
+        Returns:
+            Tuple of (ghi, temp)
+        """
+        # Map weather to GHI and temperature
+        ghi = self.WEATHER_TO_GHI.get(weather.lower().replace('-', '_'), 500)
+        temp = self.WEATHER_TO_TEMP.get(weather.lower().replace('-', '_'), 25)
+        
+        # Adjust temperature by season
+        if season.lower() == 'summer':
+            temp = max(temp, 30)
+        elif season.lower() == 'winter':
+            temp = min(temp, 15)
+        
+        return ghi, temp
+    
     def predict(self, hour, day, month, weather='sunny', season='summer'):
         """
         Predict solar production in kW.
@@ -107,77 +153,75 @@ class SolarPredictor:
         Returns:
             Predicted solar production in kW (float)
         """
-        # Map weather to GHI and temperature
-        ghi = self.WEATHER_TO_GHI.get(weather.lower().replace('-', '_'), 500)
-        temp = self.WEATHER_TO_TEMP.get(weather.lower().replace('-', '_'), 25)
+        return float(self.predict_batch([hour], day, month, weather, season)[0])
+    
+    def predict_batch(self, hours, day, month, weather='sunny', season='summer'):
+        """
+        Predict solar production in kW for several hours of the same day.
         
-        # Adjust temperature by season
-        if season.lower() == 'summer':
-            temp = max(temp, 30)
-        elif season.lower() == 'winter':
-            temp = min(temp, 15)
+        Builds one feature matrix and makes a single model call for the
+        whole horizon instead of one DataFrame and one call per hour.
+        
+        Args:
+            hours: Sequence of hours of day (0-23)
+            day: Day of month (1-31), or an array matching hours
+            month: Month (1-12), or an array matching hours
+            weather: Weather condition ('sunny', 'partly_cloudy', 'cloudy', 'rainy')
+            season: Season ('summer', 'winter')
+            
+        Returns:
+            NumPy array of predicted solar production in kW (one per hour)
+        """
+        hours = np.atleast_1d(np.asarray(hours, dtype=int))
+        day = np.broadcast_to(day, hours.shape)
+        month = np.broadcast_to(month, hours.shape)
+        ghi, temp = self._weather_features(weather, season)
         
         # Try AI model first
-        if self.model is not None and not self.using_fallback:
+        if (self.model is not None or self.engine is not None) and not self.using_fallback:
             try:
-                # Prepare features (must match training features)
-                features = pd.DataFrame([{
-                    'Hour': hour,
-                    'Day': day,
-                    'Month': month,
-                    'G(i)': ghi,
-                    'T2m': temp
-                }])
-                
-                # Make prediction
-                pred_watts = self.model.predict(features)[0]
-                
-                # Convert W to kW and ensure non-negative
-                pred_kw_raw = max(0, pred_watts / 1000)
-                
-                # SCALE FIX: Model outputs ~250W peak, should be ~10kW (40x scale)
-                # The model was trained on normalized/percentage data
-                SCALE_FACTOR = 40.0
-                pred_kw = pred_kw_raw * SCALE_FACTOR
+                use_engine = self.engine is not None and (
+                    self.model is None or len(hours) <= self.engine.SMALL_BATCH_ROWS
+                )
+                if use_engine:
+                    # Flattened trees: plain NumPy matrix in FEATURES order
+                    features = np.column_stack([
+                        hours, day, month,
+                        np.full(hours.shape, ghi), np.full(hours.shape, temp)
+                    ])
+                    pred_watts = self.engine.predict(features)
+                else:
+                    import pandas as pd
+
+                    # Prepare features (must match training features)
+                    features = pd.DataFrame({
+                        'Hour': hours,
+                        'Day': day,
+                        'Month': month,
+                        'G(i)': ghi,
+                        'T2m': temp
+                    })
+                    pred_watts = np.asarray(self.model.predict(features), dtype=float)
                 
-                return pred_kw
+                # Convert W to kW, ensure non-negative and rescale
+                return np.maximum(0, pred_watts / 1000) * self.SCALE_FACTOR
                 
             except Exception as e:
                 logger.error(f"AI prediction failed: {e}, using fallback")
-                return self._fallback_predict(hour, day, month, weather, season)
-        else:
-            # Use fallback simulation
-            return self._fallback_predict(hour, day, month, weather, season)
+                self.failures += 1
+        
+        # Use fallback simulation
+        return self._fallback_batch(hours, weather, season)
     
-    def _fallback_predict(self, hour, day, month, weather, season):
-        """
-        Fallback to simulation-based prediction.
+    def _fallback_batch(self, hours, weather, season):
         """
-        from src.data.models import SimulationConfig, Weather, Season, DayType
+        Fallback to the simulation profile for several hours.
         
-        # Create config for simulator
-        weather_map = {
-            'sunny': Weather.SUNNY,
-            'partly_cloudy': Weather.PARTLY_CLOUDY,
-            'cloudy': Weather.CLOUDY,
-            'rainy': Weather.RAINY,
-        }
-        season_map = {
-            'summer': Season.SUMMER,
-            'winter': Season.WINTER,
-        }
-        
-        config = SimulationConfig(
-            season=season_map.get(season.lower(), Season.SUMMER),
-            weather=weather_map.get(weather.lower().replace('-', '_'), Weather.SUNNY),
-            day_type=DayType.WEEKDAY
-        )
-        
-        # Create simulator and generate environment for specific hour
-        simulator = EnergyDataSimulator(config, seed=42)
-        env = simulator.generate_environment_for_hour(hour)
-        
-        return env.solar_kwh
+        Uses the shared, cached fallback profile (one vectorized pass per
+        season/weather) instead of building a simulator per hour.
+        """
+        solar, _ = fallback_profile(season, weather)
+        return solar[np.asarray(hours, dtype=int)]
     
     def get_feature_importance(self):
         """
@@ -1,8 +1,10 @@
 """
 Impact Analyzer for calculating environmental and financial impact.
 """
-import pandas as pd
 from typing import Dict
+
+import numpy as np
+
 from src.data.models import ImpactMetrics, SimulationResult
 from src.utils.config import (
     CO2_FACTOR, TREES_PER_TON_CO2, WATER_FACTOR, 
@@ -39,7 +41,12 @@ class ImpactAnalyzer:
             simulation_result: Complete simulation data
         """
         self.result = simulation_result
-        self.df = pd.DataFrame(simulation_result.to_dict())
+        self.columns = simulation_result.to_dict()
+    
+    @property
+    def df(self) -> "pd.DataFrame":
+        """Result columns as a DataFrame (shares the result's arrays)."""
+        return self.result.to_dataframe()
         
     def calculate_all_metrics(self) -> ImpactMetrics:
         """Calculate all impact metrics.
@@ -132,11 +139,8 @@ class ImpactAnalyzer:
         cost_with = self.result.total_cost
         
         # Cost without battery (baseline scenario)
-        cost_without = 0.0
-        for _, row in self.df.iterrows():
-            # Without battery, all consumption not met by solar comes from grid
-            grid_needed = max(0, row['consumption'] - row['solar_production'])
-            cost_without += grid_needed * row['grid_price']
+        # Without battery, all consumption not met by solar comes from grid
+        cost_without = float(np.dot(self._baseline_grid(), self.columns['grid_price']))
         
         # Calculate daily savings
         daily_savings = cost_without - cost_with
@@ -187,10 +191,7 @@ class ImpactAnalyzer:
             Dictionary with environmental metrics
         """
         # Energy saved = difference between grid usage with and without battery
-        baseline_grid = 0.0
-        for _, row in self.df.iterrows():
-            grid_needed = max(0, row['consumption'] - row['solar_production'])
-            baseline_grid += grid_needed
+        baseline_grid = float(self._baseline_grid().sum())
         
         actual_grid = self.result.total_grid_usage
         energy_saved_daily = baseline_grid - actual_grid
@@ -237,22 +238,17 @@ class ImpactAnalyzer:
             "grid_independence": round(grid_independence, 1)
         }
     
+    def _baseline_grid(self) -> np.ndarray:
+        """Grid energy per step without a battery (consumption not met by solar)."""
+        return np.maximum(0, self.columns['consumption'] - self.columns['solar_production'])
+    
     def _get_battery_throughput(self) -> float:
         """Calculate total battery charge/discharge throughput.
         
         Returns:
             Total energy throughput in kWh
         """
-        throughput = 0.0
-        prev_level = self.df['battery_level'].iloc[0] if len(self.df) > 0 else 0
-        
-        for _, row in self.df.iterrows():
-            current_level = row['battery_level']
-            change = abs(current_level - prev_level)
-            throughput += change
-            prev_level = current_level
-        
-        return throughput
+        return float(np.abs(np.diff(self.columns['battery_level'])).sum())
     
     def get_summary_dict(self) -> Dict:
         """Get all metrics as a flat dictionary for UI display.
@@ -0,0 +1,323 @@
+"""
+Representative Days - year-long studies from a few weighted days.
+
+A year of daily (solar, load, price) profiles is clustered with k-medoids.
+Each cluster is represented by its medoid, a real day of the year,
+weighted by the number of days it stands for. Year-level metrics are the
+weighted sum of the representative days' metrics, so a yearly projection
+needs k simulations (or MILP solves) instead of 365.
+
+Error bounds:
+- proxy_errors(): exact aggregation error of metrics known for every day
+  without simulating (solar, load, no-battery cost)
+- evaluate(full=True): also runs the full horizon and reports the
+  relative error of every estimated metric
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Literal, Optional, Tuple
+
+import numpy as np
+
+from src.data.models import (
+    BatterySpec, DayType, EnvironmentArrays, Season, SimulationConfig, Trajectory, Weather
+)
+from src.utils.config import steps_per_hour
+
+# Year-level metrics estimated from the representative days
+METRICS = ('cost', 'savings', 'grid_import', 'grid_export', 'solar', 'consumption')
+
+# Metrics computable for every day without simulating
+PROXY_METRICS = ('solar', 'consumption', 'baseline_cost')
+
+
+def _window(arrays: EnvironmentArrays, lo: int, hi: int) -> EnvironmentArrays:
+    """View of timesteps [lo, hi) of a horizon."""
+    return EnvironmentArrays(
+        hour=arrays.hour[lo:hi], solar_kwh=arrays.solar_kwh[lo:hi],
+        load_kwh=arrays.load_kwh[lo:hi], price=arrays.price[lo:hi],
+        dt_hours=arrays.dt_hours
+    )
+
+
+class _ArraySource:
+    """EnvironmentSource over arrays already in memory."""
+
+    seed = None
+
+    def __init__(self, arrays: EnvironmentArrays):
+        self.arrays = arrays
+
+    def iter_environment(self, n_hours: Optional[int] = None, chunk_hours: int = 24 * 7) -> Iterator[EnvironmentArrays]:
+        per_hour = steps_per_hour(self.arrays.dt_hours)
+        end = len(self.arrays) if n_hours is None else min(len(self.arrays), n_hours * per_hour)
+        step = chunk_hours * per_hour
+        for lo in range(0, end, step):
+            yield _window(self.arrays, lo, min(lo + step, end))
+
+
+def daily_features(arrays: EnvironmentArrays) -> np.ndarray:
+    """
+    One feature row per day: the solar, load and price profiles.
+
+    Each channel is divided by its standard deviation over the horizon, so
+    kWh and DZD/kWh weigh in comparably.
+
+    Args:
+        arrays: Horizon of whole days starting at midnight
+
+    Returns:
+        Array of shape (n_days, 3 * steps per day)
+    """
+    per_day = 24 * steps_per_hour(arrays.dt_hours)
+    n_days = len(arrays) // per_day
+    channels = []
+    for values in (arrays.solar_kwh, arrays.load_kwh, arrays.price):
+        days = np.asarray(values[:n_days * per_day], dtype=np.float64).reshape(n_days, per_day)
+        scale = days.std() if days.size else 0.0
+        channels.append(days / scale if scale > 0 else days)
+    return np.hstack(channels)
+
+
+def k_medoids(
+    features: np.ndarray,
+    k: int,
+    seed: Optional[int] = 0,
+    max_iter: int = 100
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cluster rows with k-medoids (k-medoids++ start, alternating updates).
+
+    Args:
+        features: One row per item
+        k: Number of clusters (capped at the number of rows)
+        seed: Random seed for the initial medoids
+        max_iter: Maximum assignment/update rounds
+
+    Returns:
+        Tuple of (medoid row indices, cluster label per row)
+    """
+    n = len(features)
+    k = min(k, n)
+    squared = (features ** 2).sum(axis=1)
+    distances = np.sqrt(np.maximum(squared[:, None] + squared[None, :] - 2 * features @ features.T, 0))
+
+    rng = np.random.default_rng(seed)
+    medoids = [int(rng.integers(n))]
+    for _ in range(1, k):
+        nearest = distances[:, medoids].min(axis=1) ** 2
+        total = nearest.sum()
+        medoids.append(int(rng.choice(n, p=nearest / total)) if total > 0 else int(np.argmax(nearest)))
+    medoids = np.array(medoids)
+
+    for _ in range(max_iter):
+        labels = np.argmin(distances[:, medoids], axis=1)
+        updated = medoids.copy()
+        for cluster in range(k):
+            members = np.flatnonzero(labels == cluster)
+            if len(members):
+                updated[cluster] = members[np.argmin(distances[np.ix_(members, members)].sum(axis=1))]
+        if np.array_equal(updated, medoids):
+            break
+        medoids = updated
+
+    return medoids, np.argmin(distances[:, medoids], axis=1)
+
+
+@dataclass
+class YearEstimate:
+    """Year-level metrics estimated from representative days.
+
+    Attributes:
+        totals: Estimated horizon total per metric (METRICS)
+        per_day: Metric value of each representative day
+        proxy_errors: Relative aggregation error of PROXY_METRICS
+        full_totals: Totals of the full run, if it was run
+    """
+    totals: Dict[str, float]
+    per_day: Dict[str, np.ndarray]
+    proxy_errors: Dict[str, float]
+    full_totals: Optional[Dict[str, float]] = None
+
+    @property
+    def errors(self) -> Optional[Dict[str, float]]:
+        """Relative error of each estimated total against the full run."""
+        if self.full_totals is None:
+            return None
+        return {
+            name: (self.totals[name] - full) / abs(full) if full else 0.0
+            for name, full in self.full_totals.items()
+        }
+
+
+def _totals(trajectory: Trajectory, start: int = 0) -> Dict[str, float]:
+    """METRICS totals over timesteps [start:] of a run (unrounded)."""
+    steps = slice(start, None)
+    cost = trajectory.cost[steps]
+    return {
+        'cost': float(cost.sum()),
+        'savings': float((trajectory.baseline_cost()[steps] - cost).sum()),
+        'grid_import': float(trajectory.grid_import[steps].sum()),
+        'grid_export': float(trajectory.grid_export[steps].sum()),
+        'solar': float(trajectory.solar_kwh[steps].sum()),
+        'consumption': float(trajectory.load_kwh[steps].sum())
+    }
+
+
+@dataclass
+class RepresentativeDays:
+    """Weighted representative days of a horizon.
+
+    Attributes:
+        arrays: The full horizon
+        days: Day index (since the start) of each representative day, ascending
+        weights: Number of days each representative day stands for
+        labels: Representative (index into days) of every day of the horizon
+    """
+    arrays: EnvironmentArrays
+    days: np.ndarray
+    weights: np.ndarray
+    labels: np.ndarray
+
+    @property
+    def k(self) -> int:
+        """Number of representative days."""
+        return len(self.days)
+
+    @property
+    def n_days(self) -> int:
+        """Number of days in the horizon."""
+        return len(self.labels)
+
+    def day(self, day: int) -> EnvironmentArrays:
+        """Environment of one day of the horizon (a view)."""
+        per_day = 24 * steps_per_hour(self.arrays.dt_hours)
+        return _window(self.arrays, day * per_day, (day + 1) * per_day)
+
+    def environments(self) -> List[EnvironmentArrays]:
+        """Environment of each representative day."""
+        return [self.day(int(day)) for day in self.days]
+
+    def estimate(self, values) -> float:
+        """Horizon total from one value per representative day."""
+        return float(self.weights @ np.asarray(values, dtype=np.float64))
+
+    def proxy_errors(self) -> Dict[str, float]:
+        """Relative error of estimating PROXY_METRICS from representative days.
+
+        Returns:
+            Metric -> (estimate - exact) / exact, computed over every day
+            without simulating
+        """
+        per_day = 24 * steps_per_hour(self.arrays.dt_hours)
+        span = self.n_days * per_day
+        solar = np.asarray(self.arrays.solar_kwh[:span]).reshape(self.n_days, per_day)
+        load = np.asarray(self.arrays.load_kwh[:span]).reshape(self.n_days, per_day)
+        price = np.asarray(self.arrays.price[:span]).reshape(self.n_days, per_day)
+        daily = {
+            'solar': solar.sum(axis=1),
+            'consumption': load.sum(axis=1),
+            'baseline_cost': (np.maximum(load - solar, 0) * price).sum(axis=1)
+        }
+        errors = {}
+        for name, values in daily.items():
+            exact = values.sum()
+            errors[name] = (self.estimate(values[self.days]) - exact) / abs(exact) if exact else 0.0
+        return errors
+
+    def evaluate(
+        self,
+        mode: Literal['rule', 'milp'] = 'rule',
+        full: bool = False,
+        battery: Optional[BatterySpec] = None
+    ) -> YearEstimate:
+        """
+        Estimate horizon metrics by simulating the representative days.
+
+        Each representative day is simulated twice in a row and measured
+        on the second pass, so its battery starts from the state a run of
+        similar days settles into rather than the adapter's initial SOC.
+        The full run (full=True) is one continuous simulation of the
+        whole horizon.
+
+        Args:
+            mode: 'rule' for rule-based, 'milp' for optimization
+            full: Also run the full horizon and report errors against it
+            battery: Battery parameters (None = default BatterySpec)
+
+        Returns:
+            YearEstimate with estimated totals and error bounds
+        """
+        from src.core.hybrid_adapter import HybridSimulationAdapter
+
+        # Environment comes from the source; the config only sets the timestep
+        config = SimulationConfig(
+            season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY,
+            hours=self.n_days * 24, dt_hours=self.arrays.dt_hours,
+            battery=battery or BatterySpec()
+        )
+
+        def run(arrays: EnvironmentArrays) -> Trajectory:
+            adapter = HybridSimulationAdapter(config, mode=mode, source=_ArraySource(arrays))
+            return adapter.generate_24h_data().trajectory
+
+        per_day_steps = 24 * steps_per_hour(self.arrays.dt_hours)
+        runs = [
+            _totals(run(EnvironmentArrays.concatenate([day, day])), start=per_day_steps)
+            for day in self.environments()
+        ]
+        per_day = {name: np.array([r[name] for r in runs]) for name in METRICS}
+        full_totals = None
+        if full:
+            full_totals = _totals(run(_window(self.arrays, 0, self.n_days * per_day_steps)))
+
+        return YearEstimate(
+            totals={name: self.estimate(values) for name, values in per_day.items()},
+            per_day=per_day,
+            proxy_errors=self.proxy_errors(),
+            full_totals=full_totals
+        )
+
+
+def select_representative_days(
+    source,
+    k: int = 12,
+    seed: Optional[int] = 0
+) -> RepresentativeDays:
+    """
+    Cluster a horizon's days into k weighted representative days.
+
+    Days are consecutive 24-hour blocks from the first timestep; a
+    trailing partial day is ignored.
+
+    Args:
+        source: EnvironmentArrays, or an EnvironmentSource (e.g.
+            EnergyDataSimulator, MeterDataReplay) streamed in full
+        k: Number of representative days
+        seed: Random seed for the k-medoids start
+
+    Returns:
+        RepresentativeDays with weights summing to the number of days
+
+    Raises:
+        ValueError: If the horizon has no whole day or k < 1
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    arrays = source if isinstance(source, EnvironmentArrays) else EnvironmentArrays.concatenate(
+        list(source.iter_environment())
+    )
+    features = daily_features(arrays)
+    if len(features) == 0:
+        raise ValueError("Horizon must cover at least one whole day")
+
+    medoids, labels = k_medoids(features, k, seed)
+    order = np.argsort(medoids)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    labels = rank[labels]
+    return RepresentativeDays(
+        arrays=arrays,
+        days=medoids[order],
+        weights=np.bincount(labels, minlength=len(medoids)),
+        labels=labels
+    )
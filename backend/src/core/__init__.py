@@ -1,12 +1,17 @@
 """Core module for IntelliGrid physics and state management."""
 from src.core.battery import Battery, BatteryState
-from src.core.simulation_runner import SimulationRunner, StepResult
+from src.core.battery_fleet import BatteryFleet, FleetStep
+from src.core.plan_executor import execute_plan, execute_plans
+from src.core.simulation_runner import SimulationRunner
 from src.core.adapter import SimulationAdapter
 
 __all__ = [
     'Battery',
     'BatteryState',
+    'BatteryFleet',
+    'FleetStep',
+    'execute_plan',
+    'execute_plans',
     'SimulationRunner',
-    'StepResult',
     'SimulationAdapter'
 ]
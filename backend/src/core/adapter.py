@@ -4,15 +4,18 @@ Adapter for backward compatibility with existing dashboard.
 Provides old interface while using new clean architecture internally.
 This allows gradual migration without breaking the UI.
 """
-from typing import Optional
-import pandas as pd
+from typing import Optional, TYPE_CHECKING
 
 from src.data.models import SimulationConfig, SimulationResult
 from src.data.simulator import EnergyDataSimulator
+from src.data.environment_cache import default_environment_cache
 from src.engine.decision_engine import DecisionEngine
 from src.core.battery import Battery
 from src.core.simulation_runner import SimulationRunner
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class SimulationAdapter:
     """Adapter that provides old EnergyDataSimulator interface.
@@ -48,9 +51,9 @@ class SimulationAdapter:
         self.seed = seed
         
         # Create new architecture components
-        self._simulator = EnergyDataSimulator(config, seed)
-        self._battery = Battery(13.5, initial_soc=0.5)
-        self._engine = DecisionEngine()
+        self._simulator = EnergyDataSimulator(config, seed, cache=default_environment_cache())
+        self._battery = Battery(initial_soc=0.5, spec=config.battery)
+        self._engine = DecisionEngine(config.battery)
         self._runner = SimulationRunner(
             self._simulator,
             self._engine,
@@ -65,11 +68,10 @@ class SimulationAdapter:
         """
         return self._runner.run()
     
-    def get_dataframe(self) -> pd.DataFrame:
+    def get_dataframe(self) -> "pd.DataFrame":
         """Get simulation results as DataFrame (old interface).
         
         Returns:
             DataFrame with hourly data
         """
-        result = self.generate_24h_data()
-        return pd.DataFrame(result.to_dict())
+        return self.generate_24h_data().to_dataframe()
@@ -2,9 +2,15 @@
 Core battery physics module.
 
 Implements stateful battery model with separate charge/discharge efficiencies.
+Parameters come from a per-instance BatterySpec, so batteries with
+different specs coexist in one process.
 """
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
+
+from src.data.models import BatterySpec
+
+_DEFAULT_SPEC = BatterySpec()
 
 
 @dataclass(frozen=True)
@@ -27,39 +33,52 @@ class Battery:
     Models battery behavior with:
     - Separate charge and discharge efficiencies
     - SOC constraints (min/max)
-    - Power rate limits
+    - Power rate limits (scaled by the timestep length dt_hours)
     - Temperature-independent (for now)
     
     Attributes:
-        CHARGE_EFFICIENCY: Efficiency when charging (0.96 = 96%)
-        DISCHARGE_EFFICIENCY: Efficiency when discharging (0.96 = 96%)
-        MIN_SOC: Minimum state of charge (0.20 = 20%)
-        MAX_SOC: Maximum state of charge (0.95 = 95%)
-        MAX_CHARGE_RATE_KW: Maximum charge power in kW
-        MAX_DISCHARGE_RATE_KW: Maximum discharge power in kW
+        spec: Battery parameters (BatterySpec)
+        capacity_kwh: Maximum capacity in kWh (spec.capacity_kwh)
+        charge_kwh: Current charge in kWh
+        CHARGE_EFFICIENCY: Default charging efficiency (BatterySpec default)
+        DISCHARGE_EFFICIENCY: Default discharging efficiency
+        MIN_SOC: Default minimum state of charge
+        MAX_SOC: Default maximum state of charge
+        MAX_CHARGE_RATE_KW: Default maximum charge power in kW
+        MAX_DISCHARGE_RATE_KW: Default maximum discharge power in kW
     """
     
-    CHARGE_EFFICIENCY = 0.96
-    DISCHARGE_EFFICIENCY = 0.96
-    MIN_SOC = 0.20
-    MAX_SOC = 0.95
-    MAX_CHARGE_RATE_KW = 5.0
-    MAX_DISCHARGE_RATE_KW = 5.0
+    CHARGE_EFFICIENCY = _DEFAULT_SPEC.charge_efficiency
+    DISCHARGE_EFFICIENCY = _DEFAULT_SPEC.discharge_efficiency
+    MIN_SOC = _DEFAULT_SPEC.min_soc
+    MAX_SOC = _DEFAULT_SPEC.max_soc
+    MAX_CHARGE_RATE_KW = _DEFAULT_SPEC.max_charge_rate_kw
+    MAX_DISCHARGE_RATE_KW = _DEFAULT_SPEC.max_discharge_rate_kw
     
-    def __init__(self, capacity_kwh: float, initial_soc: float = 0.5):
+    def __init__(
+        self,
+        capacity_kwh: Optional[float] = None,
+        initial_soc: float = 0.5,
+        spec: Optional[BatterySpec] = None
+    ):
         """Initialize battery.
         
         Args:
-            capacity_kwh: Maximum capacity in kWh
+            capacity_kwh: Maximum capacity in kWh (overrides spec.capacity_kwh)
             initial_soc: Initial state of charge (0.0 to 1.0)
+            spec: Battery parameters (default: BatterySpec())
         """
-        if capacity_kwh <= 0:
-            raise ValueError("Capacity must be positive")
+        spec = spec if spec is not None else _DEFAULT_SPEC
+        if capacity_kwh is not None and capacity_kwh != spec.capacity_kwh:
+            if capacity_kwh <= 0:
+                raise ValueError("Capacity must be positive")
+            spec = replace(spec, capacity_kwh=capacity_kwh)
         if not 0.0 <= initial_soc <= 1.0:
             raise ValueError("Initial SOC must be between 0 and 1")
             
-        self.capacity_kwh = capacity_kwh
-        self.charge_kwh = capacity_kwh * initial_soc
+        self.spec = spec
+        self.capacity_kwh = spec.capacity_kwh
+        self.charge_kwh = self.capacity_kwh * initial_soc
     
     @property
     def state(self) -> BatteryState:
@@ -74,16 +93,17 @@ class Battery:
             soc=self.charge_kwh / self.capacity_kwh
         )
     
-    def charge(self, available_kwh: float) -> Tuple[float, float]:
+    def charge(self, available_kwh: float, dt_hours: float = 1.0) -> Tuple[float, float]:
         """Attempt to charge battery from available energy.
         
         Physics:
-        - Energy stored = energy_converted * CHARGE_EFFICIENCY
-        - Cannot exceed MAX_SOC
-        - Cannot exceed MAX_CHARGE_RATE_KW
+        - Energy stored = energy_converted * spec.charge_efficiency
+        - Cannot exceed spec.max_soc
+        - Cannot exceed spec.max_charge_rate_kw * dt_hours
         
         Args:
             available_kwh: Energy available for charging in kWh
+            dt_hours: Timestep length in hours (0.25 for 15 minutes)
             
         Returns:
             Tuple of (energy_consumed, energy_stored) in kWh
@@ -92,34 +112,35 @@ class Battery:
             return 0.0, 0.0
         
         # Calculate maximum energy we can convert to stay under MAX_SOC
-        max_storable = (self.MAX_SOC * self.capacity_kwh) - self.charge_kwh
-        max_convertible = max_storable / self.CHARGE_EFFICIENCY
+        max_storable = (self.spec.max_soc * self.capacity_kwh) - self.charge_kwh
+        max_convertible = max_storable / self.spec.charge_efficiency
         
         # Limit by available energy, max rate, and max convertible
         energy_to_convert = min(
             available_kwh,
             max_convertible,
-            self.MAX_CHARGE_RATE_KW
+            self.spec.max_charge_rate_kw * dt_hours
         )
         
         # Apply efficiency
-        energy_stored = energy_to_convert * self.CHARGE_EFFICIENCY
+        energy_stored = energy_to_convert * self.spec.charge_efficiency
         
         # Update state
         self.charge_kwh += energy_stored
         
         return energy_to_convert, energy_stored
     
-    def discharge(self, demand_kwh: float) -> Tuple[float, float]:
+    def discharge(self, demand_kwh: float, dt_hours: float = 1.0) -> Tuple[float, float]:
         """Attempt to discharge battery to meet demand.
         
         Physics:
-        - Energy delivered = energy_drawn * DISCHARGE_EFFICIENCY
-        - Cannot go below MIN_SOC
-        - Cannot exceed MAX_DISCHARGE_RATE_KW
+        - Energy delivered = energy_drawn * spec.discharge_efficiency
+        - Cannot go below spec.min_soc
+        - Cannot exceed spec.max_discharge_rate_kw * dt_hours
         
         Args:
             demand_kwh: Energy demand in kWh
+            dt_hours: Timestep length in hours (0.25 for 15 minutes)
             
         Returns:
             Tuple of (energy_drawn, energy_delivered) in kWh
@@ -128,20 +149,20 @@ class Battery:
             return 0.0, 0.0
         
         # Calculate maximum energy we can draw while staying above MIN_SOC
-        max_drawable = self.charge_kwh - (self.MIN_SOC * self.capacity_kwh)
+        max_drawable = self.charge_kwh - (self.spec.min_soc * self.capacity_kwh)
         
         # To deliver 'demand_kwh', we need to draw more (accounting for efficiency)
-        energy_needed = demand_kwh / self.DISCHARGE_EFFICIENCY
+        energy_needed = demand_kwh / self.spec.discharge_efficiency
         
         # Limit by demand, max rate, and max drawable
         energy_to_draw = min(
             energy_needed,
             max_drawable,
-            self.MAX_DISCHARGE_RATE_KW
+            self.spec.max_discharge_rate_kw * dt_hours
         )
         
         # Apply efficiency
-        energy_delivered = energy_to_draw * self.DISCHARGE_EFFICIENCY
+        energy_delivered = energy_to_draw * self.spec.discharge_efficiency
         
         # Update state
         self.charge_kwh -= energy_to_draw
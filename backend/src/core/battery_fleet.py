@@ -0,0 +1,248 @@
+"""
+Vectorized battery physics for fleets of batteries.
+
+BatteryFleet holds the state and parameters of many batteries as NumPy
+arrays and applies the Battery charge/discharge physics to all of them in
+one step. The arithmetic follows Battery operation for operation, so each
+element matches a scalar Battery with the same BatterySpec exactly.
+"""
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from src.core.battery import Battery, BatteryState
+from src.data.models import BatterySpec
+
+_DEFAULT_SPEC = BatterySpec()
+
+
+@dataclass(frozen=True)
+class FleetStep:
+    """Energy moved by one fleet step, one element per battery (kWh).
+
+    Attributes:
+        consumed: Energy taken in for charging
+        stored: Energy added to the batteries
+        drawn: Energy taken out of the batteries
+        delivered: Energy delivered to the loads
+    """
+    consumed: np.ndarray
+    stored: np.ndarray
+    drawn: np.ndarray
+    delivered: np.ndarray
+
+
+class BatteryFleet:
+    """Many batteries stepped together.
+
+    Parameters default to BatterySpec() and may be given per battery (any
+    array broadcastable to the fleet size), e.g. from_specs() for homes
+    with different batteries.
+
+    Attributes:
+        charge_kwh: Current charge per battery in kWh
+        capacity_kwh: Capacity per battery in kWh
+        charge_efficiency: Charging efficiency per battery
+        discharge_efficiency: Discharging efficiency per battery
+        min_soc: Minimum state of charge per battery
+        max_soc: Maximum state of charge per battery
+        max_charge_rate_kw: Charge power limit per battery in kW
+        max_discharge_rate_kw: Discharge power limit per battery in kW
+    """
+
+    def __init__(
+        self,
+        capacity_kwh,
+        initial_soc=0.5,
+        charge_efficiency=_DEFAULT_SPEC.charge_efficiency,
+        discharge_efficiency=_DEFAULT_SPEC.discharge_efficiency,
+        min_soc=_DEFAULT_SPEC.min_soc,
+        max_soc=_DEFAULT_SPEC.max_soc,
+        max_charge_rate_kw=_DEFAULT_SPEC.max_charge_rate_kw,
+        max_discharge_rate_kw=_DEFAULT_SPEC.max_discharge_rate_kw
+    ):
+        """Initialize fleet.
+
+        Args:
+            capacity_kwh: Capacity per battery in kWh (sets the fleet size)
+            initial_soc: Initial state of charge (0.0 to 1.0)
+            charge_efficiency: Charging efficiency
+            discharge_efficiency: Discharging efficiency
+            min_soc: Minimum state of charge
+            max_soc: Maximum state of charge
+            max_charge_rate_kw: Charge power limit in kW
+            max_discharge_rate_kw: Discharge power limit in kW
+
+        Raises:
+            ValueError: If a capacity is not positive or an SOC is outside [0, 1]
+        """
+        self.capacity_kwh = np.array(capacity_kwh, dtype=np.float64, ndmin=1)
+        if (self.capacity_kwh <= 0).any():
+            raise ValueError("Capacity must be positive")
+        initial_soc = self._per_battery(initial_soc)
+        if ((initial_soc < 0.0) | (initial_soc > 1.0)).any():
+            raise ValueError("Initial SOC must be between 0 and 1")
+
+        self.charge_kwh = self.capacity_kwh * initial_soc
+        self.charge_efficiency = self._per_battery(charge_efficiency)
+        self.discharge_efficiency = self._per_battery(discharge_efficiency)
+        self.min_soc = self._per_battery(min_soc)
+        self.max_soc = self._per_battery(max_soc)
+        self.max_charge_rate_kw = self._per_battery(max_charge_rate_kw)
+        self.max_discharge_rate_kw = self._per_battery(max_discharge_rate_kw)
+
+    @classmethod
+    def from_specs(cls, specs: Sequence[BatterySpec], initial_soc=0.5) -> 'BatteryFleet':
+        """Fleet of batteries with (possibly different) specs.
+
+        Args:
+            specs: One BatterySpec per battery
+            initial_soc: Initial state of charge, scalar or per battery
+
+        Returns:
+            BatteryFleet with one element per spec
+        """
+        return cls(
+            [spec.capacity_kwh for spec in specs],
+            initial_soc=initial_soc,
+            charge_efficiency=[spec.charge_efficiency for spec in specs],
+            discharge_efficiency=[spec.discharge_efficiency for spec in specs],
+            min_soc=[spec.min_soc for spec in specs],
+            max_soc=[spec.max_soc for spec in specs],
+            max_charge_rate_kw=[spec.max_charge_rate_kw for spec in specs],
+            max_discharge_rate_kw=[spec.max_discharge_rate_kw for spec in specs]
+        )
+
+    @classmethod
+    def from_batteries(cls, batteries: Sequence[Battery]) -> 'BatteryFleet':
+        """Fleet with the state and specs of scalar batteries.
+
+        Args:
+            batteries: Battery instances
+
+        Returns:
+            BatteryFleet with one element per battery
+        """
+        fleet = cls.from_specs([b.spec for b in batteries])
+        fleet.charge_kwh = np.array([b.charge_kwh for b in batteries], dtype=np.float64)
+        return fleet
+
+    def _per_battery(self, values) -> np.ndarray:
+        """Broadcast a parameter to one float per battery (a new array)."""
+        return np.broadcast_to(np.asarray(values, dtype=np.float64), self.capacity_kwh.shape).copy()
+
+    def __len__(self) -> int:
+        return len(self.capacity_kwh)
+
+    @property
+    def soc(self) -> np.ndarray:
+        """State of charge per battery (0.0 to 1.0)."""
+        return self.charge_kwh / self.capacity_kwh
+
+    def state(self, index: int) -> BatteryState:
+        """Snapshot of one battery.
+
+        Args:
+            index: Battery index
+
+        Returns:
+            BatteryState of that battery
+        """
+        return BatteryState(
+            charge_kwh=float(self.charge_kwh[index]),
+            capacity_kwh=float(self.capacity_kwh[index]),
+            soc=float(self.charge_kwh[index] / self.capacity_kwh[index])
+        )
+
+    def states(self) -> List[BatteryState]:
+        """Snapshot of every battery."""
+        return [self.state(i) for i in range(len(self))]
+
+    def charge(self, available_kwh, dt_hours=1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Charge every battery from its available energy (Battery.charge).
+
+        Args:
+            available_kwh: Energy available per battery in kWh (<= 0: no-op)
+            dt_hours: Timestep length in hours (scalar or per battery)
+
+        Returns:
+            Tuple of (energy_consumed, energy_stored) arrays in kWh
+        """
+        available_kwh = np.asarray(available_kwh, dtype=np.float64)
+        active = available_kwh > 0
+
+        # Maximum energy convertible while staying under max_soc
+        max_storable = (self.max_soc * self.capacity_kwh) - self.charge_kwh
+        max_convertible = max_storable / self.charge_efficiency
+
+        # Limit by available energy, max rate, and max convertible
+        energy_to_convert = np.minimum(
+            np.minimum(available_kwh, max_convertible),
+            self.max_charge_rate_kw * dt_hours
+        )
+        energy_to_convert = np.where(active, energy_to_convert, 0.0)
+        energy_stored = energy_to_convert * self.charge_efficiency
+
+        self.charge_kwh += energy_stored
+        return energy_to_convert, energy_stored
+
+    def discharge(self, demand_kwh, dt_hours=1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Discharge every battery to meet its demand (Battery.discharge).
+
+        Args:
+            demand_kwh: Energy demand per battery in kWh (<= 0: no-op)
+            dt_hours: Timestep length in hours (scalar or per battery)
+
+        Returns:
+            Tuple of (energy_drawn, energy_delivered) arrays in kWh
+        """
+        demand_kwh = np.asarray(demand_kwh, dtype=np.float64)
+        active = demand_kwh > 0
+
+        # Maximum energy drawable while staying above min_soc
+        max_drawable = self.charge_kwh - (self.min_soc * self.capacity_kwh)
+        energy_needed = demand_kwh / self.discharge_efficiency
+
+        # Limit by demand, max rate, and max drawable
+        energy_to_draw = np.minimum(
+            np.minimum(energy_needed, max_drawable),
+            self.max_discharge_rate_kw * dt_hours
+        )
+        energy_to_draw = np.where(active, energy_to_draw, 0.0)
+        energy_delivered = energy_to_draw * self.discharge_efficiency
+
+        self.charge_kwh -= energy_to_draw
+        return energy_to_draw, energy_delivered
+
+    def step(self, charge_kwh, discharge_kwh, dt_hours=1.0) -> FleetStep:
+        """Apply charge and discharge requests to every battery.
+
+        A battery with both requests charges first, then discharges (as
+        calling Battery.charge then Battery.discharge).
+
+        Args:
+            charge_kwh: Energy offered for charging per battery in kWh
+            discharge_kwh: Energy demanded from each battery in kWh
+            dt_hours: Timestep length in hours (scalar or per battery)
+
+        Returns:
+            FleetStep with consumed, stored, drawn and delivered energy
+        """
+        consumed, stored = self.charge(charge_kwh, dt_hours)
+        drawn, delivered = self.discharge(discharge_kwh, dt_hours)
+        return FleetStep(consumed=consumed, stored=stored, drawn=drawn, delivered=delivered)
+
+    def reset(self, soc=0.5) -> None:
+        """Reset every battery to a state of charge.
+
+        Args:
+            soc: State of charge (0.0 to 1.0), scalar or per battery
+
+        Raises:
+            ValueError: If an SOC is outside [0, 1]
+        """
+        soc = self._per_battery(soc)
+        if ((soc < 0.0) | (soc > 1.0)).any():
+            raise ValueError("SOC must be between 0 and 1")
+        self.charge_kwh = self.capacity_kwh * soc
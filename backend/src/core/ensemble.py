@@ -0,0 +1,249 @@
+"""
+Ensemble Runner - Monte Carlo scenario ensembles over many seeds.
+
+Runs the same SimulationConfig once per member seed and summarizes the
+spread of outcomes as percentile bands:
+
+- Member seeds are spawned from one numpy.random.SeedSequence, so the
+  members draw from independent streams.
+- Members are fanned out over a process pool in contiguous batches and
+  gathered in member order. Each member only depends on its own seed, so
+  results are bitwise identical for any number of workers.
+- With a WeatherMarkovChain, every member also gets its own daily weather
+  path, sampled for all members in one call.
+"""
+import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.data.models import SimulationConfig
+from src.data.weather_chain import WeatherMarkovChain, to_weather
+from src.core.hybrid_adapter import HybridSimulationAdapter
+from src.utils.config import get_season_for_month
+
+# Trajectories recorded per member, one value per timestep
+TRAJECTORIES = ('soc', 'cost', 'grid_import')
+
+DEFAULT_PERCENTILES = (10, 50, 90)
+
+
+def spawn_seeds(n_runs: int, seed: Optional[int] = None) -> np.ndarray:
+    """Independent member seeds spawned from one SeedSequence.
+
+    Args:
+        n_runs: Number of members
+        seed: Root entropy (None draws fresh entropy from the OS)
+
+    Returns:
+        Array of n_runs uint64 seeds; member i reproduces on its own as a
+        simulation with seed int(seeds[i])
+    """
+    children = np.random.SeedSequence(seed).spawn(n_runs)
+    return np.array([child.generate_state(1, np.uint64)[0] for child in children], dtype=np.uint64)
+
+
+def _run_members(
+    configs: Sequence[SimulationConfig],
+    mode: str,
+    seeds: Sequence[int]
+) -> Dict[str, np.ndarray]:
+    """Run a batch of members (pool worker entry point).
+
+    Args:
+        configs: Simulation configuration of each member
+        mode: 'rule' or 'milp'
+        seeds: Member seeds
+
+    Returns:
+        Dictionary of (members, timesteps) trajectory arrays
+    """
+    out = {name: [] for name in TRAJECTORIES}
+    for config, seed in zip(configs, seeds):
+        trajectory = HybridSimulationAdapter(config, seed=int(seed), mode=mode).generate_24h_data().trajectory
+        out['soc'].append(trajectory.soc)
+        out['cost'].append(trajectory.cost)
+        out['grid_import'].append(trajectory.grid_import)
+    return {name: np.array(values, dtype=np.float64) for name, values in out.items()}
+
+
+@dataclass
+class EnsembleResult:
+    """Per-member trajectories of a Monte Carlo ensemble.
+
+    Attributes:
+        seeds: Member seeds, in member order
+        soc: Battery SOC per member and timestep
+        cost: Cost in DZD per member and timestep
+        grid_import: Grid import in kWh per member and timestep
+        percentiles: Percentiles reported by bands() and summary()
+        weather: Daily weather state indices per member (WEATHER_STATES
+            order), if sampled from a weather chain
+    """
+    seeds: np.ndarray
+    soc: np.ndarray
+    cost: np.ndarray
+    grid_import: np.ndarray
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    weather: Optional[np.ndarray] = None
+
+    @property
+    def n_runs(self) -> int:
+        """Number of ensemble members."""
+        return len(self.seeds)
+
+    @property
+    def total_cost(self) -> np.ndarray:
+        """Total cost per member in DZD."""
+        return self.cost.sum(axis=1)
+
+    @property
+    def total_grid_import(self) -> np.ndarray:
+        """Total grid import per member in kWh."""
+        return self.grid_import.sum(axis=1)
+
+    def bands(self, name: str) -> Dict[str, np.ndarray]:
+        """Percentile bands of a trajectory across members.
+
+        Args:
+            name: 'soc', 'cost', 'grid_import' or 'cumulative_cost'
+
+        Returns:
+            Dictionary like {'p10': ..., 'p50': ..., 'p90': ...}, one value
+            per timestep
+        """
+        if name == 'cumulative_cost':
+            values = np.cumsum(self.cost, axis=1)
+        elif name in TRAJECTORIES:
+            values = getattr(self, name)
+        else:
+            raise ValueError(f"Unknown trajectory: {name}")
+
+        bands = np.percentile(values, self.percentiles, axis=0)
+        return {f"p{p:g}": band for p, band in zip(self.percentiles, bands)}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Percentiles of the per-member totals.
+
+        Returns:
+            Dictionary with 'total_cost', 'total_grid_import' and
+            'final_soc', each mapping percentile names to values
+        """
+        totals = {
+            'total_cost': self.total_cost,
+            'total_grid_import': self.total_grid_import,
+            'final_soc': self.soc[:, -1]
+        }
+        return {
+            name: {
+                f"p{p:g}": float(v)
+                for p, v in zip(self.percentiles, np.percentile(values, self.percentiles))
+            }
+            for name, values in totals.items()
+        }
+
+
+class EnsembleRunner:
+    """Runs one configuration over many independent seeds.
+
+    Each member is a full simulation (HybridSimulationAdapter) with its
+    own seed, and with a weather chain its own daily weather path. Members
+    are batched across a process pool; with a single worker they run
+    in-process.
+    """
+
+    # Batches per worker (more batches balance load, fewer cut overhead)
+    BATCHES_PER_WORKER = 4
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        mode: Literal['rule', 'milp'] = 'rule',
+        workers: Optional[int] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        weather_chain: Optional[WeatherMarkovChain] = None
+    ):
+        """Initialize ensemble runner.
+
+        Args:
+            config: Simulation configuration shared by all members
+            mode: 'rule' for rule-based, 'milp' for optimization
+            workers: Worker processes (default: CPU count; 1 runs in-process)
+            percentiles: Percentiles reported for the ensemble
+            weather_chain: Samples a weather path per member, starting
+                from config.weather (None keeps config.weather every day)
+        """
+        self.config = config
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.percentiles = tuple(percentiles)
+        self.weather_chain = weather_chain
+
+    def run(self, n_runs: int, seed: Optional[int] = None) -> EnsembleResult:
+        """Run the ensemble.
+
+        Args:
+            n_runs: Number of members
+            seed: Root seed; the same seed gives bitwise identical results
+                for any number of workers
+
+        Returns:
+            EnsembleResult with per-member trajectories
+        """
+        if n_runs < 1:
+            raise ValueError("n_runs must be at least 1")
+
+        root = np.random.SeedSequence(seed)
+        seeds = spawn_seeds(n_runs, root.entropy)
+        configs = [self.config] * n_runs
+        weather = None
+        if self.weather_chain is not None:
+            weather = self._sample_weather(n_runs, root.entropy)
+            configs = [replace(self.config, weather_path=tuple(path)) for path in to_weather(weather)]
+
+        bounds = self._batches(n_runs)
+        config_batches = [configs[lo:hi] for lo, hi in bounds]
+        seed_batches = [seeds[lo:hi] for lo, hi in bounds]
+
+        if self.workers == 1 or len(bounds) == 1:
+            parts = [
+                _run_members(batch, self.mode, batch_seeds)
+                for batch, batch_seeds in zip(config_batches, seed_batches)
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(bounds))) as pool:
+                parts = list(pool.map(
+                    _run_members,
+                    config_batches,
+                    [self.mode] * len(bounds),
+                    seed_batches
+                ))
+
+        return EnsembleResult(
+            seeds=seeds,
+            percentiles=self.percentiles,
+            weather=weather,
+            **{name: np.concatenate([part[name] for part in parts]) for name in TRAJECTORIES}
+        )
+
+    def _sample_weather(self, n_runs: int, seed: int) -> np.ndarray:
+        """Daily weather paths for every member in one call."""
+        n_days = -(-self.config.hours // 24)
+        start = self.config.start_date
+        if start is None:
+            seasons = self.config.season.value
+        else:
+            seasons = [
+                get_season_for_month((start + datetime.timedelta(days=day)).month)
+                for day in range(n_days)
+            ]
+        return self.weather_chain.sample(n_runs, n_days, seasons, initial=self.config.weather, seed=seed)
+
+    def _batches(self, n_runs: int) -> List[Tuple[int, int]]:
+        """Split members into contiguous (start, end) batches, in member order."""
+        n_batches = min(n_runs, self.workers * self.BATCHES_PER_WORKER)
+        edges = np.linspace(0, n_runs, n_batches + 1).astype(int)
+        return [(int(lo), int(hi)) for lo, hi in zip(edges[:-1], edges[1:]) if hi > lo]
@@ -3,16 +3,20 @@ Hybrid Simulation Adapter supporting both rule-based and MILP optimization.
 
 Allows easy comparison between rule-based and MILP approaches.
 """
-from typing import Optional, Literal
-import pandas as pd
+from typing import Optional, Literal, TYPE_CHECKING
 
-from src.data.models import SimulationConfig, SimulationResult
+from src.data.models import SimulationConfig, SimulationResult, EnvironmentSource, Trajectory
 from src.data.simulator import EnergyDataSimulator
+from src.data.environment_cache import default_environment_cache
 from src.engine.decision_engine import DecisionEngine
 from src.engine.milp_engine import MILPDecisionEngine
 from src.core.battery import Battery
+from src.core.plan_executor import accumulate, execute_plan
 from src.core.simulation_runner import SimulationRunner
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class HybridSimulationAdapter:
     """Adapter supporting both rule-based and MILP optimization.
@@ -25,17 +29,25 @@ class HybridSimulationAdapter:
         adapter = HybridSimulationAdapter(config, seed=42, mode='milp')
         result = adapter.generate_24h_data()
     
+    Horizons longer than a day (config.hours) run rule-based decisions
+    hour by hour, and MILP as one optimization per day (MILP_WINDOW_HOURS)
+    starting from the battery state the previous day ended with.
+    
     Attributes:
         config: Simulation configuration
         seed: Random seed for reproducibility
         mode: 'rule' or 'milp'
     """
     
+    # Hours optimized together by MILP (24 / config.dt_hours timesteps)
+    MILP_WINDOW_HOURS = 24
+    
     def __init__(
         self,
         config: SimulationConfig,
         seed: Optional[int] = None,
-        mode: Literal['rule', 'milp'] = 'rule'
+        mode: Literal['rule', 'milp'] = 'rule',
+        source: Optional[EnvironmentSource] = None
     ):
         """Initialize adapter.
         
@@ -43,20 +55,26 @@ class HybridSimulationAdapter:
             config: Simulation configuration
             seed: Random seed for reproducibility
             mode: 'rule' for rule-based, 'milp' for optimization
+            source: Environment source to run on instead of a simulator
+                built from config (e.g. MeterDataReplay)
         """
         self.config = config
         self.seed = seed
         self.mode = mode
+        self._dt_hours = config.dt_hours
         
         # Create simulator (same for both modes)
-        self._simulator = EnergyDataSimulator(config, seed)
+        if source is not None:
+            self._simulator = source
+        else:
+            self._simulator = EnergyDataSimulator(config, seed, cache=default_environment_cache())
         
         # Create battery (same for both modes)
-        self._battery = Battery(13.5, initial_soc=0.5)
+        self._battery = Battery(initial_soc=0.5, spec=config.battery)
         
         # Create appropriate engine
         if mode == 'rule':
-            self._engine = DecisionEngine()
+            self._engine = DecisionEngine(config.battery)
         else:  # milp
             self._engine = MILPDecisionEngine()
         
@@ -69,7 +87,7 @@ class HybridSimulationAdapter:
             )
     
     def generate_24h_data(self) -> SimulationResult:
-        """Generate complete 24-hour simulation.
+        """Generate complete simulation over config.hours (24 by default).
         
         Returns:
             SimulationResult with hourly data
@@ -84,94 +102,37 @@ class HybridSimulationAdapter:
     def _run_milp_simulation(self) -> SimulationResult:
         """Run simulation using MILP optimization.
         
-        MILP optimizes the full 24-hour schedule at once, then
-        we apply it hour by hour with the battery physics.
+        MILP optimizes each window's schedule (one day) at once, then
+        plan_executor.execute_plan applies it with the battery physics.
+        The next window starts from the resulting battery state.
         
         Returns:
             SimulationResult
         """
-        from src.data.models import HourlyData
-        from src.utils.config import GRID_EXPORT_PRICE
-        
-        # Generate environment for all 24 hours
-        environments = self._simulator.generate_24h_environment()
-        
-        # Get optimal schedule from MILP
-        initial_battery = self._battery.state
-        actions = self._engine.optimize_schedule(environments, initial_battery)
-        
-        # Execute schedule with physics
         result = SimulationResult()
         result.seed = self.seed
+        parts = []
         
-        for t, (env, action) in enumerate(zip(environments, actions)):
-            # Apply action
-            grid_import, grid_export = self._apply_action(action, env)
-            
-            # Calculate cost
-            cost = (grid_import * env.price) - (grid_export * GRID_EXPORT_PRICE)
-            
-            # Calculate baseline cost (no battery)
-            baseline_grid = max(0, env.load_kwh - env.solar_kwh)
-            baseline_cost = baseline_grid * env.price
-            savings = baseline_cost - cost
+        for window in self._simulator.iter_environment(chunk_hours=self.MILP_WINDOW_HOURS):
+            self._dt_hours = window.dt_hours
             
-            # Create hourly data
-            hourly = HourlyData(
-                hour=env.hour,
-                solar_production=round(env.solar_kwh, 2),
-                consumption=round(env.load_kwh, 2),
-                battery_level=round(self._battery.state.charge_kwh, 2),
-                battery_soc=round(self._battery.state.soc, 2),
-                grid_usage=round(grid_import, 2),
-                grid_export=round(grid_export, 2),
-                net_energy=round(env.solar_kwh - env.load_kwh, 2),
-                action=action,
-                grid_price=env.price,
-                cost=round(cost, 3),
-                savings=round(savings, 3)
+            # Get optimal schedule from MILP (prices straight from the arrays)
+            actions = self._engine.optimize_schedule(
+                window, self._battery.state, self._dt_hours, spec=self._battery.spec
             )
             
-            result.hourly_data.append(hourly)
-            result.total_solar += env.solar_kwh
-            result.total_consumption += env.load_kwh
-            result.total_grid_usage += grid_import
-            result.total_grid_export += grid_export
-            result.total_cost += cost
-            result.total_savings += savings
+            # Execute schedule with physics
+            trajectory = execute_plan(window, actions, self._battery)
+            parts.append(trajectory)
+            accumulate(result, trajectory)
         
+        if parts:
+            result.trajectory = Trajectory.concatenate(parts)
         return result
     
-    def _apply_action(self, action, env):
-        """Apply action and return grid import/export."""
-        net = env.solar_kwh - env.load_kwh
-        
-        if action.value == 'charge_battery':
-            if net > 0:
-                self._battery.charge(net)
-            return 0.0, 0.0
-        elif action.value == 'discharge_battery':
-            if net < 0:
-                demand = abs(net)
-                drawn, delivered = self._battery.discharge(demand)
-                remaining = demand - delivered
-                return remaining, 0.0
-            return 0.0, 0.0
-        elif action.value == 'sell_to_grid':
-            if net > 0:
-                return 0.0, net
-            return 0.0, 0.0
-        elif action.value == 'use_grid':
-            if net < 0:
-                return abs(net), 0.0
-            return 0.0, 0.0
-        else:
-            return 0.0, 0.0
-    
-    def get_dataframe(self) -> pd.DataFrame:
+    def get_dataframe(self) -> "pd.DataFrame":
         """Get simulation results as DataFrame."""
-        result = self.generate_24h_data()
-        return pd.DataFrame(result.to_dict())
+        return self.generate_24h_data().to_dataframe()
     
     def compare_modes(self) -> dict:
         """Compare rule-based vs MILP performance.
@@ -0,0 +1,217 @@
+"""
+Plan execution: battery physics and cost accounting for action schedules.
+
+Every engine ends up here. The rule-based runner decides one step at a
+time and applies each decision with apply_action(); the MILP path solves
+a whole window and hands the schedule to execute_plan(). Both finish
+with settle(), which computes SOC and cost for the recorded steps, and
+accumulate(), which adds a trajectory to a SimulationResult's totals.
+
+execute_plans() is the batched form: many schedules (e.g. candidate
+plans or many homes) stepped together on a BatteryFleet, with results
+bitwise equal to executing each plan on its own Battery.
+"""
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+from src.core.battery import Battery
+from src.core.battery_fleet import BatteryFleet
+from src.data.models import (
+    Action, ACTION_CODES, EnvironmentArrays, SimulationResult, Trajectory
+)
+from src.utils.config import GRID_EXPORT_PRICE
+
+CHARGE = ACTION_CODES[Action.CHARGE_BATTERY]
+DISCHARGE = ACTION_CODES[Action.DISCHARGE_BATTERY]
+SELL = ACTION_CODES[Action.SELL_TO_GRID]
+USE_GRID = ACTION_CODES[Action.USE_GRID]
+
+Actions = Union[Sequence[Action], np.ndarray]
+
+
+def action_codes(actions: Actions) -> np.ndarray:
+    """Action codes (Trajectory.action) for Actions or codes."""
+    if isinstance(actions, np.ndarray) and actions.dtype.kind in 'iu':
+        return actions.astype(np.int8, copy=False)
+    return np.array([ACTION_CODES[action] for action in actions], dtype=np.int8)
+
+
+def apply_action(battery: Battery, code: int, net: float, dt_hours: float = 1.0) -> Tuple[float, float]:
+    """Apply one action to a battery and return the grid exchange.
+
+    Args:
+        battery: Battery to charge or discharge (mutated)
+        code: Action code (ACTION_CODES)
+        net: Solar minus load for the step in kWh
+        dt_hours: Timestep length in hours
+
+    Returns:
+        Tuple of (grid_import, grid_export) in kWh
+    """
+    if code == CHARGE:
+        # Charge from solar surplus
+        if net > 0:
+            battery.charge(net, dt_hours)
+        return 0.0, 0.0
+
+    elif code == DISCHARGE:
+        # Discharge to meet deficit, import what the battery couldn't cover
+        if net < 0:
+            demand = abs(net)
+            drawn, delivered = battery.discharge(demand, dt_hours)
+            return demand - delivered, 0.0
+        return 0.0, 0.0
+
+    elif code == SELL:
+        # Export solar surplus
+        if net > 0:
+            return 0.0, net
+        return 0.0, 0.0
+
+    elif code == USE_GRID:
+        # Import to meet deficit
+        if net < 0:
+            return abs(net), 0.0
+        return 0.0, 0.0
+
+    else:  # IDLE
+        return 0.0, 0.0
+
+
+def settle(out: Trajectory, capacity_kwh) -> Trajectory:
+    """Fill SOC and cost once charge, import and export are recorded.
+
+    Args:
+        out: Trajectory with charge_kwh, grid_import and grid_export set
+        capacity_kwh: Battery capacity (scalar, or per row of a batch)
+
+    Returns:
+        out, with soc and cost filled
+    """
+    np.divide(out.charge_kwh, capacity_kwh, out=out.soc)
+    out.cost[...] = (out.grid_import * out.price) - (out.grid_export * GRID_EXPORT_PRICE)
+    return out
+
+
+def execute_plan(environment: EnvironmentArrays, actions: Actions, battery: Battery) -> Trajectory:
+    """Apply an action schedule step by step with the battery physics.
+
+    Args:
+        environment: Environment data of the schedule's horizon
+        actions: One Action (or action code) per timestep
+        battery: Battery to run the plan on (mutated; its final state is
+            where the next window starts)
+
+    Returns:
+        Trajectory of the executed plan
+
+    Raises:
+        ValueError: If the schedule and environment lengths differ
+    """
+    codes = action_codes(actions)
+    if len(codes) != len(environment):
+        raise ValueError(f"Plan has {len(codes)} actions for {len(environment)} timesteps")
+
+    out = Trajectory.empty(environment)
+    out.action[:] = codes
+    dt_hours = environment.dt_hours
+    net = (environment.solar_kwh - environment.load_kwh).tolist()
+
+    for t, code in enumerate(codes.tolist()):
+        out.grid_import[t], out.grid_export[t] = apply_action(battery, code, net[t], dt_hours)
+        out.charge_kwh[t] = battery.charge_kwh
+
+    return settle(out, battery.capacity_kwh)
+
+
+def execute_plans(
+    environments: Union[EnvironmentArrays, Sequence[EnvironmentArrays]],
+    actions: np.ndarray,
+    fleet: BatteryFleet
+) -> Trajectory:
+    """Apply many action schedules at once, one fleet battery per plan.
+
+    Args:
+        environments: One EnvironmentArrays shared by all plans, or one
+            per plan (same length and timestep)
+        actions: Action codes of shape (plans, timesteps)
+        fleet: One battery per plan (mutated)
+
+    Returns:
+        Trajectory with (plans, timesteps) arrays, row i being plan i
+
+    Raises:
+        ValueError: If plans, batteries and environments do not line up
+    """
+    actions = np.asarray(actions)
+    if actions.dtype.kind not in 'iu':
+        actions = np.array([action_codes(plan) for plan in actions])
+    actions = actions.astype(np.int8, copy=False)
+    n_plans, n_steps = actions.shape
+    if len(fleet) != n_plans:
+        raise ValueError(f"{n_plans} plans for a fleet of {len(fleet)} batteries")
+
+    if isinstance(environments, EnvironmentArrays):
+        dt_hours = environments.dt_hours
+        columns = {
+            name: np.broadcast_to(getattr(environments, name), (n_plans, len(environments)))
+            for name in ('hour', 'solar_kwh', 'load_kwh', 'price')
+        }
+    else:
+        if len(environments) != n_plans:
+            raise ValueError(f"{n_plans} plans for {len(environments)} environments")
+        dt_hours = environments[0].dt_hours
+        columns = {
+            name: np.stack([getattr(env, name) for env in environments])
+            for name in ('hour', 'solar_kwh', 'load_kwh', 'price')
+        }
+    if columns['hour'].shape != actions.shape:
+        raise ValueError(f"Plans have {n_steps} actions for {columns['hour'].shape[1]} timesteps")
+
+    out = Trajectory(
+        **columns,
+        charge_kwh=np.empty((n_plans, n_steps)),
+        soc=np.empty((n_plans, n_steps)),
+        grid_import=np.empty((n_plans, n_steps)),
+        grid_export=np.empty((n_plans, n_steps)),
+        cost=np.empty((n_plans, n_steps)),
+        action=actions
+    )
+    net = columns['solar_kwh'] - columns['load_kwh']
+
+    for t in range(n_steps):
+        code, surplus = actions[:, t], net[:, t]
+        charging = (code == CHARGE) & (surplus > 0)
+        discharging = (code == DISCHARGE) & (surplus < 0)
+        demand = np.abs(surplus)
+
+        fleet.charge(np.where(charging, surplus, 0.0), dt_hours)
+        _, delivered = fleet.discharge(np.where(discharging, demand, 0.0), dt_hours)
+
+        out.grid_import[:, t] = np.where(
+            discharging, demand - delivered,
+            np.where((code == USE_GRID) & (surplus < 0), demand, 0.0)
+        )
+        out.grid_export[:, t] = np.where((code == SELL) & (surplus > 0), surplus, 0.0)
+        out.charge_kwh[:, t] = fleet.charge_kwh
+
+    return settle(out, fleet.capacity_kwh[:, None])
+
+
+def accumulate(result: SimulationResult, trajectory: Trajectory) -> None:
+    """Add a trajectory's energy, cost and savings to a result's totals.
+
+    Savings are against the same steps without a battery (all deficit
+    imported at the step price, no export).
+
+    Args:
+        result: Result to update
+        trajectory: Executed steps (one plan)
+    """
+    result.total_solar += float(trajectory.solar_kwh.sum())
+    result.total_consumption += float(trajectory.load_kwh.sum())
+    result.total_grid_usage += float(trajectory.grid_import.sum())
+    result.total_grid_export += float(trajectory.grid_export.sum())
+    result.total_cost += float(trajectory.cost.sum())
+    result.total_savings += float((trajectory.baseline_cost() - trajectory.cost).sum())
@@ -0,0 +1,126 @@
+"""
+Columnar caches - shared I/O for converted time series.
+
+Time-series files (CSV or Parquet with a timestamp column) are parsed
+once onto a regular time grid and written as a directory of uncompressed
+.npy columns plus meta.json, which readers memory-map without parsing.
+Used by meter-data replays (replay.py) and price histories (tariff.py).
+
+Timestamps must lie on a regular grid whose step divides one hour; gaps
+are filled by linear interpolation. Timestamps are taken as local
+wall-clock time (timezone information is dropped).
+"""
+import datetime
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.utils.config import steps_per_hour
+
+logger = logging.getLogger(__name__)
+
+TimeLike = Union[datetime.datetime, datetime.date, str]
+
+
+def as_datetime(value: TimeLike) -> datetime.datetime:
+    """Parse a date, datetime or ISO string into a naive datetime."""
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    elif not isinstance(value, datetime.datetime):
+        value = datetime.datetime.combine(value, datetime.time())
+    return value.replace(tzinfo=None)
+
+
+def read_regular_frame(
+    source,
+    timestamp_col: str,
+    required: Sequence[str],
+    optional: Sequence[str] = ()
+) -> Tuple['pd.DataFrame', float, int]:
+    """
+    Parse a time-series file onto its regular time grid.
+
+    Reading Parquet needs pyarrow (or fastparquet) installed.
+
+    Args:
+        source: CSV or Parquet (.parquet/.pq) file
+        timestamp_col: Name of the timestamp column
+        required: Value columns that must be present
+        optional: Value columns kept if present
+
+    Returns:
+        Tuple of (frame indexed by the full grid with numeric, gap-filled
+        value columns, timestep in hours, number of filled steps)
+
+    Raises:
+        ValueError: If columns are missing or timestamps are irregular
+    """
+    import pandas as pd  # Deferred: only conversion parses files
+
+    source = Path(source)
+    if source.suffix.lower() in ('.parquet', '.pq'):
+        frame = pd.read_parquet(source)
+    else:
+        frame = pd.read_csv(source)
+
+    missing = [col for col in (timestamp_col, *required) if col not in frame.columns]
+    if missing:
+        raise ValueError(f"{source.name} is missing columns: {missing}")
+
+    times = pd.to_datetime(frame[timestamp_col])
+    if times.dt.tz is not None:
+        times = times.dt.tz_localize(None)
+    frame = frame.set_index(pd.DatetimeIndex(times)).sort_index()
+    frame = frame[~frame.index.duplicated(keep='last')]
+    if len(frame) < 2:
+        raise ValueError(f"{source.name} needs at least two readings")
+
+    # Resolution is the smallest interval; everything must sit on that grid
+    step = frame.index.to_series().diff().min()
+    dt_hours = step / pd.Timedelta(hours=1)
+    steps_per_hour(dt_hours)
+    grid = pd.date_range(frame.index[0], frame.index[-1], freq=step)
+    if not frame.index.isin(grid).all():
+        raise ValueError(f"{source.name} timestamps are not on a regular {step} grid")
+
+    frame = frame.reindex(grid)
+    filled = int(frame[list(required)].isna().any(axis=1).sum())
+    if filled:
+        logger.warning(f"⚠️  {source.name}: interpolated {filled} missing readings")
+
+    values = {
+        name: pd.to_numeric(frame[name], errors='coerce').interpolate(limit_direction='both')
+        for name in (*required, *optional) if name in frame.columns
+    }
+    return pd.DataFrame(values, index=grid), float(dt_hours), filled
+
+
+def write_column_cache(output, columns: Dict[str, np.ndarray], meta: dict) -> Path:
+    """
+    Atomically write a columnar cache directory.
+
+    Args:
+        output: Destination directory (replaced if it exists)
+        columns: Column name -> 1-D array, one .npy file each
+        meta: JSON-serializable metadata written to meta.json
+
+    Returns:
+        Path to the written directory
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = output.with_name(f"{output.name}.tmp-{os.getpid()}")
+    tmp_dir.mkdir()
+    for name, values in columns.items():
+        np.save(tmp_dir / f"{name}.npy", np.ascontiguousarray(values))
+    (tmp_dir / "meta.json").write_text(json.dumps(meta))
+
+    if output.exists():
+        shutil.rmtree(output)
+    os.replace(tmp_dir, output)
+    return output
@@ -0,0 +1,205 @@
+"""
+Environment Cache - Generated environments keyed by their inputs.
+
+A chunk of environment data is a pure function of the scenario (season,
+weather, day type, calendar, timestep), the seed, whether AI is used,
+the model artifact version and the chunk's position (see counter_rng.py).
+The cache hashes those inputs into a key and stores the chunk:
+
+- Memory tier: LRU of read-only EnvironmentArrays, shared in-process.
+- Disk tier (optional): one uncompressed .npz per key, shared across
+  workers and restarts. Entries are never rewritten, only added.
+
+Unseeded simulators draw fresh entropy and are never cached.
+
+Configure with:
+    INTELLIGRID_ENV_CACHE_SIZE=512        # memory entries (0 disables)
+    INTELLIGRID_ENV_CACHE_DIR=/var/cache/intelligrid/env   # disk tier
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from src.data.models import EnvironmentArrays
+
+logger = logging.getLogger(__name__)
+
+# Default memory tier size (a 24-hour chunk is about 1 KB)
+DEFAULT_MAX_ENTRIES = 512
+
+# Bumped whenever generation changes, so stale disk entries are ignored
+FORMAT_VERSION = 1
+
+_FIELDS = ('hour', 'solar_kwh', 'load_kwh', 'price')
+
+
+def environment_key(**inputs: Any) -> str:
+    """Content hash of the inputs that determine a generated chunk.
+
+    Args:
+        **inputs: JSON-serializable generation inputs
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps({'format': FORMAT_VERSION, **inputs}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class EnvironmentCache:
+    """Two-tier (memory LRU, optional disk) cache of EnvironmentArrays.
+
+    Thread-safe; cached arrays are read-only and shared between callers.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, directory=None):
+        """
+        Args:
+            max_entries: Memory tier capacity (0 keeps nothing in memory)
+            directory: Disk tier location (None disables the disk tier)
+        """
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, EnvironmentArrays]' = OrderedDict()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[EnvironmentArrays]:
+        """Look a chunk up in memory, then on disk.
+
+        Args:
+            key: Key from environment_key()
+
+        Returns:
+            Cached EnvironmentArrays, or None on a miss
+        """
+        with self._lock:
+            arrays = self._entries.get(key)
+            if arrays is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return arrays
+
+        arrays = self._load(key)
+        with self._lock:
+            if arrays is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._remember(key, arrays)
+        return arrays
+
+    def put(self, key: str, arrays: EnvironmentArrays) -> None:
+        """Store a generated chunk in both tiers.
+
+        Args:
+            key: Key from environment_key()
+            arrays: Generated chunk
+        """
+        with self._lock:
+            self._remember(key, arrays)
+        if self.directory is not None:
+            self._save(key, arrays)
+
+    def clear(self) -> None:
+        """Drop the memory tier and reset counters (disk entries stay)."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._disk_hits = self._misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with entries, hits, disk hits, misses and hit rate
+        """
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self._hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'hit_rate': (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+                'directory': str(self.directory) if self.directory is not None else None
+            }
+
+    def _remember(self, key: str, arrays: EnvironmentArrays) -> None:
+        """Insert into the memory tier; caller holds the lock."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = arrays
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        """Disk location of an entry (fanned out by key prefix)."""
+        return self.directory / key[:2] / f"{key}.npz"
+
+    def _load(self, key: str) -> Optional[EnvironmentArrays]:
+        """Read an entry from the disk tier, if present and readable."""
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return EnvironmentArrays(
+                    **{name: data[name] for name in _FIELDS},
+                    dt_hours=float(data['dt_hours'])
+                )
+        except Exception as e:
+            logger.warning(f"⚠️  Unreadable environment cache entry {path}: {e}")
+            return None
+
+    def _save(self, key: str, arrays: EnvironmentArrays) -> None:
+        """Write an entry to the disk tier atomically."""
+        path = self._path(key)
+        if path.exists():
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.stem}.tmp-{os.getpid()}-{threading.get_ident()}.npz")
+            np.savez(
+                tmp_path,
+                dt_hours=arrays.dt_hours,
+                **{name: getattr(arrays, name) for name in _FIELDS}
+            )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️  Failed to write environment cache entry {path}: {e}")
+
+
+_default_cache: Optional[EnvironmentCache] = None
+_default_lock = threading.Lock()
+
+
+def default_environment_cache() -> EnvironmentCache:
+    """
+    Get the process-wide environment cache.
+
+    Sized by INTELLIGRID_ENV_CACHE_SIZE, with a disk tier at
+    INTELLIGRID_ENV_CACHE_DIR if set.
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = EnvironmentCache(
+                    max_entries=int(os.environ.get('INTELLIGRID_ENV_CACHE_SIZE', DEFAULT_MAX_ENTRIES)),
+                    directory=os.environ.get('INTELLIGRID_ENV_CACHE_DIR') or None
+                )
+    return _default_cache
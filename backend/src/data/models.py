@@ -1,10 +1,20 @@
 """
 Data models and classes for IntelliGrid.
 """
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+import datetime
+import json
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional, Protocol, Sequence, Tuple
 from enum import Enum
 
+import numpy as np
+
+from src.utils.config import (
+    BATTERY_CAPACITY, BATTERY_MAX_CHARGE_RATE, BATTERY_MAX_DISCHARGE_RATE,
+    BATTERY_MIN_SOC, BATTERY_MAX_SOC
+)
+
 
 class Season(Enum):
     SUMMER = "summer"
@@ -31,6 +41,11 @@ class Action(Enum):
     IDLE = "idle"
 
 
+ACTIONS = tuple(Action)  # Action code i (Trajectory.action) is ACTIONS[i]
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+ACTION_VALUES = np.array([action.value for action in ACTIONS])
+
+
 @dataclass
 class BatteryState:
     """Represents the current state of the home battery system."""
@@ -56,14 +71,56 @@ class BatteryState:
         return self.current_charge
 
 
+@dataclass(frozen=True)
+class BatterySpec:
+    """Parameters of one battery (core physics and MILP).
+    
+    Attributes:
+        capacity_kwh: Maximum capacity in kWh
+        charge_efficiency: Efficiency when charging (0.96 = 96%)
+        discharge_efficiency: Efficiency when discharging
+        min_soc: Minimum state of charge (0.20 = 20%)
+        max_soc: Maximum state of charge (0.95 = 95%)
+        max_charge_rate_kw: Maximum charge power in kW
+        max_discharge_rate_kw: Maximum discharge power in kW
+    """
+    capacity_kwh: float = BATTERY_CAPACITY
+    charge_efficiency: float = 0.96
+    discharge_efficiency: float = 0.96
+    min_soc: float = BATTERY_MIN_SOC
+    max_soc: float = BATTERY_MAX_SOC
+    max_charge_rate_kw: float = BATTERY_MAX_CHARGE_RATE
+    max_discharge_rate_kw: float = BATTERY_MAX_DISCHARGE_RATE
+    
+    def __post_init__(self):
+        if self.capacity_kwh <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0.0 <= self.min_soc < self.max_soc <= 1.0:
+            raise ValueError("SOC bounds must satisfy 0 <= min_soc < max_soc <= 1")
+        if not (0.0 < self.charge_efficiency <= 1.0 and 0.0 < self.discharge_efficiency <= 1.0):
+            raise ValueError("Efficiencies must be in (0, 1]")
+        if self.max_charge_rate_kw < 0 or self.max_discharge_rate_kw < 0:
+            raise ValueError("Rate limits must not be negative")
+
+
 @dataclass
 class SimulationConfig:
-    """Configuration for energy simulation."""
+    """Configuration for energy simulation.
+    
+    Without start_date every day of the horizon uses season and day_type.
+    With start_date, each day's season and day type (and the AI model's
+    day/month inputs) come from the calendar instead.
+    """
     season: Season
     weather: Weather
     day_type: DayType
     tomorrow_weather: Optional[Weather] = None
     hours: int = 24
+    start_date: Optional[datetime.date] = None
+    dt_hours: float = 1.0  # Timestep length (0.25 = 15 min, 1/12 = 5 min)
+    weather_path: Optional[Tuple[Weather, ...]] = None  # Per-day weather; overrides weather
+    tariff: Optional['Tariff'] = None  # Grid prices (None: default time-of-use tariff)
+    battery: BatterySpec = field(default_factory=BatterySpec)  # Home battery parameters
 
 
 @dataclass
@@ -85,8 +142,14 @@ class HourlyData:
 
 @dataclass
 class SimulationResult:
-    """Complete results of a 24-hour simulation."""
-    hourly_data: List[HourlyData] = field(default_factory=list)
+    """Complete results of a simulation.
+    
+    Runners record steps in trajectory (NumPy arrays); hourly_data is
+    built from it on first access, so runs that only read totals or
+    arrays never create per-step HourlyData objects. to_dict() and
+    to_dataframe() are columnar views of the trajectory, and save() can
+    archive it as float32.
+    """
     total_solar: float = 0.0
     total_consumption: float = 0.0
     total_grid_usage: float = 0.0
@@ -94,23 +157,91 @@ class SimulationResult:
     total_cost: float = 0.0
     total_savings: float = 0.0
     seed: Optional[int] = None
+    trajectory: Optional['Trajectory'] = None
+    _hourly_data: Optional[List[HourlyData]] = field(default=None, repr=False)
     
-    def to_dict(self) -> Dict:
-        """Convert result to dictionary format."""
-        return {
-            "hour": [d.hour for d in self.hourly_data],
-            "solar_production": [d.solar_production for d in self.hourly_data],
-            "consumption": [d.consumption for d in self.hourly_data],
-            "battery_level": [d.battery_level for d in self.hourly_data],
-            "battery_soc": [d.battery_soc for d in self.hourly_data],
-            "grid_usage": [d.grid_usage for d in self.hourly_data],
-            "grid_export": [d.grid_export for d in self.hourly_data],
-            "net_energy": [d.net_energy for d in self.hourly_data],
-            "action": [d.action.value for d in self.hourly_data],
-            "grid_price": [d.grid_price for d in self.hourly_data],
-            "cost": [d.cost for d in self.hourly_data],
-            "savings": [d.savings for d in self.hourly_data],
-        }
+    TOTALS = ('total_solar', 'total_consumption', 'total_grid_usage',
+              'total_grid_export', 'total_cost', 'total_savings')
+    
+    @property
+    def hourly_data(self) -> List[HourlyData]:
+        """Per-step data (built from trajectory on first access)."""
+        if self._hourly_data is None:
+            self._hourly_data = self.trajectory.to_hourly_data() if self.trajectory is not None else []
+        return self._hourly_data
+    
+    def columns(self) -> 'Trajectory':
+        """Per-step data as a Trajectory (converted from hourly_data for
+        results built from HourlyData, e.g. by the impact route)."""
+        if self.trajectory is None:
+            return Trajectory.from_hourly_data(self.hourly_data)
+        return self.trajectory
+    
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Result columns as NumPy arrays, keyed like HourlyData fields.
+        
+        Stored columns are the trajectory arrays themselves (no copy);
+        net_energy, savings and the action values are computed per call.
+        Values are unrounded (HourlyData rounds for display).
+        """
+        return self.columns().to_columns()
+    
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Result columns as a DataFrame sharing the trajectory arrays."""
+        import pandas as pd
+
+        return pd.DataFrame(self.to_dict(), copy=False)
+    
+    def astype(self, dtype) -> 'SimulationResult':
+        """Copy with the trajectory's float columns stored as dtype.
+        
+        Args:
+            dtype: Float dtype, e.g. np.float32 to halve archived size
+            
+        Returns:
+            SimulationResult with the same totals
+        """
+        return replace(self, trajectory=self.columns().astype(dtype), _hourly_data=None)
+    
+    def save(self, directory, dtype=np.float32) -> Path:
+        """
+        Archive the result as a memory-mappable columnar directory.
+        
+        Args:
+            directory: Destination directory (replaced if it exists)
+            dtype: Storage dtype of the float columns (np.float64 is lossless)
+            
+        Returns:
+            Path to the written directory
+        """
+        from src.data.columnar import write_column_cache
+
+        trajectory = self.columns().astype(dtype)
+        meta = {name: getattr(self, name) for name in self.TOTALS}
+        meta['seed'] = self.seed
+        return write_column_cache(
+            directory, {name: getattr(trajectory, name) for name in Trajectory.FIELDS}, meta
+        )
+    
+    @classmethod
+    def load(cls, directory, mmap_mode: Optional[str] = 'r') -> 'SimulationResult':
+        """
+        Open a result written by save().
+        
+        Args:
+            directory: Archive directory
+            mmap_mode: np.load memory-map mode (None reads into memory)
+            
+        Returns:
+            SimulationResult over the memory-mapped columns
+        """
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text())
+        trajectory = Trajectory(**{
+            name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode)
+            for name in Trajectory.FIELDS
+        })
+        return cls(seed=meta.pop('seed'), trajectory=trajectory, **meta)
 
 
 @dataclass
@@ -176,4 +307,243 @@ class EnvironmentState:
     hour: int
     solar_kwh: float
     load_kwh: float
-    price: float
\ No newline at end of file
+    price: float
+
+
+@dataclass(frozen=True)
+class EnvironmentArrays:
+    """Environment data for a whole horizon, one NumPy array per field.
+    
+    Struct-of-arrays counterpart of a list of EnvironmentState: element i of
+    every array describes timestep i. Arrays are read-only. Indexing and
+    iteration yield EnvironmentState views for code using the list API.
+    
+    Attributes:
+        hour: Hour of day (0-23) per timestep
+        solar_kwh: Solar production in kWh per timestep
+        load_kwh: Energy consumption in kWh per timestep
+        price: Grid price in DZD/kWh per timestep
+        dt_hours: Timestep length in hours
+    """
+    hour: np.ndarray
+    solar_kwh: np.ndarray
+    load_kwh: np.ndarray
+    price: np.ndarray
+    dt_hours: float = 1.0
+    
+    def __post_init__(self):
+        for name in ('hour', 'solar_kwh', 'load_kwh', 'price'):
+            getattr(self, name).flags.writeable = False
+    
+    def __len__(self) -> int:
+        return len(self.hour)
+    
+    def __getitem__(self, index: int) -> EnvironmentState:
+        return EnvironmentState(
+            hour=int(self.hour[index]),
+            solar_kwh=float(self.solar_kwh[index]),
+            load_kwh=float(self.load_kwh[index]),
+            price=float(self.price[index])
+        )
+    
+    def __iter__(self) -> Iterator[EnvironmentState]:
+        return iter(self.to_states())
+    
+    @classmethod
+    def concatenate(cls, chunks: Sequence['EnvironmentArrays']) -> 'EnvironmentArrays':
+        """Join consecutive chunks (e.g. from EnergyDataSimulator.iter_environment)."""
+        return cls(**{
+            name: np.concatenate([getattr(chunk, name) for chunk in chunks])
+            for name in ('hour', 'solar_kwh', 'load_kwh', 'price')
+        }, dt_hours=chunks[0].dt_hours)
+    
+    def to_states(self) -> List[EnvironmentState]:
+        """Convert to a list of EnvironmentState (one per timestep)."""
+        return [
+            EnvironmentState(hour=hour, solar_kwh=solar, load_kwh=load, price=price)
+            for hour, solar, load, price in zip(
+                self.hour.tolist(), self.solar_kwh.tolist(),
+                self.load_kwh.tolist(), self.price.tolist()
+            )
+        ]
+
+
+@dataclass
+class Trajectory:
+    """Per-timestep simulation outputs, one NumPy array per field.
+    
+    Runners allocate one Trajectory per environment chunk with empty()
+    and write each step into it; the environment columns are the chunk's
+    own (read-only) arrays, not copies.
+    
+    Attributes:
+        hour: Hour of day per timestep
+        solar_kwh: Solar production in kWh per timestep
+        load_kwh: Energy consumption in kWh per timestep
+        price: Grid price in DZD/kWh per timestep
+        charge_kwh: Battery charge after the step in kWh
+        soc: Battery state of charge after the step
+        grid_import: Energy imported from grid in kWh
+        grid_export: Energy exported to grid in kWh
+        cost: Net cost of the step in DZD
+        action: Action code per timestep (ACTIONS[code])
+    """
+    hour: np.ndarray
+    solar_kwh: np.ndarray
+    load_kwh: np.ndarray
+    price: np.ndarray
+    charge_kwh: np.ndarray
+    soc: np.ndarray
+    grid_import: np.ndarray
+    grid_export: np.ndarray
+    cost: np.ndarray
+    action: np.ndarray
+    
+    FIELDS = ('hour', 'solar_kwh', 'load_kwh', 'price', 'charge_kwh', 'soc',
+              'grid_import', 'grid_export', 'cost', 'action')
+    
+    @classmethod
+    def empty(cls, environment: EnvironmentArrays) -> 'Trajectory':
+        """Uninitialized output buffers for one chunk of environment data."""
+        n = len(environment)
+        return cls(
+            hour=environment.hour,
+            solar_kwh=environment.solar_kwh,
+            load_kwh=environment.load_kwh,
+            price=environment.price,
+            charge_kwh=np.empty(n),
+            soc=np.empty(n),
+            grid_import=np.empty(n),
+            grid_export=np.empty(n),
+            cost=np.empty(n),
+            action=np.empty(n, dtype=np.int8)
+        )
+    
+    @classmethod
+    def concatenate(cls, parts: Sequence['Trajectory']) -> 'Trajectory':
+        """Join consecutive trajectories (one array copy per field)."""
+        if len(parts) == 1:
+            return parts[0]
+        return cls(**{
+            name: np.concatenate([getattr(part, name) for part in parts])
+            for name in cls.FIELDS
+        })
+    
+    @classmethod
+    def from_hourly_data(cls, hourly: Sequence[HourlyData]) -> 'Trajectory':
+        """Trajectory holding the (rounded) values of HourlyData records."""
+        return cls(
+            hour=np.array([h.hour for h in hourly], dtype=np.int64),
+            solar_kwh=np.array([h.solar_production for h in hourly], dtype=np.float64),
+            load_kwh=np.array([h.consumption for h in hourly], dtype=np.float64),
+            price=np.array([h.grid_price for h in hourly], dtype=np.float64),
+            charge_kwh=np.array([h.battery_level for h in hourly], dtype=np.float64),
+            soc=np.array([h.battery_soc for h in hourly], dtype=np.float64),
+            grid_import=np.array([h.grid_usage for h in hourly], dtype=np.float64),
+            grid_export=np.array([h.grid_export for h in hourly], dtype=np.float64),
+            cost=np.array([h.cost for h in hourly], dtype=np.float64),
+            action=np.array([ACTION_CODES[h.action] for h in hourly], dtype=np.int8)
+        )
+    
+    def astype(self, dtype) -> 'Trajectory':
+        """Float columns as dtype (no copy for columns already in dtype)."""
+        return Trajectory(**{
+            name: (values if values.dtype.kind != 'f' else np.asarray(values, dtype=dtype))
+            for name, values in ((name, getattr(self, name)) for name in self.FIELDS)
+        })
+    
+    def to_columns(self) -> Dict[str, np.ndarray]:
+        """Columns keyed like HourlyData fields (stored columns uncopied)."""
+        return {
+            "hour": self.hour,
+            "solar_production": self.solar_kwh,
+            "consumption": self.load_kwh,
+            "battery_level": self.charge_kwh,
+            "battery_soc": self.soc,
+            "grid_usage": self.grid_import,
+            "grid_export": self.grid_export,
+            "net_energy": self.solar_kwh - self.load_kwh,
+            "action": ACTION_VALUES[self.action],
+            "grid_price": self.price,
+            "cost": self.cost,
+            "savings": self.baseline_cost() - self.cost,
+        }
+    
+    def baseline_cost(self) -> np.ndarray:
+        """Cost per step without a battery (all deficit from the grid)."""
+        return np.maximum(0, self.load_kwh - self.solar_kwh) * self.price
+    
+    def __len__(self) -> int:
+        return len(self.hour)
+    
+    def to_hourly_data(self) -> List[HourlyData]:
+        """HourlyData per step, rounded as the dashboard expects."""
+        baseline_cost = self.baseline_cost()
+        columns = zip(
+            self.hour.tolist(), self.solar_kwh.tolist(), self.load_kwh.tolist(),
+            self.charge_kwh.tolist(), self.soc.tolist(), self.grid_import.tolist(),
+            self.grid_export.tolist(), self.action.tolist(), self.price.tolist(),
+            self.cost.tolist(), (baseline_cost - self.cost).tolist()
+        )
+        return [
+            HourlyData(
+                hour=hour,
+                solar_production=round(solar, 2),
+                consumption=round(load, 2),
+                battery_level=round(charge, 2),
+                battery_soc=round(soc, 2),
+                grid_usage=round(grid_import, 2),
+                grid_export=round(grid_export, 2),
+                net_energy=round(solar - load, 2),
+                action=ACTIONS[action],
+                grid_price=price,
+                cost=round(cost, 3),
+                savings=round(savings, 3)
+            )
+            for (hour, solar, load, charge, soc, grid_import, grid_export,
+                 action, price, cost, savings) in columns
+        ]
+
+
+class Tariff(Protocol):
+    """Anything that compiles grid prices for a horizon.
+    
+    Implemented by TimeOfUseTariff and PriceSeries (src/data/tariff.py).
+    
+    Attributes:
+        fingerprint: Content hash identifying the prices (cache keys)
+    """
+    fingerprint: str
+    
+    def price_vector(
+        self,
+        start_step: int,
+        n_steps: int,
+        dt_hours: float = 1.0,
+        start_date: Optional[datetime.date] = None,
+        season: str = 'summer',
+        day_type: str = 'weekday'
+    ) -> np.ndarray:
+        """Price in DZD/kWh of timesteps [start_step, start_step + n_steps)."""
+        ...
+
+
+class EnvironmentSource(Protocol):
+    """Anything that can drive SimulationRunner with environment data.
+    
+    Implemented by EnergyDataSimulator (synthetic or AI-predicted data)
+    and MeterDataReplay (historical telemetry).
+    
+    Attributes:
+        seed: Random seed of the data, or None for recorded data
+    """
+    seed: Optional[int]
+    
+    def iter_environment(
+        self,
+        n_hours: Optional[int] = None,
+        chunk_hours: int = ...
+    ) -> Iterator[EnvironmentArrays]:
+        """Stream the horizon as consecutive EnvironmentArrays chunks."""
+        ...
+
@@ -0,0 +1,126 @@
+"""
+Vectorized solar and consumption profiles.
+
+Computes the simulator's solar bell curve and consumption periods for a
+whole horizon in single NumPy passes. These functions are stateless; the
+AI predictors use fallback_profile() when their models are unavailable
+instead of building one EnergyDataSimulator per hour.
+"""
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+from src.data.counter_rng import CounterRNG, SOLAR, CONSUMPTION
+from src.utils.config import (
+    INVERTER_MAX_OUTPUT, SOLAR_SUMMER_PEAK, SOLAR_WINTER_PEAK,
+    WEATHER_MULTIPLIERS, CONSUMPTION_BASE_WEEKDAY, CONSUMPTION_BASE_WEEKEND,
+    SEASON_MULTIPLIERS, get_consumption_period
+)
+
+# Seed used by the predictors' fallback (a fresh simulator per hour)
+FALLBACK_SEED = 42
+
+
+def solar_daylight_mask(hours) -> np.ndarray:
+    """Hours with a solar bell-curve value (06:00-18:00 inclusive).
+
+    These are also the hours that draw a random variation in the simulator.
+
+    Args:
+        hours: Array of hours of day (0-23)
+
+    Returns:
+        Boolean array
+    """
+    hours = np.asarray(hours)
+    return (hours >= 6) & (hours <= 18)
+
+
+def solar_base_profile(hours, season: str) -> np.ndarray:
+    """Solar bell curve in kWh before weather and random variation.
+
+    Ramps up from 06:00 to a peak at 12:00-14:00, then down to 18:00.
+
+    Args:
+        hours: Array of hours of day (0-23)
+        season: 'summer' or 'winter'
+
+    Returns:
+        Array of base solar production per hour
+    """
+    hours = np.asarray(hours, dtype=float)
+    peak = SOLAR_SUMMER_PEAK if season == 'summer' else SOLAR_WINTER_PEAK
+
+    base = np.zeros(hours.shape)
+
+    # Morning ramp up
+    morning = (hours >= 6) & (hours <= 12)
+    base[morning] = peak * np.sin((hours[morning] - 6) / 6 * np.pi / 2)
+
+    # Peak hours
+    base[(hours > 12) & (hours <= 14)] = peak
+
+    # Afternoon ramp down
+    afternoon = (hours > 14) & (hours <= 18)
+    base[afternoon] = peak * np.sin((18 - hours[afternoon]) / 4 * np.pi / 2)
+
+    return base
+
+
+def consumption_base_profile(hours, season: str, day_type: str) -> np.ndarray:
+    """Consumption in kWh by time period, before random variation.
+
+    Args:
+        hours: Array of hours of day (0-23)
+        season: 'summer' or 'winter'
+        day_type: 'weekday' or 'weekend'
+
+    Returns:
+        Array of base consumption per hour
+    """
+    base_by_period = CONSUMPTION_BASE_WEEKEND if day_type == 'weekend' else CONSUMPTION_BASE_WEEKDAY
+    by_hour = np.array([base_by_period.get(get_consumption_period(h), 1.0) for h in range(24)])
+    season_mult = SEASON_MULTIPLIERS.get(season, 1.0)
+
+    return by_hour[np.asarray(hours, dtype=int)] * season_mult
+
+
+@lru_cache(maxsize=64)
+def fallback_profile(season: str, weather: str, day_type: str = 'weekday') -> Tuple[np.ndarray, np.ndarray]:
+    """24-hour (solar, consumption) profile used when AI models are unavailable.
+
+    Reproduces an EnergyDataSimulator seeded with FALLBACK_SEED generating
+    each hour (random variation is addressed by seed and hour, see
+    counter_rng.py).
+    Profiles are cached per (season, weather, day_type) and read-only.
+
+    Args:
+        season: 'summer' or 'winter' (anything else is treated as summer)
+        weather: 'sunny', 'partly_cloudy', 'cloudy' or 'rainy' (anything else is sunny)
+        day_type: 'weekday' or 'weekend'
+
+    Returns:
+        Tuple of (solar_kwh, load_kwh) arrays of length 24
+    """
+    season = season.lower()
+    weather = weather.lower().replace('-', '_')
+    if season not in SEASON_MULTIPLIERS:
+        season = 'summer'
+    if weather not in WEATHER_MULTIPLIERS:
+        weather = 'sunny'
+
+    hours = np.arange(24)
+    rng = CounterRNG(FALLBACK_SEED)
+
+    # Solar: ±15% variation, weather multiplier, inverter limit
+    weather_mult = WEATHER_MULTIPLIERS[weather]
+    solar = solar_base_profile(hours, season) * (0.7 + 0.3 * rng.uniform(hours, SOLAR)) * weather_mult
+    solar = np.minimum(solar, INVERTER_MAX_OUTPUT)
+
+    # Consumption: uniform(0.85, 1.15) variation
+    load = consumption_base_profile(hours, season, day_type) * (0.85 + (1.15 - 0.85) * rng.uniform(hours, CONSUMPTION))
+
+    solar.flags.writeable = False
+    load.flags.writeable = False
+    return solar, load
@@ -0,0 +1,219 @@
+"""
+Meter Data Replay - Historical site telemetry as an environment source.
+
+Telemetry files (CSV or Parquet with a timestamp, solar and load column,
+optionally a price column) are parsed once and converted to a columnar
+cache directory: one uncompressed .npy file per column plus meta.json.
+Replays memory-map the columns, so reading a year of data is a page-cache
+copy with no parsing, and the chunks handed to SimulationRunner are
+zero-copy views.
+
+Timestamps must lie on a regular grid whose step divides one hour; gaps
+are filled by linear interpolation at conversion time (see columnar.py).
+
+Convert with:
+    python -m scripts.convert_meter_data site.csv --output data/replay/site
+"""
+import datetime
+import json
+import logging
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+
+from src.data.columnar import TimeLike, as_datetime, read_regular_frame, write_column_cache
+from src.data.models import EnvironmentArrays, Tariff
+from src.data.tariff import default_tariff
+from src.utils.config import steps_per_hour
+
+logger = logging.getLogger(__name__)
+
+# Columns written by convert_meter_data(), one .npy file each
+COLUMNS = ('hour', 'solar_kwh', 'load_kwh', 'price')
+
+
+def convert_meter_data(
+    source,
+    output,
+    timestamp_col: str = 'timestamp',
+    solar_col: str = 'solar_kwh',
+    load_col: str = 'load_kwh',
+    price_col: str = 'price',
+    tariff: Optional[Tariff] = None
+) -> Path:
+    """
+    Convert a telemetry file into a memory-mappable columnar cache.
+
+    Solar and load columns hold energy per interval in kWh. Without a
+    price column, prices are compiled from the tariff for the recorded
+    dates. Reading Parquet needs pyarrow (or fastparquet) installed.
+
+    Args:
+        source: CSV or Parquet (.parquet/.pq) file
+        output: Destination directory (replaced if it exists)
+        timestamp_col: Name of the timestamp column
+        solar_col: Name of the solar energy column
+        load_col: Name of the load energy column
+        price_col: Name of the optional price column (DZD/kWh)
+        tariff: Tariff used without a price column (default: default_tariff())
+
+    Returns:
+        Path to the written directory
+
+    Raises:
+        ValueError: If columns are missing or timestamps are irregular
+    """
+    source = Path(source)
+    frame, dt_hours, filled = read_regular_frame(
+        source, timestamp_col, required=(solar_col, load_col), optional=(price_col,)
+    )
+    grid = frame.index
+
+    if price_col in frame.columns:
+        price = frame[price_col].to_numpy(dtype=np.float64)
+    else:
+        first = grid[0].to_pydatetime()
+        start_step = round((first - as_datetime(first.date())) / datetime.timedelta(hours=dt_hours))
+        price = (tariff or default_tariff()).price_vector(start_step, len(grid), dt_hours, first.date())
+
+    columns = {
+        'hour': grid.hour.to_numpy(dtype=np.int64),
+        'solar_kwh': frame[solar_col].to_numpy(dtype=np.float64),
+        'load_kwh': frame[load_col].to_numpy(dtype=np.float64),
+        'price': price
+    }
+    meta = {
+        'start': grid[0].isoformat(),
+        'dt_hours': dt_hours,
+        'n_steps': len(grid),
+        'filled_steps': filled,
+        'source': source.name
+    }
+
+    write_column_cache(output, columns, meta)
+    logger.info(f"✅ Converted {source.name}: {len(grid)} steps of {dt_hours:g} h -> {output}")
+    return Path(output)
+
+
+class MeterDataReplay:
+    """
+    Replays converted telemetry through the EnvironmentSource interface.
+
+    Columns are memory-mapped read-only, so any number of replays of the
+    same site (in one process or many) share one copy in the page cache.
+    between() narrows a replay to a date range without copying.
+
+    Attributes:
+        directory: Converted cache directory
+        start: Timestamp of the first step of this replay
+        dt_hours: Timestep length in hours
+        seed: Always None (recorded data has no randomness)
+    """
+
+    # Hours per chunk yielded by iter_environment (one week)
+    CHUNK_HOURS = 24 * 7
+
+    seed = None
+
+    def __init__(self, directory, mmap_mode: Optional[str] = 'r'):
+        """
+        Args:
+            directory: Directory written by convert_meter_data()
+            mmap_mode: np.load memory-map mode (None reads into memory)
+        """
+        self.directory = Path(directory)
+        meta = json.loads((self.directory / "meta.json").read_text())
+        self.dt_hours = meta['dt_hours']
+        self.filled_steps = meta['filled_steps']
+        self._origin = datetime.datetime.fromisoformat(meta['start'])
+        self._columns = {
+            name: np.load(self.directory / f"{name}.npy", mmap_mode=mmap_mode)
+            for name in COLUMNS
+        }
+        self._lo, self._hi = 0, meta['n_steps']
+
+    @property
+    def start(self) -> datetime.datetime:
+        """Timestamp of the first step of this replay."""
+        return self._origin + datetime.timedelta(hours=self._lo * self.dt_hours)
+
+    @property
+    def end(self) -> datetime.datetime:
+        """Timestamp just after the last step of this replay."""
+        return self._origin + datetime.timedelta(hours=self._hi * self.dt_hours)
+
+    @property
+    def steps_per_hour(self) -> int:
+        """Number of timesteps per hour."""
+        return steps_per_hour(self.dt_hours)
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    def _index(self, when: TimeLike) -> int:
+        """Absolute step index of a timestamp, clipped to this replay."""
+        offset = (as_datetime(when) - self._origin) / datetime.timedelta(hours=self.dt_hours)
+        return int(np.clip(np.ceil(offset), self._lo, self._hi))
+
+    def _slice(self, lo: int, hi: int) -> EnvironmentArrays:
+        """Zero-copy view of absolute steps [lo, hi)."""
+        return EnvironmentArrays(
+            **{name: column[lo:hi] for name, column in self._columns.items()},
+            dt_hours=self.dt_hours
+        )
+
+    def window(self, start: TimeLike, end: TimeLike) -> EnvironmentArrays:
+        """
+        Random access to the steps in [start, end).
+
+        Args:
+            start: First timestamp (date, datetime or ISO string)
+            end: Timestamp after the last one
+
+        Returns:
+            EnvironmentArrays view (empty if the range is outside the data)
+        """
+        lo = self._index(start)
+        return self._slice(lo, max(lo, self._index(end)))
+
+    def between(self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None) -> 'MeterDataReplay':
+        """
+        Narrow the replay to [start, end) without copying data.
+
+        Args:
+            start: First timestamp (default: current start)
+            end: Timestamp after the last one (default: current end)
+
+        Returns:
+            New MeterDataReplay sharing the memory-mapped columns
+        """
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__)
+        view._lo = self._index(start) if start is not None else self._lo
+        view._hi = max(view._lo, self._index(end) if end is not None else self._hi)
+        return view
+
+    def iter_environment(
+        self,
+        n_hours: Optional[int] = None,
+        chunk_hours: int = CHUNK_HOURS
+    ) -> Iterator[EnvironmentArrays]:
+        """
+        Stream the replay in chunks.
+
+        Args:
+            n_hours: Hours to replay from the start (default: all)
+            chunk_hours: Hours per chunk
+
+        Yields:
+            EnvironmentArrays views over consecutive parts of the data
+        """
+        if chunk_hours <= 0:
+            raise ValueError("chunk_hours must be positive")
+        hi = self._hi
+        if n_hours is not None:
+            hi = min(hi, self._lo + n_hours * self.steps_per_hour)
+        chunk_steps = chunk_hours * self.steps_per_hour
+        for lo in range(self._lo, hi, chunk_steps):
+            yield self._slice(lo, min(lo + chunk_steps, hi))
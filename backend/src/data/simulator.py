@@ -1,5 +1,8 @@
 """
-Energy Data Simulator for generating realistic 24-hour environment data.
+Energy Data Simulator for generating realistic environment data.
+
+Horizons range from 24 hours to a full year; long horizons are streamed
+in chunks (iter_environment) with seasons and day types from a calendar.
 
 Now with AI model integration! Uses trained ML models for predictions with simulation fallback.
 Generates solar production, consumption, and pricing data WITHOUT making decisions.
@@ -11,15 +14,23 @@ This separation enables:
 - Replay and debugging
 - AI-powered predictions with fallback
 """
-from typing import List, Optional
+import datetime
+from typing import Iterator, List, Optional, Tuple
 import numpy as np
 import logging
 
-from src.data.models import SimulationConfig, EnvironmentState, Season
+from src.data.models import SimulationConfig, EnvironmentState, EnvironmentArrays, Season
+from src.data.counter_rng import CounterRNG, SOLAR, CONSUMPTION
+from src.data.environment_cache import EnvironmentCache, environment_key
+from src.data.profiles import (
+    solar_base_profile, solar_daylight_mask, consumption_base_profile
+)
+from src.data.tariff import default_tariff
 from src.utils.config import (
     INVERTER_MAX_OUTPUT, SOLAR_SUMMER_PEAK, SOLAR_WINTER_PEAK,
     WEATHER_MULTIPLIERS, CONSUMPTION_BASE_WEEKDAY, CONSUMPTION_BASE_WEEKEND,
-    SEASON_MULTIPLIERS, get_price_for_hour, get_consumption_period
+    SEASON_MULTIPLIERS, get_consumption_period, get_season_for_month,
+    steps_per_hour
 )
 
 # Import AI models (with fallback)
@@ -45,23 +56,42 @@ class EnergyDataSimulator:
         config: Simulation configuration
         rng: Random number generator (reproducible with seed)
         seed: Random seed for reproducibility (stored in results)
+        tariff: Tariff compiling the price of each timestep
         use_ai: Whether to use AI models (if available)
         ai_manager: ModelManager instance for AI predictions
     """
     
-    def __init__(self, config: SimulationConfig, seed: Optional[int] = None, use_ai: bool = True):
+    def __init__(
+        self,
+        config: SimulationConfig,
+        seed: Optional[int] = None,
+        use_ai: bool = True,
+        cache: Optional[EnvironmentCache] = None
+    ):
         """Initialize simulator with configuration.
         
         Args:
             config: SimulationConfig with season, weather, day_type settings
             seed: Random seed for reproducible results
             use_ai: Whether to use AI models (defaults to True, falls back to simulation)
+            cache: Environment cache to reuse generated chunks (seeded runs only)
+            
+        Raises:
+            ValueError: If config.dt_hours does not divide one hour evenly,
+                or config.weather_path is shorter than the horizon
         """
+        steps_per_hour(config.dt_hours)
+        if config.weather_path is not None and len(config.weather_path) * 24 < config.hours:
+            raise ValueError(f"weather_path covers {len(config.weather_path)} days, "
+                             f"horizon needs {-(-config.hours // 24)}")
         self.config = config
-        self.rng = np.random.default_rng(seed)
+        self.rng = CounterRNG(seed)
         self.seed = seed
+        self.cache = cache
+        self.tariff = config.tariff if config.tariff is not None else default_tariff()
         self.use_ai = use_ai and AI_AVAILABLE
         self.ai_manager = None
+        self._ai_failures = 0
         
         # Initialize AI manager if requested
         if self.use_ai:
@@ -88,25 +118,255 @@ class EnergyDataSimulator:
     def generate_24h_environment(self) -> List[EnvironmentState]:
         """Generate 24 hours of environment data.
         
-        Uses AI models if available, otherwise falls back to simulation.
+        Thin view over generate_environment_arrays(24).
+        
+        Returns:
+            List of EnvironmentState (one per timestep)
+        """
+        return self.generate_environment_arrays(24).to_states()
+    
+    # Hours per chunk yielded by iter_environment (one week)
+    CHUNK_HOURS = 24 * 7
+    
+    def generate_environment_arrays(self, n_hours: Optional[int] = None) -> EnvironmentArrays:
+        """Generate environment data for a horizon as NumPy arrays.
+        
+        Args:
+            n_hours: Horizon length in hours (default: config.hours); the
+                number of timesteps is n_hours / config.dt_hours
+            
+        Returns:
+            EnvironmentArrays with hour, solar_kwh, load_kwh and price
+        """
+        n_hours = n_hours if n_hours is not None else self.config.hours
+        return self._generate_arrays(0, n_hours * self.steps_per_hour)
+    
+    def iter_environment(
+        self,
+        n_hours: Optional[int] = None,
+        chunk_hours: int = CHUNK_HOURS
+    ) -> Iterator[EnvironmentArrays]:
+        """Stream environment data for a horizon in chunks.
+        
+        Only one chunk is held at a time, so memory does not grow with the
+        horizon. Concatenated chunks equal generate_environment_arrays(n_hours)
+        for the same seed.
+        
+        Args:
+            n_hours: Horizon length in hours (default: config.hours)
+            chunk_hours: Hours per chunk
+            
+        Yields:
+            EnvironmentArrays for consecutive parts of the horizon
+        """
+        if chunk_hours <= 0:
+            raise ValueError("chunk_hours must be positive")
+        n_hours = n_hours if n_hours is not None else self.config.hours
+        n_steps = n_hours * self.steps_per_hour
+        chunk_steps = chunk_hours * self.steps_per_hour
+        for start in range(0, n_steps, chunk_steps):
+            yield self._generate_arrays(start, min(chunk_steps, n_steps - start))
+    
+    @property
+    def steps_per_hour(self) -> int:
+        """Number of timesteps per hour for config.dt_hours."""
+        return steps_per_hour(self.config.dt_hours)
+    
+    def _day_conditions(self, day_index: int) -> Tuple[int, int, str, str, str]:
+        """Get (day, month, season, day_type, weather) for a day of the horizon.
+        
+        Args:
+            day_index: Days since the start of the horizon
+            
+        Returns:
+            AI model date inputs plus season, day type and weather values
+        """
+        weather = self._weather_for_day(day_index)
+        if self.config.start_date is None:
+            day, month = self._ai_date()
+            return day, month, self.config.season.value, self.config.day_type.value, weather
+        
+        date = self.config.start_date + datetime.timedelta(days=day_index)
+        day_type = 'weekend' if date.weekday() >= 5 else 'weekday'
+        return date.day, date.month, get_season_for_month(date.month), day_type, weather
+    
+    def _weather_for_day(self, day_index: int) -> str:
+        """Weather value of a day: from config.weather_path, else config.weather."""
+        path = self.config.weather_path
+        if path is None:
+            return self.config.weather.value
+        if day_index >= len(path):
+            raise ValueError(f"weather_path has no entry for day {day_index}")
+        return path[day_index].value
+    
+    def _generate_arrays(self, start_step: int, n_steps: int) -> EnvironmentArrays:
+        """Get timesteps [start_step, start_step + n_steps), cached if possible.
+        
+        Args:
+            start_step: First timestep since the start of the horizon
+            n_steps: Number of timesteps
+            
+        Returns:
+            EnvironmentArrays for the requested timesteps
+        """
+        key = self._cache_key(start_step, n_steps)
+        if key is None:
+            return self._compute_arrays(start_step, n_steps)
+        
+        arrays = self.cache.get(key)
+        if arrays is None:
+            failures = self._ai_failures
+            arrays = self._compute_arrays(start_step, n_steps)
+            # Do not cache a transient AI failure under the model version
+            if self._ai_failures == failures:
+                self.cache.put(key, arrays)
+        return arrays
+    
+    def _cache_key(self, start_step: int, n_steps: int) -> Optional[str]:
+        """Content key of a chunk, or None if it cannot be cached."""
+        if self.cache is None or self.seed is None:
+            return None
+        
+        model_version = None
+        if self.use_ai and self.ai_manager:
+            model_version = getattr(self.ai_manager, 'version', None)
+            if model_version is None:
+                return None
+        
+        config = self.config
+        return environment_key(
+            seed=int(self.seed),
+            season=config.season.value,
+            weather=config.weather.value,
+            weather_path=[w.value for w in config.weather_path] if config.weather_path else None,
+            day_type=config.day_type.value,
+            start_date=config.start_date.isoformat() if config.start_date else None,
+            dt_hours=config.dt_hours,
+            tariff=self.tariff.fingerprint,
+            model_version=model_version,
+            start_step=start_step,
+            n_steps=n_steps
+        )
+    
+    def _compute_arrays(self, start_step: int, n_steps: int) -> EnvironmentArrays:
+        """Generate timesteps [start_step, start_step + n_steps) of the horizon.
+        
+        Uses AI predictions where available and in range, and the simulation
+        elsewhere, in vectorized passes. Random variation is addressed by
+        (seed, timestep, quantity) through CounterRNG, so results match the
+        per-hour methods and do not depend on chunking or generation order.
+        
+        Profiles and predictions are average power in kW; the solar curve is
+        evaluated at each step's fractional time of day. Energies are power
+        times config.dt_hours.
         
+        Args:
+            start_step: First timestep since the start of the horizon
+            n_steps: Number of timesteps
+            
         Returns:
-            List of EnvironmentState (one per hour)
+            EnvironmentArrays for the requested timesteps
         """
-        return [self._generate_hour(hour) for hour in range(24)]
+        per_hour = self.steps_per_hour
+        per_day = 24 * per_hour
+        dt_hours = self.config.dt_hours
+        steps = np.arange(start_step, start_step + n_steps)
+        hours = (steps // per_hour) % 24
+        time_of_day = (steps % per_day) / per_hour
+        first_day = start_step // per_day
+        day_ids = steps // per_day - first_day
+        n_days = int(day_ids[-1]) + 1 if n_steps else 0
+        conditions = [self._day_conditions(first_day + i) for i in range(n_days)]
+        seasons = np.array([c[2] for c in conditions], dtype=object)[day_ids]
+        day_types = np.array([c[3] for c in conditions], dtype=object)[day_ids]
+        
+        # AI predictions for each step's hour (NaN where unavailable)
+        solar_pred = np.full(n_steps, np.nan)
+        load_pred = np.full(n_steps, np.nan)
+        day_preds = {}
+        for i, (day, month, season, _, weather) in enumerate(conditions):
+            if (day, month, season, weather) not in day_preds:
+                day_preds[day, month, season, weather] = self._predict_ai_batch(
+                    list(range(24)), day, month, season, weather
+                )
+            preds = day_preds[day, month, season, weather]
+            if preds is None:
+                continue
+            in_day = day_ids == i
+            by_hour = np.array(preds, dtype=float)
+            solar_pred[in_day] = by_hour[hours[in_day], 0]
+            load_pred[in_day] = by_hour[hours[in_day], 1]
+        
+        # Validate predictions (0-15 kW solar, 0-10 kW household consumption)
+        solar_ok = (solar_pred >= 0) & (solar_pred <= 15)
+        load_ok = (load_pred >= 0) & (load_pred <= 10)
+        for hour in np.flatnonzero(np.isfinite(solar_pred) & ~solar_ok):
+            logger.warning(f"AI solar prediction out of range: {solar_pred[hour]}, using simulation")
+        for hour in np.flatnonzero(np.isfinite(load_pred) & ~load_ok):
+            logger.warning(f"AI consumption prediction out of range: {load_pred[hour]}, using simulation")
+        
+        # Base profiles for each (season, day type) present in this range
+        solar_base = np.zeros(n_steps)
+        load_base = np.zeros(n_steps)
+        for season, day_type in {(c[2], c[3]) for c in conditions}:
+            mask = (seasons == season) & (day_types == day_type)
+            solar_base[mask] = solar_base_profile(time_of_day[mask], season)
+            load_base[mask] = consumption_base_profile(hours[mask], season, day_type)
+        
+        # Random variation for simulated daylight solar and simulated consumption
+        solar_draws = ~solar_ok & solar_daylight_mask(time_of_day)
+        load_draws = ~load_ok
+        
+        # Solar: bell curve, ±15% variation, weather of the day, inverter limit
+        weather_mult = np.array([WEATHER_MULTIPLIERS.get(c[4], 1.0) for c in conditions])[day_ids]
+        solar_sim = np.zeros(n_steps)
+        solar_sim[solar_draws] = np.minimum(
+            solar_base[solar_draws] * (0.7 + 0.3 * self.rng.uniform(steps[solar_draws], SOLAR))
+            * weather_mult[solar_draws],
+            INVERTER_MAX_OUTPUT
+        )
+        
+        # Consumption: period base with season, uniform(0.85, 1.15) variation
+        load_sim = np.zeros(n_steps)
+        load_sim[load_draws] = load_base[load_draws] * (
+            0.85 + (1.15 - 0.85) * self.rng.uniform(steps[load_draws], CONSUMPTION)
+        )
+        
+        return EnvironmentArrays(
+            hour=hours,
+            solar_kwh=np.where(solar_ok, solar_pred, solar_sim) * dt_hours,
+            load_kwh=np.where(load_ok, load_pred, load_sim) * dt_hours,
+            price=self._prices(start_step, n_steps),
+            dt_hours=dt_hours
+        )
+    
+    def _prices(self, start_step: int, n_steps: int) -> np.ndarray:
+        """Tariff prices of timesteps [start_step, start_step + n_steps)."""
+        config = self.config
+        return self.tariff.price_vector(
+            start_step, n_steps, config.dt_hours, config.start_date,
+            config.season.value, config.day_type.value
+        )
     
-    def _generate_hour(self, hour: int) -> EnvironmentState:
+    def _generate_hour(
+        self,
+        hour: int,
+        solar_pred: Optional[float] = None,
+        load_pred: Optional[float] = None
+    ) -> EnvironmentState:
         """Generate environment data for a single hour.
         
         Args:
             hour: Hour of day (0-23)
+            solar_pred: Precomputed AI solar prediction for this hour (optional)
+            load_pred: Precomputed AI consumption prediction for this hour (optional)
             
         Returns:
             EnvironmentState with solar, load, and price
         """
-        solar = self._generate_solar_for_hour(hour)
-        load = self._generate_consumption_for_hour(hour)
-        price = get_price_for_hour(hour)
+        solar = self._generate_solar_for_hour(hour, solar_pred)
+        load = self._generate_consumption_for_hour(hour, load_pred)
+        price = float(self._prices(hour * self.steps_per_hour, 1)[0])
         
         return EnvironmentState(
             hour=hour,
@@ -128,43 +388,87 @@ class EnergyDataSimulator:
         """
         return self._generate_hour(hour)
     
-    def _generate_solar_for_hour(self, hour: int) -> float:
+    def _ai_date(self) -> tuple:
+        """Get the (day, month) used as AI model inputs.
+        
+        Returns:
+            Tuple of (day, month): mid-June in summer, mid-December in winter
+        """
+        day = 15  # Middle of month
+        month = 6 if self.config.season == Season.SUMMER else 12  # June or December
+        return day, month
+    
+    def _predict_ai_batch(
+        self,
+        hours: List[int],
+        day: Optional[int] = None,
+        month: Optional[int] = None,
+        season: Optional[str] = None,
+        weather: Optional[str] = None
+    ) -> Optional[List[tuple]]:
+        """Get AI solar and consumption predictions for several hours.
+        
+        Goes through ModelManager's prediction cache, which batches misses
+        into one call per model.
+        
+        Args:
+            hours: Hours of day (0-23)
+            day: Day of month (default: from _ai_date)
+            month: Month (default: from _ai_date)
+            season: Season value (default: config.season)
+            weather: Weather value (default: the first day's weather)
+            
+        Returns:
+            List of (solar_kw, consumption_kw) per hour, or None if AI is
+            unavailable or failed
+        """
+        if not (self.use_ai and self.ai_manager):
+            return None
+        
+        try:
+            if day is None or month is None:
+                day, month = self._ai_date()
+            # Predictors catch model errors and answer with the fallback
+            # profile; their failure counters are how a fallback shows up here
+            solar, consumption = self.ai_manager.solar, self.ai_manager.consumption
+            failures = solar.failures + consumption.failures
+            predictions = self.ai_manager.predict_hours(
+                hours,
+                day,
+                month,
+                weather if weather is not None else self._weather_for_day(0),
+                season if season is not None else self.config.season.value
+            )
+            if solar.failures + consumption.failures != failures:
+                self._ai_failures += 1
+            return predictions
+        except Exception as e:
+            logger.debug(f"AI batch prediction failed: {e}")
+            self._ai_failures += 1
+            return None
+    
+    def _generate_solar_for_hour(self, hour: int, solar_pred: Optional[float] = None) -> float:
         """Generate solar production for a specific hour.
         
         Uses AI model if available, otherwise uses simulation.
         
         Args:
             hour: Hour of day (0-23)
+            solar_pred: Precomputed AI prediction; fetched if None
             
         Returns:
             Solar production in kWh
         """
-        # Try AI model first
-        if self.use_ai and self.ai_manager:
-            try:
-                # Get current date info (use defaults if not available)
-                day = 15  # Middle of month
-                month = 6 if self.config.season == Season.SUMMER else 12  # June or December
-                weather_str = self.config.weather.value
-                season_str = self.config.season.value
-                
-                # Get AI prediction
-                solar_pred = self.ai_manager.solar.predict(
-                    hour=hour,
-                    day=day,
-                    month=month,
-                    weather=weather_str,
-                    season=season_str
-                )
-                
-                # Validate prediction (should be 0-10 kW range)
-                if 0 <= solar_pred <= 15:
-                    return solar_pred
-                else:
-                    logger.warning(f"AI solar prediction out of range: {solar_pred}, using simulation")
-                    
-            except Exception as e:
-                logger.debug(f"AI solar prediction failed for hour {hour}: {e}")
+        if solar_pred is None:
+            preds = self._predict_ai_batch([hour])
+            solar_pred = preds[0][0] if preds is not None else None
+        
+        if solar_pred is not None:
+            # Validate prediction (should be 0-10 kW range)
+            if 0 <= solar_pred <= 15:
+                return float(solar_pred)
+            else:
+                logger.warning(f"AI solar prediction out of range: {solar_pred}, using simulation")
         
         # Fallback to simulation
         return self._generate_solar_simulation(hour)
@@ -185,8 +489,8 @@ class EnergyDataSimulator:
         # Determine peak based on season
         peak = SOLAR_SUMMER_PEAK if self.config.season == Season.SUMMER else SOLAR_WINTER_PEAK
         
-        # Apply weather multiplier
-        weather_mult = WEATHER_MULTIPLIERS.get(self.config.weather.value, 1.0)
+        # Apply weather multiplier (hour of the first day)
+        weather_mult = WEATHER_MULTIPLIERS.get(self._weather_for_day(0), 1.0)
         
         # Generate bell curve for solar production
         # Peak at 12:00-13:00
@@ -205,7 +509,7 @@ class EnergyDataSimulator:
             return 0.0
         
         # Add random variation (±15%) and weather
-        variation = 0.7 + 0.3 * self.rng.random()
+        variation = 0.7 + 0.3 * self.rng.uniform_at(hour, SOLAR)
         solar = base * variation * weather_mult
         
         # Apply inverter limit
@@ -213,43 +517,28 @@ class EnergyDataSimulator:
         
         return solar
     
-    def _generate_consumption_for_hour(self, hour: int) -> float:
+    def _generate_consumption_for_hour(self, hour: int, load_pred: Optional[float] = None) -> float:
         """Generate consumption for a specific hour.
         
         Uses AI model if available, otherwise uses simulation.
         
         Args:
             hour: Hour of day (0-23)
+            load_pred: Precomputed AI prediction; fetched if None
             
         Returns:
             Consumption in kWh
         """
-        # Try AI model first
-        if self.use_ai and self.ai_manager:
-            try:
-                # Get current date info
-                day = 15  # Middle of month
-                month = 6 if self.config.season == Season.SUMMER else 12
-                weather_str = self.config.weather.value
-                season_str = self.config.season.value
-                
-                # Get AI prediction
-                cons_pred = self.ai_manager.consumption.predict(
-                    hour=hour,
-                    day=day,
-                    month=month,
-                    weather=weather_str,
-                    season=season_str
-                )
-                
-                # Validate prediction (should be 0-10 kW range for household)
-                if 0 <= cons_pred <= 10:
-                    return cons_pred
-                else:
-                    logger.warning(f"AI consumption prediction out of range: {cons_pred}, using simulation")
-                    
-            except Exception as e:
-                logger.debug(f"AI consumption prediction failed for hour {hour}: {e}")
+        if load_pred is None:
+            preds = self._predict_ai_batch([hour])
+            load_pred = preds[0][1] if preds is not None else None
+        
+        if load_pred is not None:
+            # Validate prediction (should be 0-10 kW range for household)
+            if 0 <= load_pred <= 10:
+                return float(load_pred)
+            else:
+                logger.warning(f"AI consumption prediction out of range: {load_pred}, using simulation")
         
         # Fallback to simulation
         return self._generate_consumption_simulation(hour)
@@ -274,8 +563,8 @@ class EnergyDataSimulator:
         season_mult = SEASON_MULTIPLIERS.get(self.config.season.value, 1.0)
         base = base * season_mult
         
-        # Add random variation (±15%) using reproducible RNG
-        variation = self.rng.uniform(0.85, 1.15)
+        # Add random variation (±15%) keyed by (seed, hour)
+        variation = 0.85 + (1.15 - 0.85) * self.rng.uniform_at(hour, CONSUMPTION)
         
         return base * variation
     
@@ -0,0 +1,316 @@
+"""
+Tariffs - Grid prices compiled into per-timestep price vectors.
+
+A tariff turns a horizon (timesteps since midnight of the first day, the
+timestep length and the calendar) into one NumPy price vector. The
+simulator, replays and the MILP objective read prices from that vector
+instead of calling a per-hour function:
+
+- TimeOfUseTariff: rates per period with 24-hour schedules per season
+  and day type, compiled once into a (season, day type, hour) table
+- PriceSeries: real-time or day-ahead prices on a regular grid,
+  memory-mapped from a converted cache and averaged onto the simulation
+  timestep
+
+Convert price histories with:
+    python -m scripts.convert_price_data prices.csv --output data/prices/dam
+"""
+import datetime
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.data.columnar import TimeLike, as_datetime, read_regular_frame, write_column_cache
+from src.data.models import Tariff
+from src.utils.config import PRICING, SUMMER_MONTHS, TOU_SCHEDULE, steps_per_hour
+
+logger = logging.getLogger(__name__)
+
+# Season order of the first axis of TimeOfUseTariff.table
+SEASONS = ('summer', 'winter')
+
+
+def _calendar(
+    start_date: Optional[datetime.date],
+    days: np.ndarray,
+    season: str,
+    day_type: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Season index and weekend flag for days since the start of a horizon.
+
+    Without a start date every day has the given season and day type.
+    """
+    if start_date is None:
+        return np.full(days.shape, SEASONS.index(season)), np.full(days.shape, day_type == 'weekend')
+
+    dates = np.datetime64(start_date, 'D') + days
+    months = dates.astype('datetime64[M]').astype(np.int64) % 12 + 1
+    weekday = (dates.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+    return np.where(np.isin(months, SUMMER_MONTHS), 0, 1), weekday >= 5
+
+
+class TimeOfUseTariff:
+    """
+    Time-of-use rates with per-season and weekend schedules.
+
+    Attributes:
+        table: Price by (season, weekend, hour of day), shape (2, 2, 24)
+        fingerprint: Content hash of the table
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Mapping[str, float]] = None,
+        schedule: Sequence[str] = TOU_SCHEDULE,
+        weekend_schedule: Optional[Sequence[str]] = None,
+        seasonal_rates: Optional[Mapping[str, Mapping[str, float]]] = None
+    ):
+        """
+        Args:
+            rates: Period -> price in DZD/kWh (default: PRICING)
+            schedule: Period of each hour of the day (24 entries)
+            weekend_schedule: Weekend periods (default: schedule)
+            seasonal_rates: Season -> period rates overriding rates
+
+        Raises:
+            ValueError: If a schedule is not 24 hours long or uses a period
+                without a rate
+        """
+        rates = dict(rates if rates is not None else PRICING)
+        schedules = (schedule, weekend_schedule if weekend_schedule is not None else schedule)
+        self.table = np.empty((len(SEASONS), 2, 24))
+        for s, season in enumerate(SEASONS):
+            season_rates = {**rates, **(seasonal_rates or {}).get(season, {})}
+            for weekend, periods in enumerate(schedules):
+                if len(periods) != 24:
+                    raise ValueError("Schedules must give a period for each of the 24 hours")
+                unknown = set(periods) - set(season_rates)
+                if unknown:
+                    raise ValueError(f"No rate for periods: {sorted(unknown)}")
+                self.table[s, weekend] = [season_rates[period] for period in periods]
+        self.table.flags.writeable = False
+        self.fingerprint = hashlib.sha256(
+            json.dumps({'tou': self.table.tolist()}).encode()
+        ).hexdigest()
+
+    def price_vector(
+        self,
+        start_step: int,
+        n_steps: int,
+        dt_hours: float = 1.0,
+        start_date: Optional[datetime.date] = None,
+        season: str = 'summer',
+        day_type: str = 'weekday'
+    ) -> np.ndarray:
+        """
+        Price of timesteps [start_step, start_step + n_steps).
+
+        Args:
+            start_step: First timestep since midnight of the first day
+            n_steps: Number of timesteps
+            dt_hours: Timestep length in hours
+            start_date: First day; derives seasons and weekends from the
+                calendar (None uses season and day_type for every day)
+            season: Season value without a start date
+            day_type: Day type value without a start date
+
+        Returns:
+            Array of n_steps prices in DZD/kWh
+        """
+        per_hour = steps_per_hour(dt_hours)
+        steps = np.arange(start_step, start_step + n_steps)
+        season_idx, weekend = _calendar(start_date, steps // (24 * per_hour), season, day_type)
+        return self.table[season_idx, weekend.astype(np.intp), (steps // per_hour) % 24]
+
+
+@lru_cache(maxsize=1)
+def default_tariff() -> TimeOfUseTariff:
+    """Time-of-use tariff from PRICING and TOU_SCHEDULE (shared instance)."""
+    return TimeOfUseTariff()
+
+
+class PriceSeries:
+    """
+    Recorded or forecast prices (real-time, day-ahead) on a regular grid.
+
+    Prices are piecewise constant over each series step. A simulation
+    timestep gets the time-weighted average price over its interval, so
+    hourly day-ahead prices repeat across 15-minute steps and 5-minute
+    real-time prices average into hourly steps.
+
+    Attributes:
+        prices: Price per series step in DZD/kWh (memory-mapped when loaded)
+        start: Timestamp of the first series step
+        dt_hours: Series step length in hours
+        fallback: Tariff for timesteps outside the series (None raises)
+    """
+
+    def __init__(
+        self,
+        prices,
+        start: TimeLike,
+        dt_hours: float,
+        fallback: Optional[Tariff] = None
+    ):
+        """
+        Args:
+            prices: Price per series step in DZD/kWh
+            start: Timestamp of the first step
+            dt_hours: Series step length (must divide one hour)
+            fallback: Tariff for timesteps outside the series
+        """
+        steps_per_hour(dt_hours)
+        self.prices = prices if isinstance(prices, np.memmap) else np.asarray(prices, dtype=np.float64)
+        self.start = as_datetime(start)
+        self.dt_hours = float(dt_hours)
+        self.fallback = fallback
+        self._fingerprint = None
+
+    @classmethod
+    def load(cls, directory, mmap_mode: Optional[str] = 'r', fallback: Optional[Tariff] = None) -> 'PriceSeries':
+        """
+        Open a series written by save() or convert_price_data().
+
+        Args:
+            directory: Cache directory
+            mmap_mode: np.load memory-map mode (None reads into memory)
+            fallback: Tariff for timesteps outside the series
+
+        Returns:
+            PriceSeries over the memory-mapped prices
+        """
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text())
+        prices = np.load(directory / "price.npy", mmap_mode=mmap_mode)
+        return cls(prices, meta['start'], meta['dt_hours'], fallback)
+
+    def save(self, directory, source: Optional[str] = None) -> Path:
+        """
+        Write the series as a memory-mappable cache directory.
+
+        Args:
+            directory: Destination directory (replaced if it exists)
+            source: Name of the source file, recorded in meta.json
+
+        Returns:
+            Path to the written directory
+        """
+        meta = {
+            'start': self.start.isoformat(),
+            'dt_hours': self.dt_hours,
+            'n_steps': len(self),
+            'source': source
+        }
+        return write_column_cache(directory, {'price': np.asarray(self.prices, dtype=np.float64)}, meta)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def end(self) -> datetime.datetime:
+        """Timestamp just after the last series step."""
+        return self.start + datetime.timedelta(hours=len(self) * self.dt_hours)
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the prices, grid and fallback (computed once)."""
+        if self._fingerprint is None:
+            digest = hashlib.sha256(np.ascontiguousarray(self.prices, dtype=np.float64).tobytes())
+            digest.update(f"{self.start.isoformat()}|{self.dt_hours}".encode())
+            if self.fallback is not None:
+                digest.update(self.fallback.fingerprint.encode())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def price_vector(
+        self,
+        start_step: int,
+        n_steps: int,
+        dt_hours: float = 1.0,
+        start_date: Optional[datetime.date] = None,
+        season: str = 'summer',
+        day_type: str = 'weekday'
+    ) -> np.ndarray:
+        """
+        Price of timesteps [start_step, start_step + n_steps).
+
+        Args:
+            start_step: First timestep since midnight of the first day
+            n_steps: Number of timesteps
+            dt_hours: Timestep length in hours
+            start_date: First day of the horizon (None starts at the
+                series start)
+            season: Passed to the fallback tariff
+            day_type: Passed to the fallback tariff
+
+        Returns:
+            Array of n_steps prices in DZD/kWh
+
+        Raises:
+            ValueError: If timesteps fall outside the series and there is
+                no fallback tariff
+        """
+        steps_per_hour(dt_hours)
+        origin = as_datetime(start_date) if start_date is not None else self.start
+        # Timestep edges in units of series steps
+        first = ((origin - self.start) / datetime.timedelta(hours=1) + start_step * dt_hours) / self.dt_hours
+        ratio = dt_hours / self.dt_hours
+        edges = first + ratio * np.arange(n_steps + 1)
+
+        covered = (edges[:-1] >= -1e-9) & (edges[1:] <= len(self) + 1e-9)
+        if not covered.all() and self.fallback is None:
+            raise ValueError(
+                f"Price series covers {self.start:%Y-%m-%d %H:%M} to {self.end:%Y-%m-%d %H:%M}; "
+                f"horizon steps {start_step}-{start_step + n_steps} fall outside it"
+            )
+
+        prices = np.empty(n_steps)
+        lo = int(np.clip(np.floor(edges[0] + 1e-9), 0, len(self)))
+        hi = int(np.clip(np.ceil(edges[-1] - 1e-9), lo, len(self)))
+        if ratio == 1 and float(first).is_integer() and covered.all():
+            # Aligned and same resolution: a plain slice
+            prices[:] = self.prices[lo:lo + n_steps]
+        elif covered.any():
+            # Average over each timestep from the cumulative integral
+            cumulative = np.concatenate([[0.0], np.cumsum(self.prices[lo:hi], dtype=np.float64)])
+            integral = np.interp(edges, np.arange(lo, hi + 1), cumulative)
+            prices[covered] = (np.diff(integral) / ratio)[covered]
+        if not covered.all():
+            prices[~covered] = self.fallback.price_vector(
+                start_step, n_steps, dt_hours, start_date, season, day_type
+            )[~covered]
+        return prices
+
+
+def convert_price_data(
+    source,
+    output,
+    timestamp_col: str = 'timestamp',
+    price_col: str = 'price'
+) -> Path:
+    """
+    Convert a price history (CSV/Parquet) into a memory-mappable cache.
+
+    Args:
+        source: CSV or Parquet file with a timestamp and a price column
+        output: Destination directory (replaced if it exists)
+        timestamp_col: Name of the timestamp column
+        price_col: Name of the price column (DZD/kWh)
+
+    Returns:
+        Path to the written directory
+
+    Raises:
+        ValueError: If columns are missing or timestamps are irregular
+    """
+    source = Path(source)
+    frame, dt_hours, _ = read_regular_frame(source, timestamp_col, required=(price_col,))
+    series = PriceSeries(frame[price_col].to_numpy(dtype=np.float64), frame.index[0].to_pydatetime(), dt_hours)
+    series.save(output, source=source.name)
+    logger.info(f"✅ Converted {source.name}: {len(series)} prices of {dt_hours:g} h -> {output}")
+    return Path(output)
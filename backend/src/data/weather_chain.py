@@ -0,0 +1,149 @@
+"""
+Weather Chain - Markov-chain daily weather sequences.
+
+Tomorrow's weather depends only on today's, through a transition matrix
+per season (WEATHER_TRANSITIONS in config.py). Paths for many scenarios
+are sampled together: one vectorized step per day across all paths.
+
+Draws come from CounterRNG keyed by (seed, day, path), so a path does not
+depend on how many other paths are sampled with it.
+
+Sampled paths plug into:
+- SimulationConfig.weather_path (per-day solar multipliers and AI inputs)
+- weather_multipliers() / ghi() for vectorized per-day lookups
+"""
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from src.data.counter_rng import CounterRNG, WEATHER
+from src.data.models import Weather
+from src.utils.config import WEATHER_STATES, WEATHER_TRANSITIONS, WEATHER_MULTIPLIERS
+
+StatesLike = Union[str, Weather, Sequence, np.ndarray]
+
+
+def state_index(weather: Union[str, Weather]) -> int:
+    """Index of a weather value in WEATHER_STATES."""
+    value = weather.value if isinstance(weather, Weather) else weather
+    return WEATHER_STATES.index(value.lower().replace('-', '_'))
+
+
+def to_weather(states) -> list:
+    """Convert state indices to Weather values (keeps the array shape)."""
+    lookup = np.array([Weather(name) for name in WEATHER_STATES], dtype=object)
+    return lookup[np.asarray(states)].tolist()
+
+
+def weather_multipliers(states) -> np.ndarray:
+    """Solar weather multipliers for an array of state indices."""
+    lookup = np.array([WEATHER_MULTIPLIERS[name] for name in WEATHER_STATES])
+    return lookup[np.asarray(states)]
+
+
+def ghi(states) -> np.ndarray:
+    """Irradiance (W/m²) the solar predictor assumes for each state index."""
+    from src.ai.solar_predictor import SolarPredictor
+
+    lookup = np.array([SolarPredictor.WEATHER_TO_GHI[name] for name in WEATHER_STATES], dtype=float)
+    return lookup[np.asarray(states)]
+
+
+class WeatherMarkovChain:
+    """
+    Samples daily weather paths from per-season transition matrices.
+
+    Attributes:
+        transitions: Season -> (4, 4) row-stochastic matrix
+    """
+
+    def __init__(self, transitions: Optional[dict] = None):
+        """
+        Args:
+            transitions: Season -> 4x4 matrix in WEATHER_STATES order
+                (default: WEATHER_TRANSITIONS)
+
+        Raises:
+            ValueError: If a matrix has the wrong shape or rows not summing to 1
+        """
+        transitions = transitions if transitions is not None else WEATHER_TRANSITIONS
+        self.transitions = {}
+        for season, matrix in transitions.items():
+            matrix = np.asarray(matrix, dtype=float)
+            n = len(WEATHER_STATES)
+            if matrix.shape != (n, n) or (matrix < 0).any() or not np.allclose(matrix.sum(axis=1), 1.0):
+                raise ValueError(f"Transition matrix for {season!r} must be {n}x{n} row-stochastic")
+            self.transitions[season] = matrix
+        self._cumulative = {season: np.cumsum(m, axis=1) for season, m in self.transitions.items()}
+
+    def stationary(self, season: str) -> np.ndarray:
+        """
+        Long-run share of each weather state in a season.
+
+        Args:
+            season: Season with a transition matrix
+
+        Returns:
+            Probability vector in WEATHER_STATES order
+        """
+        matrix = self.transitions[season]
+        values, vectors = np.linalg.eig(matrix.T)
+        vector = np.real(vectors[:, np.argmin(np.abs(values - 1))])
+        return vector / vector.sum()
+
+    def sample(
+        self,
+        n_paths: int,
+        n_days: int,
+        seasons: Union[str, Sequence[str]],
+        initial: Optional[StatesLike] = None,
+        seed: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Sample daily weather paths.
+
+        Args:
+            n_paths: Number of independent paths (scenarios)
+            n_days: Days per path
+            seasons: Season for every day, or one season for all days
+            initial: Day-0 weather: one value, one per path, or None to draw
+                it from the season's stationary distribution
+            seed: Random seed (same seed, same paths)
+
+        Returns:
+            int8 array of state indices (WEATHER_STATES order), shape
+            (n_paths, n_days)
+        """
+        if isinstance(seasons, str):
+            seasons = [seasons] * n_days
+        if len(seasons) != n_days:
+            raise ValueError("seasons must have one entry per day")
+
+        rng = CounterRNG(seed)
+        paths = np.empty((n_paths, n_days), dtype=np.int8)
+        if n_paths == 0 or n_days == 0:
+            return paths
+
+        path_ids = np.arange(n_paths)
+        draws = rng.uniform(
+            np.repeat(np.arange(n_days), n_paths), WEATHER, np.tile(path_ids, n_days)
+        ).reshape(n_days, n_paths)
+
+        if initial is None:
+            cumulative = np.cumsum(self.stationary(seasons[0]))
+            state = self._pick(cumulative[None, :], draws[0])
+        elif isinstance(initial, (str, Weather)):
+            state = np.full(n_paths, state_index(initial))
+        else:
+            state = np.array([s if isinstance(s, (int, np.integer)) else state_index(s) for s in initial])
+        paths[:, 0] = state
+
+        for day in range(1, n_days):
+            state = self._pick(self._cumulative[seasons[day]][state], draws[day])
+            paths[:, day] = state
+        return paths
+
+    @staticmethod
+    def _pick(cumulative: np.ndarray, draws: np.ndarray) -> np.ndarray:
+        """Inverse-CDF choice of the next state for each path."""
+        return np.minimum((draws[:, None] >= cumulative).sum(axis=1), cumulative.shape[1] - 1)
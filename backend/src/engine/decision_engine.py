@@ -11,7 +11,9 @@ Policy:
 - Solar deficit + battery available → Discharge battery
 - Solar deficit + battery low → Use grid
 """
-from src.data.models import Action, EnvironmentState
+from typing import Optional
+
+from src.data.models import Action, BatterySpec, EnvironmentState
 from src.core.battery import BatteryState
 
 
@@ -28,18 +30,25 @@ class DecisionEngine:
     Attributes:
         peak_hours: Hours considered peak pricing (18:00-22:00)
         night_hours: Hours considered night pricing (23:00-07:00)
-        peak_soc_threshold: Minimum SOC to discharge during peak (0.40)
-        min_soc_threshold: Absolute minimum SOC to discharge (0.20)
-        max_soc_threshold: SOC above which to stop charging (0.95)
+        peak_soc_threshold: Minimum SOC to discharge during peak (0.40, or
+            min_soc if that is higher)
+        min_soc_threshold: Absolute minimum SOC to discharge (spec.min_soc)
+        max_soc_threshold: SOC above which to stop charging (spec.max_soc)
     """
     
-    def __init__(self):
-        """Initialize decision engine with policy parameters."""
+    def __init__(self, spec: Optional[BatterySpec] = None):
+        """Initialize decision engine with policy parameters.
+        
+        Args:
+            spec: Battery whose SOC bounds the policy respects
+                (None = default BatterySpec)
+        """
+        spec = spec or BatterySpec()
         self.peak_hours = list(range(18, 22))  # 18:00-22:00
         self.night_hours = list(range(23, 24)) + list(range(0, 7))  # 23:00-07:00
-        self.peak_soc_threshold = 0.40
-        self.min_soc_threshold = 0.20
-        self.max_soc_threshold = 0.95
+        self.peak_soc_threshold = max(0.40, spec.min_soc)
+        self.min_soc_threshold = spec.min_soc
+        self.max_soc_threshold = spec.max_soc
     
     def decide(
         self,
@@ -60,19 +69,44 @@ class DecisionEngine:
             - USE_GRID: Import from grid to meet load
             - IDLE: No action needed
         """
-        net_energy = env.solar_kwh - env.load_kwh
+        return self.decide_step(env.hour, env.solar_kwh, env.load_kwh, env.price, battery.soc)
+    
+    def decide_step(
+        self,
+        hour: int,
+        solar_kwh: float,
+        load_kwh: float,
+        price: float,
+        soc: float
+    ) -> Action:
+        """Determine the action from plain step values.
+        
+        Same policy as decide(), for callers that hold the environment as
+        arrays (SimulationRunner) and should not build state objects per step.
+        
+        Args:
+            hour: Hour of day (0-23)
+            solar_kwh: Solar generation for the step (kWh)
+            load_kwh: Consumption for the step (kWh)
+            price: Grid price (DZD/kWh)
+            soc: Battery state of charge (0-1)
+            
+        Returns:
+            Action to take
+        """
+        net_energy = solar_kwh - load_kwh
         
         if net_energy >= 0:
             # Solar surplus - either charge or export
-            return self._handle_surplus(net_energy, battery)
+            return self._handle_surplus(net_energy, soc)
         else:
             # Solar deficit - either discharge or import
-            return self._handle_deficit(abs(net_energy), battery, env.hour, env.price)
+            return self._handle_deficit(abs(net_energy), soc, hour, price)
     
     def _handle_surplus(
         self,
         surplus: float,
-        battery: BatteryState
+        soc: float
     ) -> Action:
         """Determine action when solar exceeds load.
         
@@ -82,12 +116,12 @@ class DecisionEngine:
         
         Args:
             surplus: Excess solar energy (kWh)
-            battery: Current battery state
+            soc: Battery state of charge (0-1)
             
         Returns:
             Action.CHARGE_BATTERY or Action.SELL_TO_GRID
         """
-        if battery.soc < self.max_soc_threshold:
+        if soc < self.max_soc_threshold:
             return Action.CHARGE_BATTERY
         else:
             return Action.SELL_TO_GRID
@@ -95,7 +129,7 @@ class DecisionEngine:
     def _handle_deficit(
         self,
         deficit: float,
-        battery: BatteryState,
+        soc: float,
         hour: int,
         price: float
     ) -> Action:
@@ -108,7 +142,7 @@ class DecisionEngine:
         
         Args:
             deficit: Energy shortage (kWh)
-            battery: Current battery state
+            soc: Battery state of charge (0-1)
             hour: Current hour (for TOU pricing)
             price: Current grid price (DZD/kWh)
             
@@ -118,11 +152,11 @@ class DecisionEngine:
         is_peak = hour in self.peak_hours
         
         # Peak hours: Use battery aggressively to avoid peak prices
-        if is_peak and battery.soc > self.peak_soc_threshold:
+        if is_peak and soc > self.peak_soc_threshold:
             return Action.DISCHARGE_BATTERY
         
         # Normal hours: Use battery if above minimum
-        if battery.soc > self.min_soc_threshold:
+        if soc > self.min_soc_threshold:
             return Action.DISCHARGE_BATTERY
         
         # Battery too low - must use grid
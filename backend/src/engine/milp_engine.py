@@ -2,11 +2,12 @@
 MILP-based Decision Engine for optimal energy management.
 
 Uses Mixed Integer Linear Programming to solve the battery optimization problem
-over the full time horizon (24 hours) rather than greedy hour-by-hour decisions.
+over the full time horizon (one variable set per timestep of the given
+environments, typically 24 hours) rather than greedy hour-by-hour decisions.
 
 Mathematical Formulation:
 -------------------------
-Variables (for each time t):
+Variables (for each time t, of length dt hours):
     - battery_charge[t]: Battery charge level (kWh)
     - grid_import[t]: Energy imported from grid (kWh)
     - grid_export[t]: Energy exported to grid (kWh)
@@ -17,25 +18,31 @@ Objective:
     Minimize sum(grid_import[t] * price[t] - grid_export[t] * export_price)
 
 Constraints:
-    1. Energy balance: solar[t] + discharge + import = load[t] + charge + export
-    2. Battery dynamics: charge[t+1] = charge[t] + efficiency * charge_rate - discharge_rate
+    1. Energy balance: solar[t] + discharge * dt + import = load[t] + charge * dt + export
+    2. Battery dynamics: charge[t+1] = charge[t] + (efficiency * charge_rate - discharge_rate) * dt
     3. SOC bounds: min_soc * capacity <= charge[t] <= max_soc * capacity
     4. Power limits: 0 <= charge_rate <= max_charge, 0 <= discharge_rate <= max_discharge
     5. No simultaneous charge/discharge (complementarity)
+
+Efficiencies, SOC bounds and power limits come from a BatterySpec per home.
+optimize_schedules() solves several homes (with different specs) as one
+block-diagonal model in a single solver call.
 """
-from typing import List, Optional
-import pulp
+from typing import List, Optional, Sequence, Tuple, Union
 
-from src.data.models import Action, EnvironmentState
-from src.core.battery import BatteryState, Battery
+from src.data.models import Action, BatterySpec, EnvironmentArrays, EnvironmentState
+from src.core.battery import BatteryState
 from src.utils.config import GRID_EXPORT_PRICE
 
+Environments = Union[Sequence[EnvironmentState], EnvironmentArrays]
+
 
 class MILPDecisionEngine:
     """MILP-based optimization engine for energy management.
     
     Solves the battery scheduling problem as a Mixed Integer Linear Program
-    over a 24-hour horizon to minimize total electricity costs.
+    over the horizon of the given environments (typically one 24-hour day;
+    longer runs are solved day by day) to minimize total electricity costs.
     
     Advantages over rule-based:
     - Global optimization (not greedy)
@@ -68,25 +75,86 @@ class MILPDecisionEngine:
     
     def optimize_schedule(
         self,
-        environments: List[EnvironmentState],
-        initial_battery: BatteryState
+        environments: Environments,
+        initial_battery: BatteryState,
+        dt_hours: float = 1.0,
+        spec: Optional[BatterySpec] = None
     ) -> List[Action]:
-        """Generate optimal 24-hour action schedule.
+        """Generate optimal action schedule for the horizon.
         
-        Solves MILP to determine best action for each hour considering
+        Solves MILP to determine best action for each timestep considering
         the full time horizon and all constraints.
         
         Args:
-            environments: List of 24 EnvironmentState (one per hour)
+            environments: EnvironmentState per timestep (typically 24), or
+                EnvironmentArrays to read the price vector directly
             initial_battery: Starting battery state
+            dt_hours: Timestep length in hours
+            spec: Battery parameters (None = default BatterySpec)
             
         Returns:
-            List of 24 Actions (one per hour)
+            List of Actions (one per timestep)
         """
         # Build and solve MILP
-        model, variables = self._build_milp(environments, initial_battery)
+        model, variables = self._build_milp(environments, initial_battery, dt_hours, spec)
+        self._solve(model)
+        
+        # Extract actions from solution
+        actions = []
+        for t in range(len(environments)):
+            action = self._determine_action_from_solution(variables, t)
+            actions.append(action)
+        
+        return actions
+    
+    def optimize_schedules(
+        self,
+        homes: Sequence[Environments],
+        initial_batteries: Sequence[BatteryState],
+        dt_hours: float = 1.0,
+        specs: Optional[Sequence[Optional[BatterySpec]]] = None
+    ) -> List[List[Action]]:
+        """Optimal schedules for several homes in one solver call.
+        
+        Homes share no constraints, so the joint optimum is each home's
+        optimum; batching only saves the per-call model and solver
+        overhead. Homes may have different horizons and battery specs.
         
-        # Solve
+        Args:
+            homes: Environments per home
+            initial_batteries: Starting battery state per home
+            dt_hours: Timestep length in hours
+            specs: Battery parameters per home (None = default BatterySpec)
+            
+        Returns:
+            One list of Actions per home
+            
+        Raises:
+            ValueError: If the per-home sequences differ in length
+        """
+        import pulp
+        specs = [None] * len(homes) if specs is None else specs
+        if not len(homes) == len(initial_batteries) == len(specs):
+            raise ValueError("homes, initial_batteries and specs must have the same length")
+        
+        model = pulp.LpProblem("FleetBatteryOptimization", pulp.LpMinimize)
+        objective = []
+        per_home = []
+        for h, (environments, battery, spec) in enumerate(zip(homes, initial_batteries, specs)):
+            variables, cost = self._add_home(model, environments, battery, dt_hours, spec, prefix=f"h{h}_")
+            objective.append(cost)
+            per_home.append((variables, len(environments)))
+        model += pulp.lpSum(objective)
+        self._solve(model)
+        
+        return [
+            [self._determine_action_from_solution(variables, t) for t in range(n)]
+            for variables, n in per_home
+        ]
+    
+    def _solve(self, model) -> None:
+        """Solve a model in place, warning unless it is optimal."""
+        import pulp  # Deferred: pulp is only needed once a schedule is solved
         solver = pulp.getSolver(
             self.solver_name,
             timeLimit=self.time_limit_sec,
@@ -100,87 +168,115 @@ class MILPDecisionEngine:
         if pulp.LpStatus[model.status] != 'Optimal':
             import logging
             logging.warning(f"MILP status = {pulp.LpStatus[model.status]}")
-        
-        # Extract actions from solution
-        actions = []
-        for t in range(24):
-            action = self._determine_action_from_solution(variables, t)
-            actions.append(action)
-        
-        return actions
     
     def _build_milp(
         self,
-        environments: List[EnvironmentState],
-        initial_battery: BatteryState
+        environments: Environments,
+        initial_battery: BatteryState,
+        dt_hours: float = 1.0,
+        spec: Optional[BatterySpec] = None
     ) -> tuple:
         """Build the MILP model.
         
         Args:
-            environments: 24 hours of environment data
+            environments: Environment data, one per timestep
             initial_battery: Starting battery state
+            dt_hours: Timestep length in hours
+            spec: Battery parameters (None = default BatterySpec)
             
         Returns:
             Tuple of (model, variables_dict)
         """
+        import pulp
         # Create model
         model = pulp.LpProblem("BatteryOptimization", pulp.LpMinimize)
+        variables, objective = self._add_home(model, environments, initial_battery, dt_hours, spec)
+        model += objective
+        return model, variables
+    
+    def _add_home(
+        self,
+        model,
+        environments: Environments,
+        initial_battery: BatteryState,
+        dt_hours: float,
+        spec: Optional[BatterySpec],
+        prefix: str = ""
+    ) -> tuple:
+        """Add one home's variables and constraints to a model.
+        
+        Rates are power in kW; energy moved in a timestep is rate * dt_hours.
+        Capacity and initial charge come from initial_battery, everything
+        else from spec.
+        
+        Args:
+            model: pulp model to extend
+            environments: Environment data, one per timestep
+            initial_battery: Starting battery state
+            dt_hours: Timestep length in hours
+            spec: Battery parameters (None = default BatterySpec)
+            prefix: Prefix for variable and constraint names
+            
+        Returns:
+            Tuple of (variables_dict, cost expression)
+        """
+        import pulp
+        spec = spec or BatterySpec()
         
         # Time periods
-        T = range(24)
+        T = range(len(environments))
         
         # Extract data
-        solar = [env.solar_kwh for env in environments]
-        load = [env.load_kwh for env in environments]
-        price = [env.price for env in environments]
+        solar, load, price = _columns(environments)
         
         # Battery parameters
         capacity = initial_battery.capacity_kwh
         initial_charge = initial_battery.charge_kwh
-        min_soc = Battery.MIN_SOC
-        max_soc = Battery.MAX_SOC
-        charge_eff = Battery.CHARGE_EFFICIENCY
-        discharge_eff = Battery.DISCHARGE_EFFICIENCY
-        max_charge_rate = Battery.MAX_CHARGE_RATE_KW
-        max_discharge_rate = Battery.MAX_DISCHARGE_RATE_KW
+        min_soc = spec.min_soc
+        max_soc = spec.max_soc
+        charge_eff = spec.charge_efficiency
+        discharge_eff = spec.discharge_efficiency
+        dt = dt_hours
+        max_charge_rate = spec.max_charge_rate_kw
+        max_discharge_rate = spec.max_discharge_rate_kw
         export_price = GRID_EXPORT_PRICE  # DZD/kWh
         
         # Decision variables
         # Battery charge level at end of each period
         battery_charge = pulp.LpVariable.dicts(
-            "battery_charge", T, 
+            prefix + "battery_charge", T, 
             lowBound=min_soc * capacity, 
             upBound=max_soc * capacity
         )
         
         # Grid import (buying from grid)
         grid_import = pulp.LpVariable.dicts(
-            "grid_import", T, lowBound=0
+            prefix + "grid_import", T, lowBound=0
         )
         
         # Grid export (selling to grid)
         grid_export = pulp.LpVariable.dicts(
-            "grid_export", T, lowBound=0
+            prefix + "grid_export", T, lowBound=0
         )
         
         # Charging power from solar
         charge_rate = pulp.LpVariable.dicts(
-            "charge_rate", T, lowBound=0, upBound=max_charge_rate
+            prefix + "charge_rate", T, lowBound=0, upBound=max_charge_rate
         )
         
         # Discharging power to meet load
         discharge_rate = pulp.LpVariable.dicts(
-            "discharge_rate", T, lowBound=0, upBound=max_discharge_rate
+            prefix + "discharge_rate", T, lowBound=0, upBound=max_discharge_rate
         )
         
         # Binary variable: 1 if charging, 0 if discharging (prevents simultaneous)
         is_charging = pulp.LpVariable.dicts(
-            "is_charging", T, cat='Binary'
+            prefix + "is_charging", T, cat='Binary'
         )
         
         # Objective: Minimize total cost
         # Cost = import * price - export * export_price
-        model += pulp.lpSum([
+        objective = pulp.lpSum([
             grid_import[t] * price[t] - grid_export[t] * export_price
             for t in T
         ])
@@ -189,9 +285,9 @@ class MILPDecisionEngine:
         for t in T:
             # Energy balance: solar + discharge + import = load + charge + export
             model += (
-                solar[t] + discharge_rate[t] * discharge_eff + grid_import[t] ==
-                load[t] + charge_rate[t] + grid_export[t],
-                f"EnergyBalance_{t}"
+                solar[t] + discharge_rate[t] * (discharge_eff * dt) + grid_import[t] ==
+                load[t] + charge_rate[t] * dt + grid_export[t],
+                f"{prefix}EnergyBalance_{t}"
             )
             
             # Battery dynamics
@@ -199,15 +295,15 @@ class MILPDecisionEngine:
                 # Initial condition
                 model += (
                     battery_charge[t] == initial_charge + 
-                    charge_rate[t] * charge_eff - discharge_rate[t],
-                    f"BatteryDynamics_{t}"
+                    charge_rate[t] * (charge_eff * dt) - discharge_rate[t] * dt,
+                    f"{prefix}BatteryDynamics_{t}"
                 )
             else:
                 # State transition
                 model += (
                     battery_charge[t] == battery_charge[t-1] + 
-                    charge_rate[t] * charge_eff - discharge_rate[t],
-                    f"BatteryDynamics_{t}"
+                    charge_rate[t] * (charge_eff * dt) - discharge_rate[t] * dt,
+                    f"{prefix}BatteryDynamics_{t}"
                 )
             
             # Complementarity: Cannot charge and discharge simultaneously
@@ -217,21 +313,21 @@ class MILPDecisionEngine:
             
             model += (
                 charge_rate[t] <= is_charging[t] * M,
-                f"ChargeOnlyIfCharging_{t}"
+                f"{prefix}ChargeOnlyIfCharging_{t}"
             )
             model += (
                 discharge_rate[t] <= (1 - is_charging[t]) * M,
-                f"DischargeOnlyIfNotCharging_{t}"
+                f"{prefix}DischargeOnlyIfNotCharging_{t}"
             )
         
-        return model, {
+        return {
             'battery_charge': battery_charge,
             'grid_import': grid_import,
             'grid_export': grid_export,
             'charge_rate': charge_rate,
             'discharge_rate': discharge_rate,
             'is_charging': is_charging
-        }
+        }, objective
     
     def _determine_action_from_solution(self, variables: dict, t: int) -> Action:
         """Determine discrete action from MILP solution.
@@ -243,6 +339,7 @@ class MILPDecisionEngine:
         Returns:
             Action enum
         """
+        import pulp
         charge_rate = pulp.value(variables['charge_rate'][t])
         discharge_rate = pulp.value(variables['discharge_rate'][t])
         grid_export = pulp.value(variables['grid_export'][t])
@@ -264,33 +361,30 @@ class MILPDecisionEngine:
     
     def get_schedule_details(
         self,
-        environments: List[EnvironmentState],
-        initial_battery: BatteryState
+        environments: Environments,
+        initial_battery: BatteryState,
+        dt_hours: float = 1.0,
+        spec: Optional[BatterySpec] = None
     ) -> List[dict]:
         """Get detailed schedule with all variable values.
         
         Useful for debugging and visualization.
         
         Args:
-            environments: 24 hours of environment data
+            environments: Environment data, one per timestep
             initial_battery: Starting battery state
+            dt_hours: Timestep length in hours
+            spec: Battery parameters (None = default BatterySpec)
             
         Returns:
-            List of dicts with detailed solution for each hour
+            List of dicts with detailed solution for each timestep
         """
-        model, variables = self._build_milp(environments, initial_battery)
-        
-        solver = pulp.getSolver(
-            self.solver_name,
-            timeLimit=self.time_limit_sec,
-            mip=self.mip_gap,
-            msg=False
-        )
-        
-        model.solve(solver)
+        import pulp
+        model, variables = self._build_milp(environments, initial_battery, dt_hours, spec)
+        self._solve(model)
         
         details = []
-        for t in range(24):
+        for t in range(len(environments)):
             details.append({
                 'hour': t,
                 'battery_charge': pulp.value(variables['battery_charge'][t]),
@@ -302,3 +396,20 @@ class MILPDecisionEngine:
             })
         
         return details
+
+
+def _columns(
+    environments: Environments
+) -> Tuple[List[float], List[float], List[float]]:
+    """(solar, load, price) lists from states or straight from arrays."""
+    if isinstance(environments, EnvironmentArrays):
+        return (
+            environments.solar_kwh.tolist(),
+            environments.load_kwh.tolist(),
+            environments.price.tolist()
+        )
+    return (
+        [env.solar_kwh for env in environments],
+        [env.load_kwh for env in environments],
+        [env.price for env in environments]
+    )
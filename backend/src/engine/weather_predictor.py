@@ -19,7 +19,8 @@ class WeatherPredictor:
         self,
         tomorrow_weather: Optional[Weather],
         battery_state: BatteryState,
-        current_hour: int = 20
+        current_hour: int = 20,
+        min_soc: float = BATTERY_MIN_SOC
     ):
         """Initialize weather predictor.
         
@@ -27,10 +28,12 @@ class WeatherPredictor:
             tomorrow_weather: Weather forecast for tomorrow
             battery_state: Current battery state
             current_hour: Current hour (default 20:00 for evening planning)
+            min_soc: Minimum state of charge of the battery
         """
         self.tomorrow_weather = tomorrow_weather
         self.battery_state = battery_state
         self.current_hour = current_hour
+        self.min_soc = min_soc
         
     @property
     def current_battery_soc(self) -> float:
@@ -50,13 +53,13 @@ class WeatherPredictor:
             return alerts
         
         # Critical battery + cloudy tomorrow
-        if (self.current_battery_soc < BATTERY_MIN_SOC + 0.10 and 
+        if (self.current_battery_soc < self.min_soc + 0.10 and 
             self.tomorrow_weather in [Weather.CLOUDY, Weather.RAINY]):
             alerts.append(Alert(
                 type="danger",
                 message="Critical Battery Alert",
                 priority=1,
-                recommendation="Battery below 30% with poor weather forecasted. "
+                recommendation=f"Battery below {self.min_soc + 0.10:.0%} with poor weather forecasted. "
                             "Minimize non-essential usage tonight. Consider charging from grid if rates are low.",
                 icon="alert-circle"
             ))
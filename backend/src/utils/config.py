@@ -25,6 +25,24 @@ WEATHER_MULTIPLIERS = {
     "rainy": 0.2
 }
 
+# Daily weather Markov chain (see src/data/weather_chain.py)
+# Rows: today's weather, columns: tomorrow's, both in WEATHER_STATES order
+WEATHER_STATES = ("sunny", "partly_cloudy", "cloudy", "rainy")
+WEATHER_TRANSITIONS = {
+    "summer": [
+        [0.80, 0.14, 0.05, 0.01],
+        [0.45, 0.35, 0.15, 0.05],
+        [0.30, 0.30, 0.30, 0.10],
+        [0.25, 0.25, 0.30, 0.20]
+    ],
+    "winter": [
+        [0.50, 0.25, 0.15, 0.10],
+        [0.30, 0.35, 0.20, 0.15],
+        [0.15, 0.25, 0.35, 0.25],
+        [0.10, 0.20, 0.30, 0.40]
+    ]
+}
+
 # Time-of-Use Pricing (DZD/kWh) - Algeria Sonelgaz rates 2025
 # Based on GlobalPetrolPrices.com June 2025 data: Residential DZD 5.65/kWh
 # Using smart grid simulation with peak/off-peak differentials
@@ -34,6 +52,9 @@ PRICING = {
     "night": 4.80      # 23:00-07:00 - Off-peak (15% discount)
 }
 
+# Time-of-use period of each hour of the day (index = hour)
+TOU_SCHEDULE = ("night",) * 7 + ("normal",) * 11 + ("peak",) * 4 + ("normal", "night")
+
 # Grid export price when selling excess energy (net metering/feed-in)
 # Algeria currently developing solar feed-in tariffs
 GRID_EXPORT_PRICE = 4.00        # DZD/kWh (70% of retail rate)
@@ -59,6 +80,9 @@ SEASON_MULTIPLIERS = {
     "winter": 0.8      # Lower consumption
 }
 
+# Calendar months simulated as summer (April-September); the rest are winter
+SUMMER_MONTHS = (4, 5, 6, 7, 8, 9)
+
 # Environmental Impact Factors - Algeria Context
 # Algeria's grid is 99% natural gas (IEA 2022 data)
 CO2_FACTOR = 0.55       # kg CO2 per kWh (natural gas + transmission losses)
@@ -88,12 +112,28 @@ COLORS = {
 
 
 def get_price_for_hour(hour: int) -> float:
-    """Get electricity price for a specific hour."""
-    if 18 <= hour < 22:
-        return PRICING["peak"]
-    elif hour >= 23 or hour < 7:
-        return PRICING["night"]
-    return PRICING["normal"]
+    """Get electricity price for a specific hour.
+    
+    Scalar lookup; horizons use Tariff.price_vector (src/data/tariff.py).
+    """
+    return PRICING[TOU_SCHEDULE[hour % 24]]
+
+
+def steps_per_hour(dt_hours: float) -> int:
+    """Number of simulation timesteps per hour.
+    
+    Raises:
+        ValueError: If dt_hours does not divide one hour evenly
+    """
+    steps = round(1 / dt_hours) if dt_hours > 0 else 0
+    if steps < 1 or abs(steps * dt_hours - 1) > 1e-9:
+        raise ValueError(f"Timestep of {dt_hours} h must divide one hour evenly")
+    return steps
+
+
+def get_season_for_month(month: int) -> str:
+    """Determine simulated season ('summer' or 'winter') for a calendar month."""
+    return "summer" if month in SUMMER_MONTHS else "winter"
 
 
 def get_consumption_period(hour: int) -> str:
@@ -7,3 +7,77 @@ import os
 
 # Add backend/src to path for tests
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+@pytest.fixture
+def solar_model_path(tmp_path):
+    """Small tree model trained on the solar feature layout."""
+    import joblib
+    import numpy as np
+    import pandas as pd
+    from sklearn.tree import DecisionTreeRegressor
+
+    rng = np.random.default_rng(0)
+    n = 500
+    features = pd.DataFrame({
+        'Hour': rng.integers(0, 24, n),
+        'Day': rng.integers(1, 32, n),
+        'Month': rng.integers(1, 13, n),
+        'G(i)': rng.choice([100, 200, 500, 800], n),
+        'T2m': rng.uniform(10, 35, n),
+    })
+    target = features['G(i)'] * np.sin(np.pi * features['Hour'] / 24) * (0.45 - 0.005 * features['T2m'])
+    model = DecisionTreeRegressor(max_depth=6, random_state=0).fit(features, target)
+
+    path = tmp_path / "solar_pv_model.pkl"
+    joblib.dump(model, path)
+    return path
+
+
+@pytest.fixture
+def consumption_model_path(tmp_path):
+    """Small tree model trained on the consumption feature layout."""
+    import joblib
+    import numpy as np
+    import pandas as pd
+    from sklearn.tree import DecisionTreeRegressor
+
+    rng = np.random.default_rng(1)
+    n = 500
+    features = pd.DataFrame({
+        'Hour': rng.integers(0, 24, n),
+        'Day': rng.integers(1, 32, n),
+        'Month': rng.integers(1, 13, n),
+        'DayOfWeek': rng.integers(0, 7, n),
+        'Weekend': rng.integers(0, 2, n),
+    })
+    target = 0.5 + 0.1 * features['Hour'] + 0.3 * features['Weekend']
+    model = DecisionTreeRegressor(max_depth=6, random_state=0).fit(features, target)
+
+    path = tmp_path / "time_power_model.pkl"
+    joblib.dump(model, path)
+    return path
+
+
+@pytest.fixture
+def model_dir(tmp_path, solar_model_path, consumption_model_path, monkeypatch):
+    """Default model paths redirected to a temporary models directory."""
+    import shutil
+
+    from src.ai.model_manager import ModelManager
+    from src.ai.solar_predictor import SolarPredictor
+    from src.ai.consumption_predictor import ConsumptionPredictor
+
+    models = tmp_path / "models"
+    models.mkdir()
+    shutil.copy(solar_model_path, models / "solar_pv_model.pkl")
+    shutil.copy(consumption_model_path, models / "time_power_model.pkl")
+
+    monkeypatch.setattr(SolarPredictor, 'default_model_path',
+                        staticmethod(lambda: models / "solar_pv_model.pkl"))
+    monkeypatch.setattr(ConsumptionPredictor, 'default_model_path',
+                        staticmethod(lambda: models / "time_power_model.pkl"))
+    monkeypatch.setenv('INTELLIGRID_PREDICTION_TABLE', str(tmp_path / "no_table.npy"))
+    ModelManager.reset_instance()
+    yield models
+    ModelManager.reset_instance()
@@ -0,0 +1,177 @@
+"""
+Tests for AI predictors.
+
+Tests verify:
+- Batched inference matches per-hour inference
+- Batched inference makes a single model call
+- Horizon forecasts use correct calendar features
+- Fallback mode still produces a full horizon
+- Vectorized fallback profiles match the simulator
+"""
+import datetime
+
+import numpy as np
+import pytest
+
+from src.ai.solar_predictor import SolarPredictor
+from src.ai.consumption_predictor import ConsumptionPredictor, calendar_features
+from src.data.models import SimulationConfig, Season, Weather, DayType
+from src.data.profiles import fallback_profile, FALLBACK_SEED
+from src.data.simulator import EnergyDataSimulator
+
+
+class CountingModel:
+    """Wraps a model and counts predict() calls."""
+
+    def __init__(self, model):
+        self.model = model
+        self.calls = 0
+
+    def predict(self, features):
+        self.calls += 1
+        return self.model.predict(features)
+
+
+class TestSolarPredictBatch:
+    """predict_batch must match predict while calling the model once."""
+
+    def test_batch_matches_scalar(self, solar_model_path):
+        """Batched predictions equal per-hour predictions."""
+        predictor = SolarPredictor(solar_model_path)
+        assert not predictor.is_using_fallback()
+
+        batch = predictor.predict_batch(range(24), 15, 6, 'cloudy', 'summer')
+        scalar = [predictor.predict(h, 15, 6, 'cloudy', 'summer') for h in range(24)]
+
+        assert batch.shape == (24,)
+        np.testing.assert_allclose(batch, scalar)
+
+    def test_batch_single_model_call(self, solar_model_path):
+        """The whole horizon is predicted with one model call."""
+        predictor = SolarPredictor(solar_model_path)
+        predictor.model = CountingModel(predictor.model)
+        predictor.engine = None  # Exercise the sklearn path
+
+        predictor.predict_batch(range(24), 15, 6, 'sunny', 'summer')
+
+        assert predictor.model.calls == 1
+
+    def test_batch_non_negative(self, solar_model_path):
+        """Predictions are clipped to be non-negative."""
+        predictor = SolarPredictor(solar_model_path)
+
+        batch = predictor.predict_batch(range(24), 1, 12, 'rainy', 'winter')
+
+        assert (batch >= 0).all()
+
+    def test_fallback_batch_covers_horizon(self, tmp_path):
+        """Missing model falls back to simulation for every hour."""
+        predictor = SolarPredictor(tmp_path / "missing.pkl")
+        assert predictor.is_using_fallback()
+
+        batch = predictor.predict_batch(range(24), 15, 6, 'sunny', 'summer')
+
+        assert batch.shape == (24,)
+        assert batch[0] == 0.0  # Night
+        assert batch[12] > 0.0  # Midday
+
+
+class TestCalendarFeatures:
+    """Calendar table must agree with datetime."""
+
+    def test_matches_datetime(self):
+        """Day, month, weekday and weekend columns match datetime.date."""
+        start = datetime.date(2023, 12, 28)
+        end = datetime.date(2024, 3, 2)
+        table = calendar_features(start, end)
+
+        assert table.shape == (((end - start).days + 1) * 24, 5)
+        for i in range(0, len(table), 24):
+            date = start + datetime.timedelta(days=i // 24)
+            hour, day, month, dayofweek, weekend = table[i]
+            assert (hour, day, month, dayofweek) == (0, date.day, date.month, date.weekday())
+            assert weekend == (date.weekday() >= 5)
+
+    def test_table_is_cached_and_read_only(self):
+        """Same range returns the same read-only table."""
+        start, end = datetime.date(2024, 1, 1), datetime.date(2024, 12, 31)
+
+        table = calendar_features(start, end)
+
+        assert calendar_features(start, end) is table
+        assert not table.flags.writeable
+
+
+class TestConsumptionPredictHorizon:
+    """predict_horizon must match per-hour predict over a date range."""
+
+    def test_horizon_matches_scalar(self, consumption_model_path):
+        """Horizon forecast equals per-hour predictions with real weekdays."""
+        predictor = ConsumptionPredictor(consumption_model_path)
+        start, end = datetime.date(2024, 3, 1), datetime.date(2024, 3, 3)
+
+        horizon = predictor.predict_horizon(start, end)
+
+        expected = [
+            predictor.predict(h, d.day, d.month, d.weekday(), int(d.weekday() >= 5))
+            for d in (start + datetime.timedelta(days=i) for i in range(3))
+            for h in range(24)
+        ]
+        np.testing.assert_allclose(horizon, expected)
+
+    def test_full_year_runs_in_chunks(self, consumption_model_path):
+        """A year-long forecast makes one model call per chunk."""
+        predictor = ConsumptionPredictor(consumption_model_path)
+        predictor.model = CountingModel(predictor.model)
+
+        horizon = predictor.predict_horizon(datetime.date(2023, 1, 1), datetime.date(2023, 12, 31))
+
+        assert horizon.shape == (8760,)
+        assert predictor.model.calls == -(-8760 // predictor.HORIZON_CHUNK_SIZE)
+
+    def test_fallback_horizon(self, tmp_path):
+        """Missing model falls back to a repeating daily profile."""
+        predictor = ConsumptionPredictor(tmp_path / "missing.pkl")
+
+        horizon = predictor.predict_horizon(datetime.date(2024, 6, 1), datetime.date(2024, 6, 7))
+
+        assert horizon.shape == (7 * 24,)
+        np.testing.assert_array_equal(horizon[:24], horizon[24:48])
+        assert horizon[7] == pytest.approx(predictor.predict(7, 1, 6))
+
+
+class TestFallbackProfile:
+    """Vectorized fallback must match the per-hour simulator it replaces."""
+
+    @pytest.mark.parametrize("season", [Season.SUMMER, Season.WINTER])
+    @pytest.mark.parametrize("weather", list(Weather))
+    def test_matches_fresh_simulator_per_hour(self, season, weather):
+        """Each hour equals a fresh seed-42 simulator generating that hour."""
+        solar, load = fallback_profile(season.value, weather.value)
+
+        for hour in range(24):
+            config = SimulationConfig(season=season, weather=weather, day_type=DayType.WEEKDAY)
+            env = EnergyDataSimulator(config, seed=FALLBACK_SEED, use_ai=False) \
+                .generate_environment_for_hour(hour)
+            assert solar[hour] == pytest.approx(env.solar_kwh)
+            assert load[hour] == pytest.approx(env.load_kwh)
+
+    def test_profile_is_cached_and_read_only(self):
+        """Same inputs return the same read-only arrays."""
+        solar, load = fallback_profile('summer', 'sunny')
+
+        assert fallback_profile('summer', 'sunny')[0] is solar
+        assert not solar.flags.writeable
+        assert not load.flags.writeable
+
+    def test_fallback_builds_no_simulators(self, tmp_path, monkeypatch):
+        """Fallback predictions never construct an EnergyDataSimulator."""
+        def fail(*args, **kwargs):
+            raise AssertionError("EnergyDataSimulator must not be constructed")
+
+        monkeypatch.setattr(EnergyDataSimulator, '__init__', fail)
+        solar = SolarPredictor(tmp_path / "missing.pkl")
+        consumption = ConsumptionPredictor(tmp_path / "missing.pkl")
+
+        assert solar.predict_batch(range(24), 15, 6).shape == (24,)
+        assert consumption.predict_batch(range(24), 15, 6).shape == (24,)
@@ -0,0 +1,103 @@
+"""
+Tests for shared, memory-mapped model artifacts.
+
+Tests verify:
+- Flattened engines round-trip through save/load as read-only memory maps
+- Cache entries are built once per model version
+- Predictors in shared mode match private joblib-loaded predictors
+"""
+import datetime
+import os
+
+import joblib
+import numpy as np
+import pytest
+
+from src.ai.artifact_cache import artifact_version, load_shared_engine
+from src.ai.tree_engine import FlatTreeEnsemble
+from src.ai.solar_predictor import SolarPredictor, FEATURES as SOLAR_FEATURES
+from src.ai.consumption_predictor import ConsumptionPredictor
+
+
+@pytest.fixture
+def shared_mode(tmp_path, monkeypatch):
+    """Enable shared models with a temporary artifact cache."""
+    cache_dir = tmp_path / "artifact_cache"
+    monkeypatch.setenv('INTELLIGRID_SHARED_MODELS', '1')
+    monkeypatch.setenv('INTELLIGRID_ARTIFACT_CACHE', str(cache_dir))
+    return cache_dir
+
+
+class TestArtifactCache:
+    """Cache entries must be memory-mapped and built once."""
+
+    def test_save_load_round_trip(self, solar_model_path, tmp_path):
+        """Loaded engine is memory-mapped and predicts identically."""
+        engine = FlatTreeEnsemble.from_estimator(joblib.load(solar_model_path))
+        loaded = FlatTreeEnsemble.load(engine.save(tmp_path / "engine"))
+
+        X = np.random.default_rng(0).uniform(0, 800, (100, 5))
+        assert isinstance(loaded.threshold, np.memmap)
+        assert not loaded.threshold.flags.writeable
+        assert loaded.feature_names == engine.feature_names
+        np.testing.assert_array_equal(loaded.predict(X), engine.predict(X))
+
+    def test_entry_built_once(self, solar_model_path, tmp_path, monkeypatch):
+        """The second load maps the cache without unpickling the model."""
+        cache_dir = tmp_path / "cache"
+        load_shared_engine(solar_model_path, SOLAR_FEATURES, cache_dir)
+
+        def no_load(*args, **kwargs):
+            raise AssertionError("joblib.load must not be called")
+
+        monkeypatch.setattr(joblib, 'load', no_load)
+        assert load_shared_engine(solar_model_path, SOLAR_FEATURES, cache_dir) is not None
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_new_model_version_new_entry(self, solar_model_path, tmp_path):
+        """Replacing the .pkl creates a separate cache entry."""
+        cache_dir = tmp_path / "cache"
+        load_shared_engine(solar_model_path, SOLAR_FEATURES, cache_dir)
+
+        stat = solar_model_path.stat()
+        os.utime(solar_model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        load_shared_engine(solar_model_path, SOLAR_FEATURES, cache_dir)
+
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_missing_model(self, tmp_path):
+        """Missing models are not cached."""
+        assert load_shared_engine(tmp_path / "missing.pkl", SOLAR_FEATURES, tmp_path) is None
+
+
+class TestSharedPredictors:
+    """Shared-mode predictors must serve from the memory map only."""
+
+    def test_solar_matches_private(self, solar_model_path, shared_mode, monkeypatch):
+        """Shared solar predictions equal joblib-loaded ones."""
+        shared = SolarPredictor(solar_model_path)
+        assert shared.model is None
+        assert isinstance(shared.engine.value, np.memmap)
+        assert shared.version == artifact_version(solar_model_path)
+
+        monkeypatch.setenv('INTELLIGRID_SHARED_MODELS', '0')
+        private = SolarPredictor(solar_model_path)
+
+        np.testing.assert_allclose(
+            shared.predict_batch(range(24), 15, 6, 'cloudy', 'summer'),
+            private.predict_batch(range(24), 15, 6, 'cloudy', 'summer')
+        )
+
+    def test_consumption_year_horizon(self, consumption_model_path, shared_mode, monkeypatch):
+        """Long horizons are served by the engine when there is no model."""
+        shared = ConsumptionPredictor(consumption_model_path)
+        assert shared.model is None
+
+        monkeypatch.setenv('INTELLIGRID_SHARED_MODELS', '0')
+        private = ConsumptionPredictor(consumption_model_path)
+
+        start, end = datetime.date(2024, 1, 1), datetime.date(2024, 12, 31)
+        np.testing.assert_allclose(
+            shared.predict_horizon(start, end),
+            private.predict_horizon(start, end)
+        )
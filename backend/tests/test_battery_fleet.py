@@ -0,0 +1,100 @@
+"""
+Tests for the vectorized BatteryFleet kernel.
+
+Tests verify:
+- Every battery matches a scalar Battery exactly, step by step
+- MIN_SOC/MAX_SOC clipping, rate limits and efficiency math
+- Per-battery parameters and input validation
+"""
+import numpy as np
+import pytest
+
+from src.core.battery import Battery
+from src.core.battery_fleet import BatteryFleet
+from src.data.models import BatterySpec
+
+
+def scalar_step(batteries, charge, discharge, dt_hours):
+    """Reference: charge then discharge each scalar battery."""
+    out = np.array([
+        battery.charge(c, dt_hours) + battery.discharge(d, dt_hours)
+        for battery, c, d in zip(batteries, charge.tolist(), discharge.tolist())
+    ])
+    return out.T
+
+
+class TestScalarEquivalence:
+    """Fleet elements are bitwise equal to scalar batteries."""
+
+    @pytest.mark.parametrize("dt_hours", [1.0, 0.25, 1 / 12])
+    def test_random_requests(self, dt_hours):
+        """Random SOCs and requests (including none and negative) over many steps."""
+        rng = np.random.default_rng(7)
+        n = 300
+        capacities = rng.uniform(5, 20, n)
+        socs = np.concatenate([[0.0, Battery.MIN_SOC, Battery.MAX_SOC, 1.0], rng.uniform(0, 1, n - 4)])
+        batteries = [Battery(c, initial_soc=s) for c, s in zip(capacities.tolist(), socs.tolist())]
+        fleet = BatteryFleet(capacities, initial_soc=socs)
+
+        for _ in range(48):
+            charge = np.where(rng.random(n) < 0.3, 0.0, rng.uniform(-1, 8, n))
+            discharge = np.where(rng.random(n) < 0.3, 0.0, rng.uniform(-1, 8, n))
+            expected = scalar_step(batteries, charge, discharge, dt_hours)
+            step = fleet.step(charge, discharge, dt_hours)
+
+            np.testing.assert_array_equal(step.consumed, expected[0])
+            np.testing.assert_array_equal(step.stored, expected[1])
+            np.testing.assert_array_equal(step.drawn, expected[2])
+            np.testing.assert_array_equal(step.delivered, expected[3])
+            np.testing.assert_array_equal(fleet.charge_kwh, [b.charge_kwh for b in batteries])
+
+    def test_from_batteries_keeps_specs(self):
+        """Per-battery specs carry into the fleet."""
+        slow = Battery(initial_soc=0.5, spec=BatterySpec(10.0, max_charge_rate_kw=1.0, max_discharge_rate_kw=1.0))
+        lossy = Battery(initial_soc=0.9, spec=BatterySpec(charge_efficiency=0.85, discharge_efficiency=0.9, min_soc=0.1))
+        fleet = BatteryFleet.from_batteries([slow, lossy])
+        charge, discharge = np.array([4.0, 4.0]), np.array([6.0, 6.0])
+
+        expected = scalar_step([slow, lossy], charge, discharge, 1.0)
+        step = fleet.step(charge, discharge)
+
+        np.testing.assert_array_equal([step.consumed, step.stored, step.drawn, step.delivered], expected)
+        assert fleet.state(1).soc == lossy.state.soc
+
+
+class TestPhysics:
+    """Clipping, rate limits and efficiency."""
+
+    def test_soc_bounds_clip(self):
+        """Charging stops at MAX_SOC, discharging at MIN_SOC."""
+        fleet = BatteryFleet([10.0, 10.0], initial_soc=[0.9, 0.25], max_charge_rate_kw=100, max_discharge_rate_kw=100)
+
+        consumed, stored = fleet.charge([50.0, 0.0])
+        drawn, delivered = fleet.discharge([0.0, 50.0])
+
+        assert fleet.soc[0] == pytest.approx(Battery.MAX_SOC)
+        assert fleet.soc[1] == pytest.approx(Battery.MIN_SOC)
+        assert stored[0] == pytest.approx(consumed[0] * Battery.CHARGE_EFFICIENCY)
+        assert delivered[1] == pytest.approx(drawn[1] * Battery.DISCHARGE_EFFICIENCY)
+
+    def test_rate_limit_scales_with_timestep(self):
+        """Energy per step is capped at rate * dt_hours, per battery."""
+        fleet = BatteryFleet([13.5, 13.5], initial_soc=0.3)
+
+        consumed, _ = fleet.charge([10.0, 10.0], dt_hours=np.array([1.0, 0.25]))
+
+        np.testing.assert_allclose(consumed, [Battery.MAX_CHARGE_RATE_KW, Battery.MAX_CHARGE_RATE_KW * 0.25])
+
+    def test_validation_and_reset(self):
+        """Bad capacities and SOCs raise ValueError; reset sets every SOC."""
+        with pytest.raises(ValueError):
+            BatteryFleet([10.0, 0.0])
+        with pytest.raises(ValueError):
+            BatteryFleet([10.0], initial_soc=1.5)
+
+        fleet = BatteryFleet(np.full(4, 10.0))
+        fleet.reset([0.2, 0.4, 0.6, 0.8])
+        np.testing.assert_allclose(fleet.soc, [0.2, 0.4, 0.6, 0.8])
+        assert len(fleet) == 4
+        with pytest.raises(ValueError):
+            fleet.reset(-0.1)
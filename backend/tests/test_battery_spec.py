@@ -0,0 +1,146 @@
+"""
+Tests for per-instance battery parameters (BatterySpec).
+
+Tests verify:
+- Specs are validated and batteries with different specs coexist
+- The MILP respects each spec's SOC bounds and power limits
+- Batched MILP solves match per-home solves
+- Specs pass through the runner, the rule policy and the API
+"""
+import numpy as np
+import pytest
+
+from src.core.battery import Battery
+from src.core.battery_fleet import BatteryFleet
+from src.core.hybrid_adapter import HybridSimulationAdapter
+from src.core.plan_executor import execute_plan
+from src.data.models import (
+    Action, BatterySpec, DayType, EnvironmentArrays, Season, SimulationConfig, Weather
+)
+from src.engine.milp_engine import MILPDecisionEngine
+
+
+def day(solar=6.0, load=2.0):
+    """Flat surplus by day, deficit at night, peak prices in the evening."""
+    hour = np.arange(24)
+    return EnvironmentArrays(
+        hour=hour,
+        solar_kwh=np.where((hour >= 8) & (hour < 16), solar, 0.0),
+        load_kwh=np.full(24, load),
+        price=np.where((hour >= 18) & (hour < 22), 10.0, 5.0)
+    )
+
+
+class TestSpec:
+    """Validation and per-instance parameters."""
+
+    def test_rejects_bad_values(self):
+        """Bad capacities, SOC bounds, efficiencies and rates raise ValueError."""
+        for kwargs in ({'capacity_kwh': 0}, {'min_soc': 0.9, 'max_soc': 0.5},
+                       {'charge_efficiency': 1.2}, {'max_charge_rate_kw': -1}):
+            with pytest.raises(ValueError):
+                BatterySpec(**kwargs)
+
+    def test_batteries_keep_their_own_spec(self):
+        """Two batteries with different specs do not share parameters."""
+        small = Battery(initial_soc=0.5, spec=BatterySpec(5.0, max_charge_rate_kw=1.0))
+        default = Battery(13.5, initial_soc=0.5)
+
+        assert small.charge(10.0) == (1.0, pytest.approx(0.96))
+        assert default.charge(10.0)[0] == Battery.MAX_CHARGE_RATE_KW
+        assert small.capacity_kwh == 5.0 and default.spec == BatterySpec()
+
+    def test_capacity_argument_overrides_spec(self):
+        """An explicit capacity replaces the spec's capacity only."""
+        battery = Battery(20.0, spec=BatterySpec(min_soc=0.1))
+
+        assert battery.spec == BatterySpec(20.0, min_soc=0.1)
+
+    def test_fleet_from_specs(self):
+        """A fleet of mixed specs takes each battery's parameters."""
+        specs = [BatterySpec(5.0), BatterySpec(20.0, max_discharge_rate_kw=2.0)]
+        fleet = BatteryFleet.from_specs(specs, initial_soc=0.8)
+
+        np.testing.assert_array_equal(fleet.capacity_kwh, [5.0, 20.0])
+        np.testing.assert_array_equal(fleet.max_discharge_rate_kw, [5.0, 2.0])
+
+
+class TestMILPSpec:
+    """The MILP reads parameters from the spec."""
+
+    def test_respects_soc_bounds_and_rates(self):
+        """Charge stays within the spec's SOC window and power limits."""
+        spec = BatterySpec(10.0, min_soc=0.4, max_soc=0.7, max_charge_rate_kw=1.5, max_discharge_rate_kw=1.0)
+        battery = Battery(initial_soc=0.5, spec=spec)
+        details = MILPDecisionEngine().get_schedule_details(day(), battery.state, spec=spec)
+
+        for step in details:
+            assert 4.0 - 1e-6 <= step['battery_charge'] <= 7.0 + 1e-6
+            assert step['charge_rate'] <= 1.5 + 1e-6
+            assert step['discharge_rate'] <= 1.0 + 1e-6
+
+    def test_batched_matches_single_solves(self):
+        """One solve over several homes gives each home's own optimal cost."""
+        engine = MILPDecisionEngine(mip_gap=0.0)
+        homes = [day(), day(solar=3.0, load=1.0), day(solar=8.0, load=4.0)]
+        specs = [BatterySpec(5.0), BatterySpec(13.5, max_soc=0.8), BatterySpec(20.0, max_charge_rate_kw=2.0)]
+        batteries = [Battery(initial_soc=0.5, spec=spec).state for spec in specs]
+
+        batched = engine.optimize_schedules(homes, batteries, specs=specs)
+        single = [engine.optimize_schedule(env, b, spec=spec) for env, b, spec in zip(homes, batteries, specs)]
+
+        def cost(environments, actions, spec):
+            return execute_plan(environments, actions, Battery(initial_soc=0.5, spec=spec)).cost.sum()
+
+        assert [len(actions) for actions in batched] == [24, 24, 24]
+        for environments, spec, b, s in zip(homes, specs, batched, single):
+            assert cost(environments, b, spec) == pytest.approx(cost(environments, s, spec), abs=1e-6)
+
+    def test_batched_rejects_mismatched_lengths(self):
+        """Per-home sequences must line up."""
+        with pytest.raises(ValueError):
+            MILPDecisionEngine().optimize_schedules([day()], [], specs=None)
+
+
+class TestSpecPassThrough:
+    """Runner and API use the configured battery."""
+
+    def test_adapter_uses_config_battery(self):
+        """The runner battery comes from SimulationConfig.battery."""
+        spec = BatterySpec(5.0, max_soc=0.8)
+        config = SimulationConfig(Season.SUMMER, Weather.SUNNY, DayType.WEEKDAY, battery=spec)
+        result = HybridSimulationAdapter(config, seed=1, mode='milp').generate_24h_data()
+
+        assert max(h.battery_level for h in result.hourly_data) <= 4.0 + 1e-6
+
+    def test_rule_policy_uses_spec_soc_bounds(self):
+        """The rule engine stops charging at max_soc and discharging at min_soc."""
+        spec = BatterySpec(10.0, min_soc=0.5, max_soc=0.8)
+        config = SimulationConfig(Season.SUMMER, Weather.SUNNY, DayType.WEEKDAY, battery=spec)
+        result = HybridSimulationAdapter(config, seed=1, mode='rule').generate_24h_data()
+        trajectory = result.trajectory
+        soc_before = np.concatenate([[0.5], trajectory.soc[:-1]])
+        actions = [h.action for h in result.hourly_data]
+
+        assert not any(a == Action.CHARGE_BATTERY for a, soc in zip(actions, soc_before) if soc >= 0.8)
+        assert not any(a == Action.DISCHARGE_BATTERY for a, soc in zip(actions, soc_before) if soc <= 0.5)
+        assert Action.SELL_TO_GRID in actions and Action.USE_GRID in actions
+
+    def test_api_defaults_match_core_spec(self):
+        """BatteryConfig defaults are the core BatterySpec defaults."""
+        from app.models import BatteryConfig
+
+        assert BatterySpec(**BatteryConfig().model_dump()) == BatterySpec()
+
+    def test_simulate_with_battery(self):
+        """POST /api/v1/simulate accepts battery parameters and validates them."""
+        from fastapi.testclient import TestClient
+        from app.main import app
+
+        client = TestClient(app)
+        response = client.post('/api/v1/simulate', json={'seed': 1, 'battery': {'capacity_kwh': 5.0}})
+        invalid = client.post('/api/v1/simulate', json={'battery': {'min_soc': 0.9, 'max_soc': 0.5}})
+
+        assert response.status_code == 200
+        assert max(h['battery_level'] for h in response.json()['hourly_data']) <= 5.0 * 0.95 + 1e-6
+        assert invalid.status_code == 422
@@ -0,0 +1,93 @@
+"""
+Tests for counter-based environment randomness.
+
+Tests verify:
+- Philox4x32-10 matches the published known-answer vectors
+- Scalar draws equal batched draws
+- Generation is independent of order, chunking and parallel splitting
+"""
+import numpy as np
+import pytest
+
+from src.data.counter_rng import CounterRNG, philox4x32, SOLAR, CONSUMPTION
+from src.data.models import SimulationConfig, Season, Weather, DayType, EnvironmentArrays
+from src.data.simulator import EnergyDataSimulator
+
+
+def make_simulator(hours=24, seed=9, dt_hours=1.0):
+    """Simulation-only simulator."""
+    config = SimulationConfig(
+        season=Season.SUMMER, weather=Weather.PARTLY_CLOUDY, day_type=DayType.WEEKDAY,
+        hours=hours, dt_hours=dt_hours
+    )
+    return EnergyDataSimulator(config, seed=seed, use_ai=False)
+
+
+class TestPhilox:
+    """Block cipher and uniform draws."""
+
+    @pytest.mark.parametrize("counter,key,expected", [
+        ([0, 0, 0, 0], [0, 0],
+         [0x6627e8d5, 0xe169c58d, 0xbc57ac4c, 0x9b00dbd8]),
+        ([0xffffffff] * 4, [0xffffffff] * 2,
+         [0x408f276d, 0x41c83b0e, 0xa20bc7c6, 0x6d5451fd]),
+        ([0x243f6a88, 0x85a308d3, 0x13198a2e, 0x03707344], [0xa4093822, 0x299f31d0],
+         [0xd16cfe09, 0x94fdcceb, 0x5001e420, 0x24126ea1]),
+    ])
+    def test_known_answer_vectors(self, counter, key, expected):
+        """Output matches the Random123 reference implementation."""
+        words = philox4x32(np.array(counter, dtype=np.uint32).reshape(4, 1), np.array(key, dtype=np.uint32))
+
+        assert words[:, 0].tolist() == expected
+
+    def test_scalar_equals_batched(self):
+        """uniform_at(i) is exactly element i of the batch."""
+        rng = CounterRNG(123)
+        batch = rng.uniform(np.arange(100), SOLAR)
+
+        assert [rng.uniform_at(i, SOLAR) for i in range(100)] == batch.tolist()
+
+    def test_draws_are_uniform_and_independent(self):
+        """Draws cover [0, 1) and differ across quantities and seeds."""
+        steps = np.arange(100_000)
+        solar = CounterRNG(1).uniform(steps, SOLAR)
+        load = CounterRNG(1).uniform(steps, CONSUMPTION)
+
+        assert 0.0 <= solar.min() and solar.max() < 1.0
+        assert solar.mean() == pytest.approx(0.5, abs=0.01)
+        assert abs(np.corrcoef(solar, load)[0, 1]) < 0.02
+        assert not np.array_equal(solar[:10], CounterRNG(2).uniform(steps[:10], SOLAR))
+
+
+class TestOrderIndependence:
+    """Any generation order gives the same environment."""
+
+    def test_hours_in_any_order(self):
+        """Generating hours in reverse equals the batched day."""
+        simulator = make_simulator()
+        reverse = [simulator.generate_environment_for_hour(h) for h in reversed(range(24))]
+
+        assert reverse[::-1] == make_simulator().generate_environment_arrays().to_states()
+
+    def test_repeated_generation_is_identical(self):
+        """The same simulator yields the same data every time."""
+        simulator = make_simulator()
+
+        assert simulator.generate_24h_environment() == simulator.generate_24h_environment()
+
+    @pytest.mark.parametrize("dt_hours", [1.0, 0.25])
+    def test_out_of_order_chunks(self, dt_hours):
+        """Chunks generated in shuffled order reassemble to the full horizon."""
+        full = make_simulator(hours=96, dt_hours=dt_hours).generate_environment_arrays()
+        simulator = make_simulator(hours=96, dt_hours=dt_hours)
+        per_hour = simulator.steps_per_hour
+        starts = [0, 7, 31, 50, 77]
+        bounds = list(zip(starts, starts[1:] + [96]))
+
+        chunks = {}
+        for start, end in reversed(bounds):
+            chunks[start] = simulator._generate_arrays(start * per_hour, (end - start) * per_hour)
+        joined = EnvironmentArrays.concatenate([chunks[start] for start in starts])
+
+        np.testing.assert_array_equal(joined.solar_kwh, full.solar_kwh)
+        np.testing.assert_array_equal(joined.load_kwh, full.load_kwh)
@@ -0,0 +1,86 @@
+"""
+Tests for Monte Carlo scenario ensembles.
+
+Tests verify:
+- Results are bitwise identical for any worker count
+- Members use independent seeds and reproduce as standalone runs
+- Percentile bands are ordered and shaped per timestep
+"""
+import numpy as np
+import pytest
+
+from src.data.models import SimulationConfig, Season, Weather, DayType
+from src.core.ensemble import EnsembleRunner, spawn_seeds
+from src.core.hybrid_adapter import HybridSimulationAdapter
+
+
+@pytest.fixture
+def config():
+    """Partly cloudy summer weekday."""
+    return SimulationConfig(
+        season=Season.SUMMER, weather=Weather.PARTLY_CLOUDY, day_type=DayType.WEEKDAY
+    )
+
+
+class TestReproducibility:
+    """Same root seed, same ensemble."""
+
+    def test_identical_across_worker_counts(self, config):
+        """In-process and pooled runs give bitwise identical trajectories."""
+        serial = EnsembleRunner(config, workers=1).run(24, seed=11)
+        pooled = EnsembleRunner(config, workers=3).run(24, seed=11)
+
+        np.testing.assert_array_equal(serial.seeds, pooled.seeds)
+        for name in ('soc', 'cost', 'grid_import'):
+            np.testing.assert_array_equal(getattr(serial, name), getattr(pooled, name))
+
+    def test_member_reproduces_standalone(self, config):
+        """Member i equals a single run with seed seeds[i]."""
+        result = EnsembleRunner(config, workers=1).run(5, seed=3)
+        single = HybridSimulationAdapter(config, seed=int(result.seeds[2])).generate_24h_data()
+
+        np.testing.assert_array_equal(result.soc[2], single.trajectory.soc)
+        assert result.total_cost[2] == pytest.approx(single.total_cost)
+
+    def test_seeds_are_distinct(self):
+        """Spawned seeds differ across members and root seeds."""
+        seeds = spawn_seeds(1000, seed=5)
+
+        assert len(np.unique(seeds)) == 1000
+        assert not np.array_equal(seeds[:10], spawn_seeds(10, seed=6))
+        np.testing.assert_array_equal(seeds[:10], spawn_seeds(10, seed=5))
+
+    def test_rejects_empty_ensemble(self, config):
+        """At least one member is required."""
+        with pytest.raises(ValueError):
+            EnsembleRunner(config, workers=1).run(0)
+
+
+class TestBands:
+    """Percentile summaries."""
+
+    def test_bands_per_timestep_and_ordered(self, config):
+        """P10 <= P50 <= P90 at every timestep."""
+        result = EnsembleRunner(config, workers=1).run(30, seed=1)
+
+        for name in ('soc', 'cost', 'grid_import', 'cumulative_cost'):
+            bands = result.bands(name)
+            assert set(bands) == {'p10', 'p50', 'p90'}
+            assert bands['p50'].shape == (24,)
+            assert np.all(bands['p10'] <= bands['p50'])
+            assert np.all(bands['p50'] <= bands['p90'])
+
+    def test_members_differ(self, config):
+        """Independent members produce a spread of outcomes."""
+        result = EnsembleRunner(config, workers=1).run(30, seed=1)
+        summary = result.summary()
+
+        assert summary['total_cost']['p10'] < summary['total_cost']['p90']
+        assert set(summary) == {'total_cost', 'total_grid_import', 'final_soc'}
+
+    def test_unknown_trajectory(self, config):
+        """Unknown trajectory names raise ValueError."""
+        result = EnsembleRunner(config, workers=1).run(2, seed=1)
+
+        with pytest.raises(ValueError):
+            result.bands('price')
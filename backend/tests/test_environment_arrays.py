@@ -0,0 +1,104 @@
+"""
+Tests for columnar environment generation.
+
+Tests verify:
+- generate_environment_arrays matches per-hour generation exactly
+- generate_24h_environment is a view over the arrays
+- Out-of-range AI predictions fall back to simulation
+- Arrays are read-only and cover long horizons
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.data.models import (
+    SimulationConfig, Season, Weather, DayType, EnvironmentArrays, EnvironmentState
+)
+from src.data.simulator import EnergyDataSimulator
+from src.utils.config import get_price_for_hour
+
+
+def make_simulator(season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY, seed=42):
+    """Simulation-only simulator."""
+    config = SimulationConfig(season=season, weather=weather, day_type=day_type)
+    return EnergyDataSimulator(config, seed=seed, use_ai=False)
+
+
+class TestEnvironmentArrays:
+    """Vectorized generation must reproduce the per-hour simulation."""
+
+    @pytest.mark.parametrize("season,weather,day_type", [
+        (Season.SUMMER, Weather.SUNNY, DayType.WEEKDAY),
+        (Season.WINTER, Weather.RAINY, DayType.WEEKEND),
+        (Season.SUMMER, Weather.PARTLY_CLOUDY, DayType.WEEKEND),
+    ])
+    def test_matches_per_hour_generation(self, season, weather, day_type):
+        """Same seed gives identical values to generating hour by hour."""
+        per_hour = make_simulator(season, weather, day_type)
+        expected = [per_hour.generate_environment_for_hour(h) for h in range(24)]
+
+        arrays = make_simulator(season, weather, day_type).generate_environment_arrays(24)
+
+        assert arrays.to_states() == expected
+
+    def test_24h_list_is_view_over_arrays(self):
+        """The list API returns the same states as the arrays."""
+        states = make_simulator().generate_24h_environment()
+        arrays = make_simulator().generate_environment_arrays(24)
+
+        assert states == list(arrays)
+        assert arrays[13] == states[13]
+        assert all(isinstance(state, EnvironmentState) for state in states)
+
+    def test_multi_day_horizon(self):
+        """Hours wrap every 24 steps and prices follow the hour of day."""
+        arrays = make_simulator().generate_environment_arrays(72)
+
+        assert isinstance(arrays, EnvironmentArrays)
+        assert len(arrays) == 72
+        np.testing.assert_array_equal(arrays.hour, np.arange(72) % 24)
+        np.testing.assert_array_equal(arrays.price, [get_price_for_hour(h % 24) for h in range(72)])
+        assert (arrays.solar_kwh[arrays.hour < 6] == 0).all()
+
+    def test_arrays_read_only(self):
+        """Generated arrays cannot be modified in place."""
+        arrays = make_simulator().generate_environment_arrays(24)
+
+        with pytest.raises(ValueError):
+            arrays.solar_kwh[0] = 1.0
+
+
+class TestEnvironmentArraysAI:
+    """AI predictions are used when in range."""
+
+    class FixedManager:
+        """Stands in for ModelManager with fixed predictions."""
+
+        def __init__(self, solar, load):
+            self.values = list(zip(solar, load))
+            self.solar = SimpleNamespace(failures=0)
+            self.consumption = SimpleNamespace(failures=0)
+
+        def predict_hours(self, hours, day, month, weather, season):
+            return [self.values[h] for h in hours]
+
+    def test_uses_valid_predictions_and_simulates_the_rest(self):
+        """Out-of-range hours are simulated with the same draws as per hour."""
+        solar = [0.0] * 6 + [20.0] + [3.0] * 17  # Hour 6 out of range
+        load = [1.0] * 23 + [50.0]  # Hour 23 out of range
+
+        simulators = []
+        for _ in range(2):
+            simulator = make_simulator()
+            simulator.use_ai = True
+            simulator.ai_manager = self.FixedManager(solar, load)
+            simulators.append(simulator)
+
+        arrays = simulators[0].generate_environment_arrays(24)
+        expected = [simulators[1].generate_environment_for_hour(h) for h in range(24)]
+
+        assert arrays.to_states() == expected
+        assert arrays.solar_kwh[12] == 3.0
+        assert arrays.solar_kwh[6] != 20.0
+        assert arrays.load_kwh[23] != 50.0
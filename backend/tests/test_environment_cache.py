@@ -0,0 +1,224 @@
+"""
+Tests for the content-addressed environment cache.
+
+Tests verify:
+- Cached environments equal freshly generated ones
+- Keys change with every generation input, including the model version
+- The disk tier serves other cache instances (other workers)
+- Unseeded runs and failed AI predictions are never cached
+"""
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.core.hybrid_adapter import HybridSimulationAdapter
+from src.data.environment_cache import (
+    EnvironmentCache, environment_key, default_environment_cache
+)
+from src.data.models import SimulationConfig, Season, Weather, DayType
+from src.data.simulator import EnergyDataSimulator
+
+
+def make_config(weather=Weather.SUNNY, hours=24):
+    """Summer weekday config."""
+    return SimulationConfig(
+        season=Season.SUMMER, weather=weather, day_type=DayType.WEEKDAY, hours=hours
+    )
+
+
+def generate(cache, config=None, seed=42):
+    """Generate a simulation-only environment through a cache."""
+    simulator = EnergyDataSimulator(config or make_config(), seed=seed, use_ai=False, cache=cache)
+    return simulator.generate_environment_arrays()
+
+
+class FixedManager:
+    """Stands in for ModelManager with constant predictions."""
+
+    def __init__(self, version, fail=False):
+        self.version = version
+        self.fail = fail
+        self.solar = SimpleNamespace(failures=0)
+        self.consumption = SimpleNamespace(failures=0)
+
+    def predict_hours(self, hours, day, month, weather, season):
+        if self.fail:
+            raise RuntimeError("inference failed")
+        return [(2.0, 1.0) for _ in hours]
+
+
+def ai_simulator(manager, cache):
+    """Simulator wired to a fake model manager."""
+    simulator = EnergyDataSimulator(make_config(), seed=42, use_ai=False, cache=cache)
+    simulator.use_ai = True
+    simulator.ai_manager = manager
+    return simulator
+
+
+class TestMemoryTier:
+    """In-process LRU tier."""
+
+    def test_hit_returns_identical_environment(self):
+        """Second generation is a hit with identical, read-only data."""
+        cache = EnvironmentCache()
+        first = generate(cache)
+        second = generate(cache)
+        uncached = generate(None)
+
+        assert second is first
+        np.testing.assert_array_equal(first.load_kwh, uncached.load_kwh)
+        assert not first.load_kwh.flags.writeable
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
+
+    def test_distinct_inputs_miss(self):
+        """Seed and weather are part of the key."""
+        cache = EnvironmentCache()
+        generate(cache)
+        generate(cache, seed=43)
+        generate(cache, config=make_config(Weather.RAINY))
+
+        assert cache.stats()['misses'] == 3
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = EnvironmentCache(max_entries=2)
+        generate(cache, seed=1)
+        generate(cache, seed=2)
+        generate(cache, seed=1)
+        generate(cache, seed=3)  # Evicts seed 2
+
+        generate(cache, seed=1)
+        generate(cache, seed=2)
+        stats = cache.stats()
+        assert stats['entries'] == 2
+        assert (stats['hits'], stats['misses']) == (2, 4)
+
+    def test_unseeded_runs_not_cached(self):
+        """Simulators without a seed bypass the cache."""
+        cache = EnvironmentCache()
+        generate(cache, seed=None)
+
+        assert cache.stats()['misses'] == 0
+        assert cache.stats()['entries'] == 0
+
+    def test_streamed_chunks_cached(self):
+        """Each streamed chunk is its own entry."""
+        cache = EnvironmentCache()
+        config = make_config(hours=72)
+        for _ in range(2):
+            simulator = EnergyDataSimulator(config, seed=5, use_ai=False, cache=cache)
+            list(simulator.iter_environment(chunk_hours=24))
+
+        assert cache.stats()['entries'] == 3
+        assert cache.stats()['hits'] == 3
+
+
+class TestModelVersion:
+    """AI-backed environments are keyed on the model version."""
+
+    def test_new_model_version_misses(self):
+        """Swapping model artifacts invalidates cached environments."""
+        cache = EnvironmentCache()
+        ai_simulator(FixedManager('v1'), cache).generate_environment_arrays()
+        ai_simulator(FixedManager('v1'), cache).generate_environment_arrays()
+        ai_simulator(FixedManager('v2'), cache).generate_environment_arrays()
+
+        assert (cache.stats()['hits'], cache.stats()['misses']) == (1, 2)
+
+    def test_failed_inference_not_cached(self):
+        """A failed AI call falls back to simulation without caching it."""
+        cache = EnvironmentCache()
+        ai_simulator(FixedManager('v1', fail=True), cache).generate_environment_arrays()
+        arrays = ai_simulator(FixedManager('v1'), cache).generate_environment_arrays()
+
+        assert cache.stats()['hits'] == 0
+        assert arrays.solar_kwh[12] == 2.0
+
+    def test_predictor_fallback_not_cached(self, model_dir, monkeypatch):
+        """A model error answered by the predictor's fallback is not cached."""
+        from src.ai.model_manager import ModelManager
+
+        solar = ModelManager().solar
+        engine_predict = solar.engine.predict
+        calls = []
+
+        def fail_once(features):
+            calls.append(len(features))
+            if len(calls) == 1:
+                raise RuntimeError("transient model failure")
+            return engine_predict(features)
+
+        monkeypatch.setattr(solar.engine, 'predict', fail_once)
+        cache = EnvironmentCache()
+        fallback = EnergyDataSimulator(make_config(), seed=42, cache=cache).generate_environment_arrays()
+        recovered = EnergyDataSimulator(make_config(), seed=42, cache=cache).generate_environment_arrays()
+        uncached = EnergyDataSimulator(make_config(), seed=42).generate_environment_arrays()
+
+        assert solar.failures == 1
+        assert cache.stats()['hits'] == 0
+        np.testing.assert_array_equal(recovered.solar_kwh, uncached.solar_kwh)
+        assert not np.array_equal(fallback.solar_kwh, recovered.solar_kwh)
+
+
+class TestDiskTier:
+    """On-disk tier shared across cache instances."""
+
+    def test_other_instance_reads_disk(self, tmp_path):
+        """A fresh cache (another worker) is served from disk."""
+        written = generate(EnvironmentCache(directory=tmp_path))
+
+        reader = EnvironmentCache(directory=tmp_path)
+        loaded = generate(reader)
+
+        for name in ('hour', 'solar_kwh', 'load_kwh', 'price'):
+            np.testing.assert_array_equal(getattr(loaded, name), getattr(written, name))
+        assert loaded.dt_hours == written.dt_hours
+        assert reader.stats()['disk_hits'] == 1
+        assert not loaded.solar_kwh.flags.writeable
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Unreadable files are regenerated rather than raising."""
+        key = environment_key(example=1)
+        path = tmp_path / key[:2] / f"{key}.npz"
+        path.parent.mkdir()
+        path.write_bytes(b"not an npz")
+
+        assert EnvironmentCache(directory=tmp_path).get(key) is None
+
+
+class TestKey:
+    """Content hashing."""
+
+    def test_key_is_order_independent_and_sensitive(self):
+        """Same inputs in any order give the same key; any change differs."""
+        assert environment_key(a=1, b=2) == environment_key(b=2, a=1)
+        assert environment_key(a=1, b=2) != environment_key(a=1, b=3)
+
+    def test_timestep_in_key(self):
+        """Different resolutions never share entries."""
+        cache = EnvironmentCache()
+        hourly = generate(cache)
+        config = make_config()
+        config.dt_hours = 0.25
+        fine = generate(cache, config=config)
+
+        assert (len(hourly), len(fine)) == (24, 96)
+        assert cache.stats()['misses'] == 2
+
+
+class TestAdapters:
+    """Rule and MILP adapters share the process-wide cache."""
+
+    def test_compare_generates_once(self):
+        """Rule and MILP runs of one scenario reuse the environment."""
+        cache = default_environment_cache()
+        cache.clear()
+        config = make_config()
+
+        rule = HybridSimulationAdapter(config, seed=123, mode='rule').generate_24h_data()
+        milp = HybridSimulationAdapter(config, seed=123, mode='milp').generate_24h_data()
+
+        assert cache.stats()['hits'] == 1
+        assert [h.solar_production for h in rule.hourly_data] == \
+            [h.solar_production for h in milp.hourly_data]
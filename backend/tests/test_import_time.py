@@ -0,0 +1,55 @@
+"""
+Import-time regression checks.
+
+Tests verify:
+- Importing app.main does not load pandas, pulp, joblib or sklearn
+- Cold import of app.main stays within a time budget
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Cold-import budget in seconds (override for slow CI machines)
+IMPORT_BUDGET_S = float(os.environ.get('INTELLIGRID_IMPORT_BUDGET_S', '1.5'))
+
+HEAVY_MODULES = ['pandas', 'pulp', 'joblib', 'sklearn']
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def cold_import(module: str) -> dict:
+    """Import a module in a fresh interpreter and report time and loaded modules."""
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module)],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+class TestImportTime:
+    """Heavy dependencies must be loaded on first use, not at import."""
+
+    @pytest.mark.parametrize("module", ['app.main', 'src.data.simulator', 'src.core.hybrid_adapter'])
+    def test_heavy_dependencies_not_imported(self, module):
+        """Importing the app leaves pandas, pulp, joblib and sklearn unloaded."""
+        loaded = set(cold_import(module)['modules'])
+
+        assert not loaded & set(HEAVY_MODULES)
+
+    def test_app_import_within_budget(self):
+        """Cold import of app.main stays within the budget (best of 3)."""
+        seconds = min(cold_import('app.main')['seconds'] for _ in range(3))
+
+        assert seconds < IMPORT_BUDGET_S, f"app.main imported in {seconds:.2f}s"
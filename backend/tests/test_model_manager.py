@@ -0,0 +1,110 @@
+"""
+Tests for ModelManager prediction memoization.
+
+Tests verify:
+- Repeated predictions are served from the cache
+- Cache counters are exposed through get_model_status()
+- Reloading models invalidates cached predictions
+- The cache is bounded
+"""
+import pytest
+
+from src.ai.model_manager import ModelManager
+from src.ai.prediction_cache import PredictionCache
+
+
+@pytest.fixture
+def manager():
+    """Fresh ModelManager singleton (fallback mode without model files)."""
+    ModelManager.reset_instance()
+    yield ModelManager()
+    ModelManager.reset_instance()
+
+
+def count_batch_calls(predictor):
+    """Wrap predictor.predict_batch and count calls."""
+    calls = []
+    original = predictor.predict_batch
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    predictor.predict_batch = wrapper
+    return calls
+
+
+class TestPredictionCache:
+    """Repeated inputs must not rerun the models."""
+
+    def test_repeated_24h_predictions_hit_cache(self, manager):
+        """Second 24h request is served entirely from cache."""
+        first = manager.get_24h_predictions(day=15, month=6, weather='sunny', season='summer')
+        calls = count_batch_calls(manager.solar)
+
+        second = manager.get_24h_predictions(day=15, month=6, weather='sunny', season='summer')
+
+        assert calls == []
+        assert [p['solar_kw'] for p in first] == [p['solar_kw'] for p in second]
+        cache = manager.get_model_status()['cache']
+        assert cache['misses'] == 24
+        assert cache['hits'] == 24
+
+    def test_misses_are_batched(self, manager):
+        """All cache misses for a day go through one batched call per model."""
+        solar_calls = count_batch_calls(manager.solar)
+        consumption_calls = count_batch_calls(manager.consumption)
+
+        manager.get_24h_predictions(day=1, month=1, weather='cloudy', season='winter')
+
+        assert len(solar_calls) == 1
+        assert len(consumption_calls) == 1
+
+    def test_inputs_are_normalized(self, manager):
+        """Equivalent weather spellings share cache entries."""
+        manager.get_predictions(hour=12, day=15, month=6, weather='partly_cloudy')
+        manager.get_predictions(hour=12, day=15, month=6, weather='Partly-Cloudy')
+
+        assert manager.get_model_status()['cache']['hits'] == 1
+
+    def test_reload_invalidates_cache(self, manager):
+        """Reloading models drops cached predictions."""
+        manager.get_24h_predictions(day=15, month=6)
+        assert manager.get_model_status()['cache']['size'] == 24
+
+        manager.reload_models()
+        calls = count_batch_calls(manager.solar)
+        manager.get_24h_predictions(day=15, month=6)
+
+        assert len(calls) == 1
+
+    def test_model_version_is_part_of_key(self, manager):
+        """A predictor with a new version never sees old entries."""
+        manager.get_predictions(hour=12, day=15, month=6)
+        manager.solar.version = 'retrained'
+
+        manager.get_predictions(hour=12, day=15, month=6)
+
+        assert manager.get_model_status()['cache']['misses'] == 2
+
+
+class TestPredictionCacheBounds:
+    """LRU cache must stay within max_size."""
+
+    def test_evicts_least_recently_used(self):
+        """Oldest untouched entry is evicted first."""
+        cache = PredictionCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert len(cache) == 2
+        assert cache.stats()['evictions'] == 1
+
+    def test_rejects_non_positive_size(self):
+        """Cache must hold at least one entry."""
+        with pytest.raises(ValueError):
+            PredictionCache(max_size=0)
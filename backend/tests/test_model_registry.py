@@ -0,0 +1,181 @@
+"""
+Tests for the thread-safe model registry.
+
+Tests verify:
+- Concurrent first requests load each artifact version once
+- New artifacts are swapped in while old handles stay usable
+- Resident versions are bounded
+- ModelManager hot-swaps retrained .pkl files
+"""
+import dataclasses
+import threading
+import time
+
+import pytest
+
+from src.ai.model_manager import ModelManager
+from src.ai.model_registry import ModelRegistry, PredictorHandle
+from src.ai.solar_predictor import SolarPredictor
+from src.ai.consumption_predictor import ConsumptionPredictor
+
+
+class FakeArtifacts:
+    """Artifact key source and loader that counts loads."""
+
+    def __init__(self, delay: float = 0.0):
+        self.key = ('missing', 'solar@1', 'consumption@1')
+        self.delay = delay
+        self.loaded = []
+
+    def key_fn(self):
+        return self.key
+
+    def loader(self, key):
+        time.sleep(self.delay)
+        self.loaded.append(key)
+        return PredictorHandle(
+            key=key,
+            solar=SolarPredictor.__new__(SolarPredictor),
+            consumption=ConsumptionPredictor.__new__(ConsumptionPredictor)
+        )
+
+
+def make_registry(artifacts, **kwargs):
+    """Registry backed by fake artifacts."""
+    return ModelRegistry(key_fn=artifacts.key_fn, loader=artifacts.loader, **kwargs)
+
+
+class TestModelRegistry:
+    """Versions must load once and swap atomically."""
+
+    def test_concurrent_first_use_loads_once(self):
+        """Many threads asking at once share one load."""
+        artifacts = FakeArtifacts(delay=0.05)
+        registry = make_registry(artifacts)
+        handles = []
+
+        threads = [threading.Thread(target=lambda: handles.append(registry.current())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(artifacts.loaded) == 1
+        assert all(handle is handles[0] for handle in handles)
+
+    def test_swap_keeps_old_handle_usable(self):
+        """A request holding the old handle is unaffected by a swap."""
+        artifacts = FakeArtifacts()
+        registry = make_registry(artifacts)
+        old = registry.current()
+
+        artifacts.key = ('missing', 'solar@2', 'consumption@1')
+        new = registry.refresh()
+
+        assert new is not old
+        assert registry.current() is new
+        assert old.key == ('missing', 'solar@1', 'consumption@1')
+        assert registry.stats()['swaps'] == 1
+
+    def test_handles_are_immutable(self):
+        """Handle fields cannot be reassigned."""
+        handle = make_registry(FakeArtifacts()).current()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            handle.solar = None
+
+    def test_unchanged_artifacts_not_reloaded(self):
+        """Refreshing with the same artifacts keeps the current handle."""
+        artifacts = FakeArtifacts()
+        registry = make_registry(artifacts)
+        handle = registry.current()
+
+        assert registry.refresh() is handle
+        assert len(artifacts.loaded) == 1
+
+    def test_resident_versions_bounded(self):
+        """Only max_versions handles stay loaded; rollback to one is free."""
+        artifacts = FakeArtifacts()
+        registry = make_registry(artifacts, max_versions=2)
+
+        for version in (1, 2, 3, 2):
+            artifacts.key = ('missing', f'solar@{version}', 'consumption@1')
+            registry.refresh()
+
+        stats = registry.stats()
+        assert len(stats['resident']) == 2
+        assert stats['current'] == ['missing', 'solar@2', 'consumption@1']
+        assert len(artifacts.loaded) == 3  # Version 2 was still resident
+
+    def test_automatic_refresh_interval(self):
+        """current() picks up new artifacts once the interval elapses."""
+        artifacts = FakeArtifacts()
+        registry = make_registry(artifacts, refresh_interval=1e-6)
+        registry.current()
+
+        artifacts.key = ('missing', 'solar@2', 'consumption@1')
+        time.sleep(0.001)
+
+        assert registry.current().key == artifacts.key
+
+    def test_rejects_empty_bound(self):
+        """max_versions must allow the current handle."""
+        with pytest.raises(ValueError):
+            ModelRegistry(max_versions=0)
+
+
+class TestModelManagerRegistry:
+    """ModelManager must be created once and hot-swap artifacts."""
+
+    def test_concurrent_construction(self, model_dir):
+        """Concurrent first calls return one instance and load once."""
+        managers = []
+        threads = [threading.Thread(target=lambda: managers.append(ModelManager())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(manager is managers[0] for manager in managers)
+        assert managers[0].registry.stats()['loads'] == 1
+
+    def test_hot_swap_retrained_model(self, model_dir):
+        """Replacing a .pkl swaps in the new version on reload."""
+        manager = ModelManager()
+        old_handle = manager.registry.current()
+        old_version = manager.solar.version
+        assert not manager.solar.is_using_fallback()
+
+        # "Retrained" model: different file contents and mtime
+        retrained = model_dir / "solar_pv_model.pkl"
+        retrained.write_bytes(retrained.read_bytes() + b'\n')
+        manager.reload_models()
+
+        assert manager.solar.version != old_version
+        assert old_handle.solar.version == old_version
+        assert manager.get_model_status()['registry']['swaps'] == 1
+        assert len(manager.get_24h_predictions(day=15, month=6)) == 24
+
+    def test_transient_failure_not_cached(self, model_dir, monkeypatch):
+        """A prediction that fell back once is recomputed on the next call."""
+        manager = ModelManager()
+        solar = manager.solar
+        engine_predict = solar.engine.predict
+        calls = []
+
+        def fail_once(features):
+            calls.append(len(features))
+            if len(calls) == 1:
+                raise RuntimeError("transient model failure")
+            return engine_predict(features)
+
+        monkeypatch.setattr(solar.engine, 'predict', fail_once)
+        hours = list(range(24))
+        fallback = [solar_kw for solar_kw, _ in manager.predict_hours(hours, 15, 6, 'sunny', 'summer')]
+        assert solar.failures == 1
+
+        predicted = [solar_kw for solar_kw, _ in manager.predict_hours(hours, 15, 6, 'sunny', 'summer')]
+        assert solar.failures == 1
+        assert len(calls) == 2
+        assert predicted == pytest.approx([float(v) for v in solar.predict_batch(hours, 15, 6)])
+        assert predicted != pytest.approx(fallback)
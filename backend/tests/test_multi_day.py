@@ -0,0 +1,152 @@
+"""
+Tests for multi-day and full-year simulation horizons.
+
+Tests verify:
+- Streamed chunks equal one-shot generation
+- Calendar-derived seasons and day types
+- Battery state carries across day boundaries (rule and MILP)
+- Full-year runs complete with one result per hour
+"""
+import datetime
+
+import numpy as np
+import pytest
+
+from src.data.models import (
+    SimulationConfig, Season, Weather, DayType, EnvironmentArrays
+)
+from src.data.profiles import consumption_base_profile
+from src.data.simulator import EnergyDataSimulator
+from src.core.battery import Battery
+from src.core.simulation_runner import SimulationRunner
+from src.core.hybrid_adapter import HybridSimulationAdapter
+from src.engine.decision_engine import DecisionEngine
+
+
+def make_config(hours=24, start_date=None, season=Season.SUMMER, day_type=DayType.WEEKDAY):
+    """Sunny simulation config."""
+    return SimulationConfig(
+        season=season, weather=Weather.SUNNY, day_type=day_type,
+        hours=hours, start_date=start_date
+    )
+
+
+def make_simulator(config, seed=7):
+    """Simulation-only simulator."""
+    return EnergyDataSimulator(config, seed=seed, use_ai=False)
+
+
+class TestStreamingEnvironment:
+    """Chunked generation must not change the data."""
+
+    @pytest.mark.parametrize("chunk_hours", [24, 50, 168])
+    def test_chunks_equal_full_horizon(self, chunk_hours):
+        """Concatenated chunks match one-shot generation for the same seed."""
+        config = make_config(hours=24 * 10, start_date=datetime.date(2024, 3, 25))
+
+        full = make_simulator(config).generate_environment_arrays()
+        chunks = list(make_simulator(config).iter_environment(chunk_hours=chunk_hours))
+
+        assert all(len(chunk) <= chunk_hours for chunk in chunks)
+        streamed = EnvironmentArrays.concatenate(chunks)
+        np.testing.assert_array_equal(streamed.solar_kwh, full.solar_kwh)
+        np.testing.assert_array_equal(streamed.load_kwh, full.load_kwh)
+
+    def test_first_day_matches_24h(self):
+        """Without a calendar, day one of a week equals the 24h environment."""
+        week = make_simulator(make_config(hours=168)).generate_environment_arrays()
+        day = make_simulator(make_config()).generate_24h_environment()
+
+        assert week.to_states()[:24] == day
+
+    def test_rejects_empty_chunks(self):
+        """chunk_hours must be positive."""
+        with pytest.raises(ValueError):
+            next(make_simulator(make_config()).iter_environment(chunk_hours=0))
+
+
+class TestCalendar:
+    """Seasons and day types follow the calendar when start_date is set."""
+
+    def test_weekend_days(self):
+        """Saturday and Sunday use weekend consumption periods."""
+        # Friday 2024-01-05 .. Monday 2024-01-08 (winter)
+        config = make_config(hours=96, start_date=datetime.date(2024, 1, 5))
+        simulator = make_simulator(config)
+
+        assert [simulator._day_conditions(i)[3] for i in range(4)] == [
+            'weekday', 'weekend', 'weekend', 'weekday'
+        ]
+        arrays = simulator.generate_environment_arrays()
+        hours = np.arange(24)
+        for day, day_type in enumerate(['weekday', 'weekend', 'weekend', 'weekday']):
+            ratio = arrays.load_kwh[day * 24:(day + 1) * 24] / consumption_base_profile(hours, 'winter', day_type)
+            assert ((ratio >= 0.85) & (ratio <= 1.15)).all()
+
+    def test_season_changes_with_month(self):
+        """Winter months simulate winter solar peaks, summer months summer."""
+        simulator = make_simulator(make_config(hours=24 * 366, start_date=datetime.date(2024, 1, 1)))
+
+        assert simulator._day_conditions(0)[2] == 'winter'  # January
+        assert simulator._day_conditions(182)[2] == 'summer'  # July
+        assert simulator._day_conditions(0)[:2] == (1, 1)
+        assert simulator._day_conditions(59)[:2] == (29, 2)  # Leap day
+
+
+class TestMultiDayRuns:
+    """Runs longer than a day keep one battery across days."""
+
+    def test_runner_week(self):
+        """A 7-day run yields 168 hours and continues battery state."""
+        config = make_config(hours=168, start_date=datetime.date(2024, 6, 1))
+        battery = Battery(13.5, initial_soc=0.5)
+        result = SimulationRunner(make_simulator(config), DecisionEngine(), battery).run()
+
+        assert len(result.hourly_data) == 168
+        assert [h.hour for h in result.hourly_data[22:26]] == [22, 23, 0, 1]
+        # Day two starts from day one's closing charge, not a reset battery
+        closing = result.hourly_data[23].battery_level
+        assert abs(result.hourly_data[24].battery_level - closing) <= Battery.MAX_CHARGE_RATE_KW
+
+    def test_runner_full_year(self):
+        """A leap-year run produces one entry per hour."""
+        config = make_config(hours=8784, start_date=datetime.date(2024, 1, 1))
+        result = SimulationRunner(make_simulator(config), DecisionEngine(), Battery(13.5, 0.5)).run()
+
+        assert len(result.hourly_data) == 8784
+        assert result.total_consumption == pytest.approx(sum(h.consumption for h in result.hourly_data), rel=1e-3)
+
+    def test_milp_solves_each_day_from_previous_state(self, monkeypatch):
+        """MILP is solved once per day, starting from the carried battery."""
+        config = make_config(hours=72, start_date=datetime.date(2024, 6, 1))
+        adapter = HybridSimulationAdapter(config, seed=3, mode='milp')
+        starts = []
+        original = adapter._engine.optimize_schedule
+
+        def spy(environments, initial_battery, dt_hours=1.0, spec=None):
+            starts.append((len(environments), initial_battery.charge_kwh))
+            return original(environments, initial_battery, dt_hours, spec)
+
+        monkeypatch.setattr(adapter._engine, 'optimize_schedule', spy)
+        result = adapter.generate_24h_data()
+
+        assert len(result.hourly_data) == 72
+        assert [n for n, _ in starts] == [24, 24, 24]
+        assert starts[1][1] == pytest.approx(result.hourly_data[23].battery_level, abs=0.01)
+        assert starts[2][1] == pytest.approx(result.hourly_data[47].battery_level, abs=0.01)
+
+
+class TestSimulateEndpoint:
+    """The API passes the horizon through."""
+
+    def test_simulate_two_days(self):
+        """POST /api/v1/simulate honors hours and start_date."""
+        from fastapi.testclient import TestClient
+        from app.main import app
+
+        response = TestClient(app).post('/api/v1/simulate', json={
+            'hours': 48, 'start_date': '2024-06-01', 'seed': 1
+        })
+
+        assert response.status_code == 200
+        assert len(response.json()['hourly_data']) == 48
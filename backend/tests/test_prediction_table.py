@@ -0,0 +1,152 @@
+"""
+Tests for the compiled prediction table.
+
+Tests verify:
+- Table lookups reproduce the predictors exactly
+- ModelManager serves from the table without loading .pkl models
+- Unknown weather/season default like the predictors; invalid dates are rejected
+"""
+import datetime
+
+import joblib
+import numpy as np
+import pytest
+
+from src.ai.solar_predictor import SolarPredictor
+from src.ai.consumption_predictor import ConsumptionPredictor
+from src.ai.model_manager import ModelManager
+from src.ai.prediction_table import (
+    PredictionTable, TabulatedConsumptionPredictor, TABLE_SHAPE, compile_prediction_table
+)
+
+
+@pytest.fixture
+def predictors(solar_model_path, consumption_model_path):
+    """Model-backed predictors."""
+    return SolarPredictor(solar_model_path), ConsumptionPredictor(consumption_model_path)
+
+
+@pytest.fixture
+def table_path(tmp_path, predictors):
+    """Compiled prediction table."""
+    solar, consumption = predictors
+    return compile_prediction_table(solar, consumption, tmp_path / "prediction_table.npy")
+
+
+class TestCompile:
+    """Compiled table must match the models it was built from."""
+
+    def test_table_shape_and_memory_map(self, table_path):
+        """Table is memory-mapped read-only with the full grid."""
+        table = PredictionTable(table_path)
+
+        assert table.data.shape == TABLE_SHAPE
+        assert isinstance(table.data, np.memmap)
+        assert not table.data.flags.writeable
+
+    @pytest.mark.parametrize("weather,season", [
+        ('sunny', 'summer'), ('partly_cloudy', 'summer'), ('rainy', 'winter'),
+    ])
+    def test_solar_matches_model(self, table_path, predictors, weather, season):
+        """Solar lookups equal model predictions."""
+        table = PredictionTable(table_path)
+        solar, _ = predictors
+
+        for day, month in [(1, 1), (15, 6), (31, 12)]:
+            np.testing.assert_array_equal(
+                table.lookup(range(24), day, month, weather, season)[:, 0],
+                solar.predict_batch(range(24), day, month, weather, season)
+            )
+
+    def test_consumption_matches_model(self, table_path, predictors):
+        """Consumption lookups equal model predictions, including non-dates."""
+        table = PredictionTable(table_path)
+        _, consumption = predictors
+
+        for day, month in [(1, 1), (29, 2), (30, 2), (31, 4), (15, 6)]:
+            np.testing.assert_array_equal(
+                table.lookup(range(24), day, month)[:, 1],
+                consumption.predict_batch(range(24), day, month)
+            )
+
+    def test_consumption_horizon_of_other_year(self, table_path, predictors):
+        """Weekdays of years other than the calendar year are looked up, not assumed."""
+        _, consumption = predictors
+        tabulated = TabulatedConsumptionPredictor(PredictionTable(table_path))
+        start, end = datetime.date(2025, 1, 1), datetime.date(2025, 12, 31)
+
+        np.testing.assert_array_equal(
+            tabulated.predict_horizon(start, end),
+            consumption.predict_horizon(start, end)
+        )
+        np.testing.assert_array_equal(
+            tabulated.predict_batch(range(24), 15, 6, dayofweek=6, weekend=1),
+            consumption.predict_batch(range(24), 15, 6, dayofweek=6, weekend=1)
+        )
+
+    def test_refuses_fallback_predictors(self, tmp_path):
+        """Fallback predictors are not compiled unless allowed."""
+        solar = SolarPredictor(tmp_path / "missing.pkl")
+        consumption = ConsumptionPredictor(tmp_path / "missing.pkl")
+
+        with pytest.raises(ValueError):
+            compile_prediction_table(solar, consumption, tmp_path / "table.npy")
+
+    def test_unknown_weather_and_season_match_model(self, table_path, predictors):
+        """Unrecognised weather and seasons are answered as the models answer them."""
+        table = PredictionTable(table_path)
+        solar, consumption = predictors
+
+        for weather, season in [('foggy', 'summer'), ('foggy', 'winter'), ('sunny', 'monsoon'),
+                                ('foggy', 'monsoon'), ('cloudy', 'spring')]:
+            np.testing.assert_array_equal(
+                table.lookup(range(24), 15, 6, weather, season)[:, 0],
+                solar.predict_batch(range(24), 15, 6, weather, season)
+            )
+            np.testing.assert_array_equal(
+                table.lookup(range(24), 15, 6, weather, season)[:, 1],
+                consumption.predict_batch(range(24), 15, 6, weather=weather, season=season)
+            )
+
+    def test_rejects_out_of_grid_inputs(self, table_path):
+        """Invalid dates and weekdays raise ValueError."""
+        table = PredictionTable(table_path)
+
+        with pytest.raises(ValueError):
+            table.lookup([12], 15, 6, dayofweek=7)
+        with pytest.raises(ValueError):
+            table.lookup([12], 32, 6)
+        with pytest.raises(ValueError):
+            table.lookup([24], 15, 6)
+
+
+class TestModelManagerTable:
+    """ModelManager must prefer the compiled table."""
+
+    def test_serves_from_table_without_models(self, table_path, predictors, monkeypatch):
+        """No joblib.load happens when a table is configured."""
+        monkeypatch.setenv('INTELLIGRID_PREDICTION_TABLE', str(table_path))
+
+        def no_load(*args, **kwargs):
+            raise AssertionError("joblib.load must not be called")
+
+        monkeypatch.setattr(joblib, 'load', no_load)
+        ModelManager.reset_instance()
+        try:
+            manager = ModelManager()
+            preds = manager.get_24h_predictions(day=15, month=6, weather='cloudy', season='summer')
+            status = manager.get_model_status()
+        finally:
+            ModelManager.reset_instance()
+
+        solar, consumption = predictors
+        np.testing.assert_array_equal(
+            [p['solar_kw'] for p in preds],
+            solar.predict_batch(range(24), 15, 6, 'cloudy', 'summer')
+        )
+        np.testing.assert_array_equal(
+            [p['consumption_kw'] for p in preds],
+            consumption.predict_batch(range(24), 15, 6)
+        )
+        assert status['table'] == str(table_path)
+        assert not status['solar']['using_fallback']
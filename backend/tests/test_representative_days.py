@@ -0,0 +1,109 @@
+"""
+Tests for representative-day selection.
+
+Tests verify:
+- k-medoids picks real days and finds well-separated clusters
+- Weights cover every day and estimates are weighted sums
+- Proxy errors are exact aggregation errors (zero when k = days)
+- Simulated estimates report errors against the full run
+"""
+import datetime
+
+import numpy as np
+import pytest
+
+from src.analysis.representative_days import (
+    daily_features, k_medoids, select_representative_days
+)
+from src.data.models import SimulationConfig, Season, Weather, DayType
+from src.data.simulator import EnergyDataSimulator
+
+
+@pytest.fixture(scope="module")
+def season_change():
+    """Sixty days across the summer/winter switch, with weather changes."""
+    path = tuple([Weather.SUNNY] * 20 + [Weather.RAINY] * 10 + [Weather.CLOUDY] * 30)
+    config = SimulationConfig(
+        season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY,
+        hours=24 * 60, start_date=datetime.date(2024, 9, 1), weather_path=path
+    )
+    return EnergyDataSimulator(config, seed=5, use_ai=False).generate_environment_arrays()
+
+
+class TestClustering:
+    """Medoid selection."""
+
+    def test_separated_clusters(self):
+        """Three tight groups are recovered with one medoid each."""
+        rng = np.random.default_rng(0)
+        centers = np.array([[0, 0], [10, 0], [0, 10]])
+        points = np.repeat(centers, 20, axis=0) + rng.normal(0, 0.1, (60, 2))
+        medoids, labels = k_medoids(points, 3, seed=1)
+
+        assert sorted(medoids // 20) == [0, 1, 2]
+        assert all(len(set(labels[i * 20:(i + 1) * 20])) == 1 for i in range(3))
+
+    def test_features_per_day(self, season_change):
+        """One feature row per whole day, three profiles wide."""
+        features = daily_features(season_change)
+
+        assert features.shape == (60, 72)
+
+
+class TestSelection:
+    """Weights and aggregation error."""
+
+    def test_weights_cover_every_day(self, season_change):
+        """Weights sum to the day count and match the labels."""
+        selection = select_representative_days(season_change, k=6)
+
+        assert selection.k == 6
+        assert selection.weights.sum() == 60
+        assert (np.diff(selection.days) > 0).all()
+        np.testing.assert_array_equal(selection.weights, np.bincount(selection.labels))
+        np.testing.assert_array_equal(selection.labels[selection.days], np.arange(6))
+
+    def test_estimate_and_proxy_errors(self, season_change):
+        """With k = days the estimate is exact; fewer days stay close."""
+        exact = select_representative_days(season_change, k=60)
+        coarse = select_representative_days(season_change, k=6)
+        solar = [float(day.solar_kwh.sum()) for day in exact.environments()]
+
+        assert exact.estimate(solar) == pytest.approx(season_change.solar_kwh.sum())
+        assert all(error == pytest.approx(0, abs=1e-12) for error in exact.proxy_errors().values())
+        assert all(abs(error) < 0.05 for error in coarse.proxy_errors().values())
+
+    def test_rejects_bad_input(self, season_change):
+        """k below 1 and horizons shorter than a day raise ValueError."""
+        with pytest.raises(ValueError):
+            select_representative_days(season_change, k=0)
+        config = SimulationConfig(season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY, hours=12)
+        with pytest.raises(ValueError):
+            select_representative_days(EnergyDataSimulator(config, seed=1, use_ai=False))
+
+
+class TestEvaluation:
+    """Yearly projections from simulated representative days."""
+
+    def test_rule_estimate_against_full_run(self, season_change):
+        """Errors are reported for every metric and stay moderate."""
+        estimate = select_representative_days(season_change, k=8).evaluate('rule', full=True)
+
+        assert set(estimate.errors) == set(estimate.totals)
+        assert estimate.per_day['cost'].shape == (8,)
+        assert abs(estimate.errors['grid_import']) < 0.15
+        assert abs(estimate.errors['consumption']) < 0.05
+
+    def test_full_totals_unrounded(self, season_change):
+        """Full-run totals are exact sums of the unrounded horizon."""
+        estimate = select_representative_days(season_change, k=4).evaluate('rule', full=True)
+
+        assert estimate.full_totals['solar'] == pytest.approx(float(season_change.solar_kwh.sum()), rel=1e-12)
+        assert estimate.full_totals['consumption'] == pytest.approx(float(season_change.load_kwh.sum()), rel=1e-12)
+
+    def test_milp_without_full_run(self, season_change):
+        """MILP estimates solve only the representative days."""
+        estimate = select_representative_days(season_change, k=3).evaluate('milp')
+
+        assert estimate.errors is None
+        assert estimate.totals['grid_import'] > 0
@@ -0,0 +1,128 @@
+"""
+Tests for sub-hourly timesteps (15- and 5-minute resolution).
+
+Tests verify:
+- Hourly runs are unchanged by the timestep support
+- Environment energies are power times the timestep length
+- Battery power limits scale with the timestep
+- Rule and MILP runs produce one result per timestep
+"""
+import numpy as np
+import pytest
+
+from src.data.models import SimulationConfig, Season, Weather, DayType
+from src.data.simulator import EnergyDataSimulator
+from src.core.battery import Battery
+from src.core.hybrid_adapter import HybridSimulationAdapter
+from src.engine.milp_engine import MILPDecisionEngine
+from src.utils.config import steps_per_hour
+
+
+def make_config(dt_hours=1.0, hours=24):
+    """Sunny summer weekday config."""
+    return SimulationConfig(
+        season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY,
+        hours=hours, dt_hours=dt_hours
+    )
+
+
+class TestTimestep:
+    """Timestep validation."""
+
+    @pytest.mark.parametrize("dt_hours,steps", [(1.0, 1), (0.25, 4), (1 / 12, 12)])
+    def test_steps_per_hour(self, dt_hours, steps):
+        """Timesteps dividing one hour are accepted."""
+        assert steps_per_hour(dt_hours) == steps
+
+    @pytest.mark.parametrize("dt_hours", [0.0, -1.0, 0.4, 2.0])
+    def test_rejects_uneven_timesteps(self, dt_hours):
+        """Timesteps that do not divide one hour raise ValueError."""
+        with pytest.raises(ValueError):
+            EnergyDataSimulator(make_config(dt_hours), seed=1, use_ai=False)
+
+
+class TestSubHourlyEnvironment:
+    """Environment generation at sub-hourly resolution."""
+
+    @pytest.mark.parametrize("dt_hours", [0.25, 1 / 12])
+    def test_step_count_and_hours(self, dt_hours):
+        """A day has 24 / dt steps, each labelled with its hour of day."""
+        env = EnergyDataSimulator(make_config(dt_hours), seed=1, use_ai=False).generate_environment_arrays()
+        per_hour = steps_per_hour(dt_hours)
+
+        assert len(env) == 24 * per_hour
+        assert env.dt_hours == dt_hours
+        np.testing.assert_array_equal(env.hour, np.repeat(np.arange(24), per_hour))
+
+    @pytest.mark.parametrize("dt_hours", [0.25, 1 / 12])
+    def test_energy_scales_with_timestep(self, dt_hours):
+        """Daily totals stay close to the hourly ones; per-step energy shrinks."""
+        hourly = EnergyDataSimulator(make_config(), seed=3, use_ai=False).generate_environment_arrays()
+        fine = EnergyDataSimulator(make_config(dt_hours), seed=3, use_ai=False).generate_environment_arrays()
+
+        assert fine.load_kwh.sum() == pytest.approx(hourly.load_kwh.sum(), rel=0.15)
+        assert fine.solar_kwh.sum() == pytest.approx(hourly.solar_kwh.sum(), rel=0.15)
+        assert fine.load_kwh.max() < hourly.load_kwh.max()
+
+    def test_prices_follow_hour(self):
+        """Every step in an hour has that hour's price."""
+        hourly = EnergyDataSimulator(make_config(), seed=1, use_ai=False).generate_environment_arrays()
+        fine = EnergyDataSimulator(make_config(0.25), seed=1, use_ai=False).generate_environment_arrays()
+
+        np.testing.assert_array_equal(fine.price, np.repeat(hourly.price, 4))
+
+    def test_streamed_multi_day(self):
+        """Streaming 15-minute data over three days matches one-shot generation."""
+        config = make_config(0.25, hours=72)
+        full = EnergyDataSimulator(config, seed=5, use_ai=False).generate_environment_arrays()
+        chunks = list(EnergyDataSimulator(config, seed=5, use_ai=False).iter_environment(chunk_hours=24))
+
+        assert [len(chunk) for chunk in chunks] == [96, 96, 96]
+        np.testing.assert_array_equal(np.concatenate([c.load_kwh for c in chunks]), full.load_kwh)
+
+
+class TestBatteryTimestep:
+    """Battery power limits per timestep."""
+
+    def test_charge_limited_by_power_times_dt(self):
+        """A 15-minute step stores at most MAX_CHARGE_RATE_KW / 4 of input."""
+        battery = Battery(13.5, initial_soc=0.2)
+
+        converted, stored = battery.charge(10.0, dt_hours=0.25)
+
+        assert converted == pytest.approx(Battery.MAX_CHARGE_RATE_KW * 0.25)
+        assert stored == pytest.approx(converted * Battery.CHARGE_EFFICIENCY)
+
+    def test_discharge_limited_by_power_times_dt(self):
+        """A 5-minute step draws at most MAX_DISCHARGE_RATE_KW / 12."""
+        battery = Battery(13.5, initial_soc=0.9)
+
+        drawn, _ = battery.discharge(10.0, dt_hours=1 / 12)
+
+        assert drawn == pytest.approx(Battery.MAX_DISCHARGE_RATE_KW / 12)
+
+
+class TestSubHourlyRuns:
+    """Rule and MILP simulations at sub-hourly resolution."""
+
+    @pytest.mark.parametrize("mode", ['rule', 'milp'])
+    def test_one_result_per_step(self, mode):
+        """15-minute runs return 96 steps within battery bounds."""
+        result = HybridSimulationAdapter(make_config(0.25), seed=42, mode=mode).generate_24h_data()
+
+        assert len(result.hourly_data) == 96
+        socs = [h.battery_soc for h in result.hourly_data]
+        assert min(socs) >= Battery.MIN_SOC - 0.01
+        assert max(socs) <= Battery.MAX_SOC + 0.01
+
+    def test_milp_respects_power_per_step(self):
+        """MILP battery moves at most rate * dt per 15-minute step."""
+        env = EnergyDataSimulator(make_config(0.25), seed=42, use_ai=False).generate_24h_environment()
+        battery = Battery(13.5, initial_soc=0.5)
+
+        details = MILPDecisionEngine().get_schedule_details(env, battery.state, dt_hours=0.25)
+
+        levels = [battery.state.charge_kwh] + [d['battery_charge'] for d in details]
+        max_step = max(Battery.MAX_CHARGE_RATE_KW, Battery.MAX_DISCHARGE_RATE_KW) * 0.25
+        assert len(details) == 96
+        assert np.abs(np.diff(levels)).max() <= max_step + 1e-6
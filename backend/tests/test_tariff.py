@@ -0,0 +1,131 @@
+"""
+Tests for tariffs compiled into price vectors.
+
+Tests verify:
+- The default time-of-use tariff matches get_price_for_hour
+- Seasonal and weekend schedules follow the calendar
+- Price series are memory-mapped and resampled to the timestep
+- The simulator and MILP read prices from the configured tariff
+"""
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.hybrid_adapter import HybridSimulationAdapter
+from src.data.models import SimulationConfig, Season, Weather, DayType
+from src.data.simulator import EnergyDataSimulator
+from src.data.tariff import PriceSeries, TimeOfUseTariff, convert_price_data, default_tariff
+from src.utils.config import PRICING, TOU_SCHEDULE, get_price_for_hour
+
+
+def make_config(**kwargs):
+    """Sunny summer weekday, overridable."""
+    return SimulationConfig(
+        season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY, **kwargs
+    )
+
+
+class TestTimeOfUse:
+    """Table-compiled time-of-use rates."""
+
+    def test_default_matches_scalar_lookup(self):
+        """Every hour of a multi-day hourly horizon matches get_price_for_hour."""
+        prices = default_tariff().price_vector(0, 72)
+
+        np.testing.assert_array_equal(prices, [get_price_for_hour(h % 24) for h in range(72)])
+
+    def test_sub_hourly_steps_keep_hour_rate(self):
+        """15-minute steps carry the rate of their hour, from any start step."""
+        prices = default_tariff().price_vector(70, 8, dt_hours=0.25)
+
+        np.testing.assert_array_equal(prices, [PRICING[TOU_SCHEDULE[(70 + i) // 4]] for i in range(8)])
+
+    def test_calendar_schedules(self):
+        """Weekends and winter months get their own rates."""
+        tariff = TimeOfUseTariff(
+            weekend_schedule=('normal',) * 24,
+            seasonal_rates={'winter': {'peak': 9.0}}
+        )
+        # Friday 2024-09-27, Saturday, Sunday, then Tuesday 2024-10-01
+        prices = tariff.price_vector(0, 24 * 5, start_date=datetime.date(2024, 9, 27)).reshape(5, 24)
+
+        assert prices[0, 19] == PRICING['peak']
+        assert (prices[1:3] == PRICING['normal']).all()
+        assert prices[4, 19] == 9.0
+        assert tariff.price_vector(19, 1, season='winter')[0] == 9.0
+        assert tariff.fingerprint != default_tariff().fingerprint
+
+    def test_rejects_bad_schedule(self):
+        """Short schedules and unknown periods raise ValueError."""
+        with pytest.raises(ValueError):
+            TimeOfUseTariff(schedule=('night',) * 23)
+        with pytest.raises(ValueError):
+            TimeOfUseTariff(schedule=('shoulder',) * 24)
+
+
+class TestPriceSeries:
+    """Dynamic prices from recorded series."""
+
+    @pytest.fixture
+    def hourly(self):
+        """Two days of hourly day-ahead prices starting 2024-06-01."""
+        return PriceSeries(np.arange(48, dtype=float), '2024-06-01', 1.0)
+
+    def test_aligned_slice(self, hourly):
+        """Same resolution gives the recorded prices at the start date."""
+        prices = hourly.price_vector(2, 24, start_date=datetime.date(2024, 6, 1))
+
+        np.testing.assert_array_equal(prices, np.arange(2, 26))
+        np.testing.assert_array_equal(hourly.price_vector(0, 3), [0, 1, 2])
+
+    def test_resampling(self, hourly):
+        """Finer steps repeat prices, coarser steps average them."""
+        fine = hourly.price_vector(0, 8, dt_hours=0.25, start_date=datetime.date(2024, 6, 2))
+        five_min = PriceSeries(np.arange(24, dtype=float), '2024-06-01', 1 / 12)
+
+        np.testing.assert_allclose(fine, [24] * 4 + [25] * 4)
+        np.testing.assert_allclose(five_min.price_vector(0, 2), [5.5, 17.5])
+
+    def test_outside_range(self, hourly):
+        """Steps outside the series use the fallback or raise ValueError."""
+        with_fallback = PriceSeries(hourly.prices, hourly.start, 1.0, fallback=default_tariff())
+        prices = with_fallback.price_vector(46, 4, start_date=datetime.date(2024, 6, 1))
+
+        np.testing.assert_array_equal(prices, [46, 47, get_price_for_hour(0), get_price_for_hour(1)])
+        with pytest.raises(ValueError):
+            hourly.price_vector(0, 24, start_date=datetime.date(2024, 7, 1))
+
+    def test_convert_and_load(self, tmp_path):
+        """Converted histories load memory-mapped with the same prices."""
+        times = pd.date_range('2024-01-01', periods=96, freq='15min')
+        values = np.linspace(3, 9, 96)
+        pd.DataFrame({'timestamp': times, 'price': values}).drop(index=[10]).to_csv(tmp_path / "rt.csv", index=False)
+        series = PriceSeries.load(convert_price_data(tmp_path / "rt.csv", tmp_path / "rt"))
+
+        assert isinstance(series.prices, np.memmap)
+        assert series.dt_hours == 0.25
+        assert series.start == datetime.datetime(2024, 1, 1)
+        np.testing.assert_allclose(series.price_vector(0, 96, dt_hours=0.25), values)
+
+
+class TestSimulatorIntegration:
+    """Configured tariffs reach the environment and the MILP."""
+
+    def test_simulator_uses_tariff(self):
+        """Environment prices come from config.tariff, batched and per hour."""
+        tariff = TimeOfUseTariff(rates={'night': 1.0, 'normal': 2.0, 'peak': 3.0})
+        simulator = EnergyDataSimulator(make_config(tariff=tariff), seed=1, use_ai=False)
+
+        np.testing.assert_array_equal(simulator.generate_environment_arrays(24).price, tariff.price_vector(0, 24))
+        assert simulator.generate_environment_for_hour(19).price == 3.0
+
+    def test_milp_follows_price_series(self):
+        """MILP cost is computed on the series prices."""
+        prices = np.tile(np.r_[np.full(12, 1.0), np.full(12, 20.0)], 2)
+        config = make_config(hours=48, start_date=datetime.date(2024, 6, 1),
+                             tariff=PriceSeries(prices, '2024-06-01', 1.0))
+        result = HybridSimulationAdapter(config, seed=2, mode='milp').generate_24h_data()
+
+        np.testing.assert_array_equal([h.grid_price for h in result.hourly_data], prices)
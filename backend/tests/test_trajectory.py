@@ -0,0 +1,95 @@
+"""
+Tests for the runner's preallocated trajectory buffers.
+
+Tests verify:
+- Trajectory arrays agree with the lazily built HourlyData
+- Totals are sums of the trajectory columns
+- Chunks concatenate across the horizon
+- Column views share memory; float32 archives round-trip
+"""
+import datetime
+
+import numpy as np
+import pytest
+
+from src.core.battery import Battery
+from src.core.simulation_runner import SimulationRunner
+from src.data.models import ACTIONS, DayType, Season, SimulationConfig, SimulationResult, Weather
+from src.data.simulator import EnergyDataSimulator
+from src.engine.decision_engine import DecisionEngine
+
+
+def run(hours=24, dt_hours=1.0):
+    config = SimulationConfig(
+        season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY,
+        hours=hours, start_date=datetime.date(2024, 6, 1), dt_hours=dt_hours
+    )
+    simulator = EnergyDataSimulator(config, seed=9, use_ai=False)
+    return SimulationRunner(simulator, DecisionEngine(), Battery(13.5)).run()
+
+
+class TestTrajectory:
+    """Columnar step outputs."""
+
+    def test_hourly_data_built_from_trajectory(self):
+        """HourlyData is the rounded view of the trajectory arrays."""
+        result = run()
+        trajectory = result.trajectory
+
+        assert result._hourly_data is None
+        hourly = result.hourly_data
+        assert len(hourly) == len(trajectory) == 24
+        assert [h.action for h in hourly] == [ACTIONS[code] for code in trajectory.action]
+        np.testing.assert_allclose([h.battery_level for h in hourly], trajectory.charge_kwh, atol=0.005)
+        np.testing.assert_allclose([h.cost for h in hourly], trajectory.cost, atol=0.0005)
+        assert result.hourly_data is hourly
+
+    def test_totals_and_physics(self):
+        """Totals sum the columns; SOC stays within the battery bounds."""
+        result = run(hours=72, dt_hours=0.25)
+        trajectory = result.trajectory
+
+        assert len(trajectory) == 72 * 4
+        assert result.total_cost == pytest.approx(trajectory.cost.sum())
+        assert result.total_grid_usage == pytest.approx(trajectory.grid_import.sum())
+        assert result.total_solar == pytest.approx(trajectory.solar_kwh.sum())
+        assert (trajectory.soc >= Battery.MIN_SOC - 1e-9).all()
+        assert (trajectory.soc <= Battery.MAX_SOC + 1e-9).all()
+        np.testing.assert_array_equal(trajectory.soc, trajectory.charge_kwh / 13.5)
+
+
+class TestColumnarResult:
+    """Column views and float32 archives."""
+
+    def test_views_share_trajectory_arrays(self):
+        """to_dict and to_dataframe do not copy stored columns."""
+        result = run()
+        columns = result.to_dict()
+        frame = result.to_dataframe()
+
+        assert columns['cost'] is result.trajectory.cost
+        assert np.shares_memory(frame['battery_soc'].to_numpy(), result.trajectory.soc)
+        assert list(columns) == list(vars(result.hourly_data[0]))
+        assert columns['action'][0] == result.hourly_data[0].action.value
+
+    def test_hourly_backed_result(self):
+        """Results built from HourlyData convert to the same columns."""
+        result = run()
+        rebuilt = SimulationResult(total_cost=result.total_cost)
+        rebuilt.hourly_data.extend(result.hourly_data)
+
+        np.testing.assert_allclose(rebuilt.to_dict()['battery_level'], result.to_dict()['battery_level'], atol=0.005)
+        np.testing.assert_array_equal(rebuilt.to_dict()['action'], result.to_dict()['action'])
+
+    def test_float32_archive_round_trip(self, tmp_path):
+        """save() stores float32 columns; load() memory-maps them back."""
+        result = run(hours=48)
+        result.save(tmp_path / "run")
+        loaded = SimulationResult.load(tmp_path / "run")
+
+        assert loaded.trajectory.cost.dtype == np.float32
+        assert isinstance(loaded.trajectory.soc, np.memmap)
+        assert loaded.total_cost == result.total_cost and loaded.seed == result.seed
+        np.testing.assert_allclose(loaded.trajectory.cost, result.trajectory.cost, rtol=1e-6)
+        np.testing.assert_array_equal(loaded.trajectory.action, result.trajectory.action)
+        assert len(loaded.hourly_data) == 48
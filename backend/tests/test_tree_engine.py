@@ -0,0 +1,121 @@
+"""
+Tests for the flattened tree engine.
+
+Tests verify:
+- Flattened ensembles reproduce sklearn predictions
+- Unsupported models are rejected
+- Predictors use the engine when their model can be flattened
+"""
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import (
+    RandomForestRegressor, ExtraTreesRegressor, GradientBoostingRegressor
+)
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+
+from src.ai.tree_engine import FlatTreeEnsemble, flatten_model
+from src.ai.solar_predictor import SolarPredictor
+from src.ai.consumption_predictor import ConsumptionPredictor, calendar_features
+
+
+@pytest.fixture
+def training_data():
+    """Random regression data with mixed feature scales."""
+    rng = np.random.default_rng(7)
+    X = np.column_stack([
+        rng.integers(0, 24, 400),
+        rng.integers(1, 32, 400),
+        rng.uniform(-5.0, 40.0, 400),
+    ])
+    y = np.sin(X[:, 0] / 4) * X[:, 2] + 0.1 * X[:, 1]
+    return X, y
+
+
+class TestFlatTreeEnsemble:
+    """Flattened predictions must equal sklearn's."""
+
+    @pytest.mark.parametrize("estimator", [
+        DecisionTreeRegressor(max_depth=8, random_state=0),
+        RandomForestRegressor(n_estimators=20, max_depth=6, random_state=0),
+        ExtraTreesRegressor(n_estimators=20, random_state=0),
+        GradientBoostingRegressor(n_estimators=30, learning_rate=0.2, random_state=0),
+        GradientBoostingRegressor(n_estimators=10, init='zero', random_state=0),
+    ])
+    def test_matches_sklearn(self, training_data, estimator):
+        """Predictions match model.predict on unseen rows."""
+        X, y = training_data
+        model = estimator.fit(X, y)
+        X_test = np.random.default_rng(8).uniform([0, 1, -10], [24, 32, 45], (1000, 3))
+
+        engine = FlatTreeEnsemble.from_estimator(model)
+
+        np.testing.assert_allclose(engine.predict(X_test), model.predict(X_test), rtol=1e-12, atol=1e-12)
+
+    def test_chunked_prediction(self, training_data, monkeypatch):
+        """Batches larger than one chunk give the same result."""
+        X, y = training_data
+        model = RandomForestRegressor(n_estimators=5, random_state=0).fit(X, y)
+        engine = FlatTreeEnsemble.from_estimator(model)
+        monkeypatch.setattr(engine, 'CHUNK_ROWS', 64)
+
+        np.testing.assert_allclose(engine.predict(X), model.predict(X), rtol=1e-12, atol=1e-12)
+
+    def test_rejects_unsupported_model(self, training_data):
+        """Non-tree models raise TypeError; flatten_model returns None."""
+        X, y = training_data
+        model = LinearRegression().fit(X, y)
+
+        with pytest.raises(TypeError):
+            FlatTreeEnsemble.from_estimator(model)
+        assert flatten_model(model, ['a', 'b', 'c']) is None
+
+    def test_rejects_feature_order_mismatch(self, training_data):
+        """Models trained on differently ordered columns are not flattened."""
+        X, y = training_data
+        model = DecisionTreeRegressor(random_state=0).fit(pd.DataFrame(X, columns=['b', 'a', 'c']), y)
+
+        assert flatten_model(model, ['a', 'b', 'c']) is None
+        assert flatten_model(model, ['b', 'a', 'c']) is not None
+
+
+class TestPredictorEngine:
+    """Predictors must use the engine and agree with sklearn."""
+
+    def test_solar_uses_engine(self, solar_model_path):
+        """Solar batches from the engine equal the sklearn path."""
+        predictor = SolarPredictor(solar_model_path)
+        assert predictor.engine is not None
+
+        flat = predictor.predict_batch(range(24), 15, 6, 'cloudy', 'summer')
+        predictor.engine = None
+        reference = predictor.predict_batch(range(24), 15, 6, 'cloudy', 'summer')
+
+        np.testing.assert_allclose(flat, reference)
+
+    def test_consumption_uses_engine(self, consumption_model_path):
+        """Consumption features from the engine equal the sklearn path."""
+        predictor = ConsumptionPredictor(consumption_model_path)
+        assert predictor.engine is not None
+        features = calendar_features(datetime.date(2024, 1, 1), datetime.date(2024, 1, 14))
+
+        flat = predictor._predict_features(features, 'sunny', 'winter')
+        predictor.engine = None
+        reference = predictor._predict_features(features, 'sunny', 'winter')
+
+        np.testing.assert_allclose(flat, reference)
+
+    def test_large_batches_use_sklearn(self, consumption_model_path):
+        """Horizons above SMALL_BATCH_ROWS are left to the model."""
+        predictor = ConsumptionPredictor(consumption_model_path)
+        features = calendar_features(datetime.date(2024, 1, 1), datetime.date(2024, 12, 31))
+        assert len(features) > predictor.engine.SMALL_BATCH_ROWS
+
+        def fail(X):
+            raise AssertionError("engine must not be used for large batches")
+
+        predictor.engine.predict = fail
+        assert predictor._predict_features(features, 'sunny', 'winter').shape == (len(features),)
@@ -0,0 +1,60 @@
+"""
+Tests for startup warm-up and readiness.
+
+Tests verify:
+- Readiness is false until warm-up completes
+- Warm-up records load, inference and MILP timings
+- /ready returns 503 before and 200 after warm-up
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.warmup import WarmupService
+
+
+@pytest.fixture(autouse=True)
+def reset_warmup():
+    """Start every test with no warm-up done."""
+    WarmupService.reset()
+    yield
+    WarmupService.reset()
+
+
+class TestWarmupService:
+    """Warm-up must load models and time each step."""
+
+    def test_not_ready_before_run(self):
+        """Service is not ready until run() completes."""
+        assert not WarmupService.is_ready()
+
+    def test_run_records_timings(self):
+        """run() marks ready and records step timings."""
+        timings = WarmupService.run()
+
+        assert WarmupService.is_ready()
+        assert set(timings) == {'model_load', 'inference', 'milp_solve', 'total'}
+        assert all(seconds >= 0 for seconds in timings.values())
+        assert WarmupService.status()['error'] is None
+
+    def test_run_is_idempotent(self):
+        """A second run() returns the recorded timings without rerunning."""
+        first = WarmupService.run()
+
+        assert WarmupService.run() == first
+
+
+class TestReadyEndpoint:
+    """/ready must hold traffic until warm-up finishes."""
+
+    def test_ready_status_codes(self):
+        """503 while warming up, 200 once done."""
+        client = TestClient(app)  # No lifespan: warm-up is driven manually
+
+        assert client.get("/ready").status_code == 503
+
+        WarmupService.run()
+        response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()['status'] == 'ready'
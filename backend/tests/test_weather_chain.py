@@ -0,0 +1,154 @@
+"""
+Tests for Markov-chain daily weather paths.
+
+Tests verify:
+- Transition matrices are validated and stationary shares sum to 1
+- Sampled paths are reproducible and independent of the batch size
+- Empirical transitions follow the seasonal matrices
+- The simulator applies each day's weather from weather_path
+- The API rejects paths shorter than the horizon (422)
+- Ensembles sample one weather path per member
+"""
+import datetime
+
+import numpy as np
+import pytest
+
+from src.core.ensemble import EnsembleRunner
+from src.data.models import SimulationConfig, Season, Weather, DayType
+from src.data.simulator import EnergyDataSimulator
+from src.data.weather_chain import (
+    WeatherMarkovChain, ghi, state_index, to_weather, weather_multipliers
+)
+from src.utils.config import WEATHER_MULTIPLIERS, WEATHER_STATES, WEATHER_TRANSITIONS
+
+
+@pytest.fixture
+def chain():
+    """Chain with the default seasonal matrices."""
+    return WeatherMarkovChain()
+
+
+class TestChain:
+    """Matrices and sampling."""
+
+    def test_rejects_invalid_matrices(self):
+        """Rows must sum to 1 and the matrix must be 4x4."""
+        with pytest.raises(ValueError):
+            WeatherMarkovChain({'summer': np.full((4, 4), 0.3)})
+        with pytest.raises(ValueError):
+            WeatherMarkovChain({'summer': np.eye(3)})
+
+    def test_stationary_distribution(self, chain):
+        """Stationary shares sum to 1 and are fixed by the matrix."""
+        for season, matrix in WEATHER_TRANSITIONS.items():
+            pi = chain.stationary(season)
+
+            assert pi.sum() == pytest.approx(1.0)
+            np.testing.assert_allclose(pi @ np.asarray(matrix), pi, atol=1e-12)
+
+    def test_shape_and_reproducibility(self, chain):
+        """Same seed, same paths; a path does not depend on n_paths."""
+        paths = chain.sample(200, 30, 'winter', seed=3)
+
+        assert paths.shape == (200, 30)
+        assert paths.dtype == np.int8
+        np.testing.assert_array_equal(paths, chain.sample(200, 30, 'winter', seed=3))
+        np.testing.assert_array_equal(paths[:5], chain.sample(5, 30, 'winter', seed=3))
+        assert not np.array_equal(paths, chain.sample(200, 30, 'winter', seed=4))
+
+    def test_empirical_transitions(self, chain):
+        """Transition frequencies over many scenario-days match the matrix."""
+        paths = chain.sample(5000, 60, 'summer', seed=1).astype(int)
+        counts = np.zeros((4, 4))
+        np.add.at(counts, (paths[:, :-1].ravel(), paths[:, 1:].ravel()), 1)
+
+        np.testing.assert_allclose(
+            counts / counts.sum(axis=1, keepdims=True), WEATHER_TRANSITIONS['summer'], atol=0.02
+        )
+
+    def test_initial_state_and_seasons(self, chain):
+        """Day 0 follows initial; each day uses its own season's matrix."""
+        paths = chain.sample(100, 3, ['summer', 'winter', 'winter'], initial=Weather.RAINY, seed=0)
+        per_path = chain.sample(2, 2, 'summer', initial=['sunny', 'cloudy'], seed=0)
+
+        assert (paths[:, 0] == state_index('rainy')).all()
+        np.testing.assert_array_equal(per_path[:, 0], [0, 2])
+        with pytest.raises(ValueError):
+            chain.sample(1, 3, ['summer', 'winter'])
+
+
+class TestLookups:
+    """Vectorized state lookups."""
+
+    def test_weather_and_multipliers(self):
+        """Indices map to Weather values, multipliers and GHI."""
+        states = np.array([[0, 3], [1, 2]])
+
+        assert to_weather(states) == [[Weather.SUNNY, Weather.RAINY], [Weather.PARTLY_CLOUDY, Weather.CLOUDY]]
+        np.testing.assert_allclose(weather_multipliers(states)[0], [WEATHER_MULTIPLIERS['sunny'], WEATHER_MULTIPLIERS['rainy']])
+        assert ghi(states).shape == (2, 2)
+        assert ghi([0])[0] > ghi([3])[0]
+        assert [state_index(name) for name in WEATHER_STATES] == [0, 1, 2, 3]
+
+
+class TestSimulatorIntegration:
+    """weather_path drives per-day solar."""
+
+    def make_config(self, path, hours=48):
+        """Summer config starting sunny."""
+        return SimulationConfig(
+            season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY,
+            hours=hours, weather_path=path
+        )
+
+    def test_rainy_day_produces_less(self):
+        """Day 2 rainy produces less solar than day 2 sunny, day 1 unchanged."""
+        sunny = EnergyDataSimulator(self.make_config((Weather.SUNNY, Weather.SUNNY)), seed=5, use_ai=False)
+        rainy = EnergyDataSimulator(self.make_config((Weather.SUNNY, Weather.RAINY)), seed=5, use_ai=False)
+        a = sunny.generate_environment_arrays(48).solar_kwh
+        b = rainy.generate_environment_arrays(48).solar_kwh
+
+        np.testing.assert_array_equal(a[:24], b[:24])
+        assert b[24:].sum() < 0.5 * a[24:].sum()
+
+    def test_short_path_rejected(self):
+        """A path shorter than the horizon raises ValueError."""
+        with pytest.raises(ValueError):
+            EnergyDataSimulator(self.make_config((Weather.SUNNY,), hours=25), seed=1, use_ai=False)
+
+
+class TestSimulateEndpoint:
+    """The API validates weather_path against the horizon."""
+
+    def test_short_path_is_client_error(self):
+        """A weather_path shorter than the horizon gets 422, not 500."""
+        from fastapi.testclient import TestClient
+        from app.main import app
+
+        client = TestClient(app)
+        short = client.post('/api/v1/simulate', json={'hours': 48, 'weather_path': ['sunny']})
+        covered = client.post('/api/v1/simulate', json={'hours': 48, 'weather_path': ['sunny', 'rainy'], 'seed': 1})
+
+        assert short.status_code == 422
+        assert covered.status_code == 200
+        assert len(covered.json()['hourly_data']) == 48
+
+
+class TestEnsembleIntegration:
+    """One weather path per ensemble member."""
+
+    def test_members_get_own_paths(self, chain):
+        """Paths start from config.weather, differ across members, reproduce across workers."""
+        config = SimulationConfig(
+            season=Season.SUMMER, weather=Weather.SUNNY, day_type=DayType.WEEKDAY,
+            hours=72, start_date=datetime.date(2024, 9, 28)
+        )
+        serial = EnsembleRunner(config, workers=1, weather_chain=chain).run(12, seed=4)
+        pooled = EnsembleRunner(config, workers=3, weather_chain=chain).run(12, seed=4)
+
+        assert serial.weather.shape == (12, 3)
+        assert (serial.weather[:, 0] == 0).all()
+        assert len({tuple(path) for path in serial.weather}) > 1
+        np.testing.assert_array_equal(serial.weather, pooled.weather)
+        np.testing.assert_array_equal(serial.cost, pooled.cost)